@@ -1,3 +1,12 @@
-from .geodesic import Geodesic, Nulllike, Timelike
+from .analytic import AnalyticGeodesic
+from .geodesic import BatchGeodesic, Geodesic, Nulllike, Timelike
+from .parallel import run_batch
 
-__all__ = ["Geodesic", "Nulllike", "Timelike"]
+__all__ = [
+    "AnalyticGeodesic",
+    "BatchGeodesic",
+    "Geodesic",
+    "Nulllike",
+    "Timelike",
+    "run_batch",
+]
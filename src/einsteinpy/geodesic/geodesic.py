@@ -2,9 +2,67 @@ import warnings
 
 import numpy as np
 
-from einsteinpy.integrators import GeodesicIntegrator
+from einsteinpy.integrators import (
+    BatchGeodesicIntegrator,
+    DenseOutput,
+    GeodesicIntegrator,
+    MemmapSink,
+    autotune,
+    load_trajectory,
+)
+from einsteinpy.integrators.fantasy_jit import (
+    _kn_constraint,
+    _kn_integrate,
+    _kn_integrate_batch,
+    _record_dt,
+)
+from einsteinpy.integrators.mino import _mino_integrate, _mino_integrate_batch
+from einsteinpy.integrators.utils import (
+    _composition_weights,
+    _constraint_summary,
+    _merge_constraint_summaries,
+    _warn_constraint,
+)
 
-from .utils import _P, _kerr, _kerrnewman, _sch
+from .analytic import AnalyticGeodesic
+from .utils import (
+    _METRICS,
+    _P,
+    _SPIN_CHARGE,
+    _TERMINATION_REASONS,
+    _metric_function,
+    _outer_horizon,
+    _termination,
+)
+
+# Integration settings, that are part of checkpoints
+_CHECKPOINT_SETTINGS = (
+    "steps",
+    "delta",
+    "rtol",
+    "atol",
+    "order",
+    "scheme",
+    "omega",
+    "suppress_warnings",
+    "adaptive",
+    "adaptive_tol",
+    "delta_min",
+    "delta_max",
+    "record_every",
+    "record_dt",
+    "dense_output",
+    "constraint_check",
+    "check_every",
+    "equatorial",
+)
+
+# Outer event horizon, in M-Units
+_OUTER_HORIZONS = {
+    "Schwarzschild": lambda *prms: 2.0,
+    "Kerr": lambda a, *prms: 1 + np.sqrt(1 - a ** 2),
+    "KerrNewman": lambda a, Q, *prms: 1 + np.sqrt(1 - a ** 2 - Q ** 2),
+}
 
 
 class Geodesic:
@@ -15,6 +73,8 @@ class Geodesic:
 
     """
 
+    _integrator = GeodesicIntegrator
+
     def __init__(
         self,
         metric,
@@ -30,14 +90,19 @@ class Geodesic:
 
         Parameters
         ----------
-        metric : str
+        metric : str or callable or ~einsteinpy.metric.BaseMetric
             Name of the metric. Currently, these metrics are supported:
             1. Schwarzschild
             2. Kerr
             3. KerrNewman
+            Alternatively, a function of ``(x_vec, *metric_params)``,
+            returning the Contravariant Metric Tensor in M-Units, with
+            signature ``(-, +, +, +)``, in coordinates ``(t, r, theta, phi)``,
+            or a metric object, e.g. ``einsteinpy.metric.Kerr``
         metric_params : array_like
             Tuple of parameters to pass to the metric
             E.g., ``(a,)`` for Kerr
+            Ignored for metric objects, whose parameters are used instead
         position : array_like
             3-Position
             4-Position is initialized by taking ``t = 0.0``
@@ -76,6 +141,11 @@ class Geodesic:
         order : int
             Integration Order
             Defaults to ``2``
+        scheme : str
+            Composition of Order 2 steps, used for orders 6 and 8
+            One of ``"triple_jump"``, ``"yoshida"`` or ``"kahan_li"``
+            See ``einsteinpy.integrators.GeodesicIntegrator`` for details
+            Defaults to ``"triple_jump"``
         omega : float
             Coupling between Hamiltonian Flows
             Smaller values imply smaller integration error, but too
@@ -89,29 +159,111 @@ class Geodesic:
             Warnings are shown for every step, where numerical errors
             exceed specified tolerance (controlled by ``rtol`` and ``atol``)
             Defaults to ``False``
+        constraint_check : str
+            ``"step"`` checks the Hamiltonian constraint after every
+            ``check_every``-th step, and warns for each step, that exceeds
+            tolerance. ``"deferred"`` checks all stored steps at once, after
+            integration, and issues a single warning. The violation is then
+            available as ``constraint_violation``, with ``constraint_summary``
+            Defaults to ``"step"``
+        check_every : int
+            Number of steps between checks, with ``constraint_check="step"``
+            Defaults to ``1``
+        backend : str
+            Integration backend, ``"python"``, ``"numba"``, ``"analytic"`` or ``"mino"``
+            ``"numba"`` runs a compiled integration loop, and is
+            only available for the Schwarzschild, Kerr and KerrNewman metrics
+            Falls back to (slow) pure Python execution, if ``numba``
+            is not installed
+            ``"analytic"`` evaluates the closed-form solution of bound,
+            Time-like geodesics in these metrics, at each step, without
+            integration error. See ``einsteinpy.geodesic.AnalyticGeodesic``
+            ``"mino"`` integrates the decoupled radial and polar equations
+            of these metrics in Mino time, with energy, angular momentum
+            and Carter constant conserved exactly
+            Defaults to ``"python"``
+        adaptive : bool
+            Whether to adapt the step-size, so that the local error
+            over each step, estimated by step doubling, stays within ``adaptive_tol``
+            Only available with the ``"python"`` backend
+            Defaults to ``False``
+        adaptive_tol : float
+            Tolerance on the (relative) local error per step
+            Defaults to ``1e-6``
+        delta_min : float
+            Lower bound on the adapted step-size
+            Defaults to ``1e-3 * delta``
+        delta_max : float
+            Upper bound on the adapted step-size
+            Defaults to ``10 * delta``
+        horizon : bool or float or ~einsteinpy.metric.BaseMetric
+            Whether to stop integration, once the outer event horizon is crossed
+            ``True`` uses the outer horizon of ``metric``, a float
+            specifies the radius, and a metric object uses the
+            ``"outer_horizon"`` from its ``singularities()``
+            Defaults to ``False``
+        r_escape : float
+            Radius, at which escaping geodesics are stopped
+            Defaults to ``None``
+        max_affine : float
+            Maximum value of the affine parameter
+            Defaults to ``None``
+        stop_condition : callable
+            Function of ``(q, p)``, the Shape-(..., 4) 4-Positions and
+            4-Momenta in Spherical Polar / Boyer-Lindquist Coordinates,
+            returning ``True``, where integration is to be stopped
+            Defaults to ``None``
+        out : str or os.PathLike
+            Path to a ``.npy`` file, into which the trajectory is written,
+            through a growable ``numpy.memmap``, with a JSON metadata sidecar
+            The trajectory is then returned as a read-only, file-backed array,
+            in Spherical Polar Coordinates, unless ``return_cartesian`` is set
+            See ``einsteinpy.integrators.load_trajectory`` to reopen it
+            Defaults to ``None``
+        record_every : int
+            Only every ``record_every``-th step is stored and returned,
+            so that memory usage and coordinate conversion scale
+            with the number of output samples, instead of steps
+            Defaults to ``1``
+        record_dt : float
+            Minimum coordinate time between stored steps
+            Termination events are evaluated on every step with the
+            ``"python"`` backend, and on stored steps otherwise
+            Defaults to ``None``
+        dense_output : bool
+            Whether to build a ``DenseOutput``, available as ``dense_output``,
+            that interpolates the stored steps, so that the trajectory can be
+            evaluated at arbitrary affine parameter or coordinate time
+            Defaults to ``False``
+        equatorial : bool
+            Whether to integrate only ``(t, r, phi)``, and their momenta, for
+            geodesics in the equatorial plane, with ``theta = pi / 2`` and
+            ``p_theta = 0``, initially. The metric must be reflection-symmetric
+            about that plane. Metric derivatives w.r.t. ``theta`` are skipped,
+            and for built-in metrics, only those w.r.t. ``r`` are computed
+            Only available with the ``"python"`` backend
+            Defaults to ``False``
+        autotune : float
+            Tolerance on the drift of the Hamiltonian constraint, for which
+            ``order``, ``delta`` and ``omega`` are chosen from short pilot
+            integrations, overriding any supplied values. ``steps`` is kept.
+            Pilots run on ``backend``, with the supplied ``scheme``, and, for
+            the ``"python"`` backend, ``equatorial`` and adaptive settings
+            Choices are cached for later geodesics of the same orbit class
+            See ``einsteinpy.integrators.autotune`` and ``tuned_settings``
+            Only available with the ``"python"`` and ``"numba"`` backends
+            Defaults to ``None``
 
         """
-        # Contravariant Metrics, defined so far
-        _METRICS = {
-            "Schwarzschild": _sch,
-            "Kerr": _kerr,
-            "KerrNewman": _kerrnewman,
-        }
-
-        if metric not in _METRICS:
-            raise NotImplementedError(
-                f"'{metric}' is unsupported. Currently, these metrics are supported:\
-                \n1. Schwarzschild\n2. Kerr\n3. KerrNewman"
-            )
-
-        self.metric_name = metric
-        self.metric = _METRICS[metric]
-        self.metric_params = metric_params
-        if metric == "Schwarzschild":
-            self.metric_params = (0.0,)
-        self.position = np.array([0.0, *position])
+        self.metric_name, self.metric, self.metric_params = _metric_function(
+            metric, metric_params
+        )
+        # Compiled kernels, horizons and checkpoints need a closed-form metric
+        self._closed_form = self.metric is _METRICS.get(self.metric_name)
+        self._metric_object = metric if hasattr(metric, "singularities") else None
+        self.position = np.insert(np.asarray(position, dtype=float), 0, 0.0, axis=-1)
         self.momentum = _P(
-            self.metric, metric_params, self.position, momentum, time_like
+            self.metric, self.metric_params, self.position, momentum, time_like
         )
         self.time_like = time_like
 
@@ -144,6 +296,62 @@ class Geodesic:
         """
         return self._trajectory
 
+    @property
+    def step_sizes(self):
+        """
+        Returns the affine parameter step-size, used for each step
+
+        """
+        return self._step_sizes
+
+    @property
+    def constraint_violation(self):
+        """
+        Returns the violation of the Hamiltonian constraint,
+        :math:`g^{\\mu \\nu} p_{\\mu} p_{\\nu} - const`, for each step,
+        if it was checked with ``constraint_check="deferred"``, or ``None``
+
+        """
+        return self._constraint[0]
+
+    @property
+    def constraint_summary(self):
+        """
+        Returns summary statistics of ``constraint_violation``, or ``None``
+        See ``einsteinpy.integrators.GeodesicIntegrator.check_constraint``
+
+        """
+        return self._constraint[1]
+
+    @property
+    def dense_output(self):
+        """
+        Returns the dense output of the trajectory, or ``None``,
+        if it was not requested with ``dense_output=True``
+        See ``einsteinpy.integrators.DenseOutput`` for details
+
+        """
+        return self._dense_output
+
+    @property
+    def tuned_settings(self):
+        """
+        Returns the settings, chosen with ``autotune``, or ``None``
+        See ``einsteinpy.integrators.autotune`` for details
+
+        """
+        return self._tuned
+
+    @property
+    def termination_reason(self):
+        """
+        Returns the reason, integration was stopped
+        One of ``"steps"``, ``"horizon"``, ``"escape"``,
+        ``"affine"`` or ``"condition"``
+
+        """
+        return self._termination_reason
+
     def calculate_trajectory(self, **kwargs):
         """
         Calculate trajectory in spacetime
@@ -161,6 +369,8 @@ class Geodesic:
         ~numpy.ndarray
             Shape-(N, 8) numpy array, containing
             (4-Position, 4-Momentum) for each step
+            If a termination event occurs, the trajectory
+            ends with the first step, at which it occurred
 
         Other Parameters
         ----------------
@@ -179,6 +389,11 @@ class Geodesic:
         order : int
             Integration Order
             Defaults to ``2``
+        scheme : str
+            Composition of Order 2 steps, used for orders 6 and 8
+            One of ``"triple_jump"``, ``"yoshida"`` or ``"kahan_li"``
+            See ``einsteinpy.integrators.GeodesicIntegrator`` for details
+            Defaults to ``"triple_jump"``
         omega : float
             Coupling between Hamiltonian Flows
             Smaller values imply smaller integration error, but too
@@ -192,62 +407,1048 @@ class Geodesic:
             Warnings are shown for every step, where numerical errors
             exceed specified tolerance (controlled by ``rtol`` and ``atol``)
             Defaults to ``False``
+        constraint_check : str
+            ``"step"`` checks the Hamiltonian constraint after every
+            ``check_every``-th step, and warns for each step, that exceeds
+            tolerance. ``"deferred"`` checks all stored steps at once, after
+            integration, and issues a single warning. The violation is then
+            available as ``constraint_violation``, with ``constraint_summary``
+            Defaults to ``"step"``
+        check_every : int
+            Number of steps between checks, with ``constraint_check="step"``
+            Defaults to ``1``
+        backend : str
+            Integration backend, ``"python"``, ``"numba"``, ``"analytic"`` or ``"mino"``
+            ``"numba"`` runs a compiled integration loop, and is
+            only available for the Schwarzschild, Kerr and KerrNewman metrics
+            Falls back to (slow) pure Python execution, if ``numba``
+            is not installed
+            ``"analytic"`` evaluates the closed-form solution of bound,
+            Time-like geodesics in these metrics, at each step, without
+            integration error. See ``einsteinpy.geodesic.AnalyticGeodesic``
+            ``"mino"`` integrates the decoupled radial and polar equations
+            of these metrics in Mino time, with energy, angular momentum
+            and Carter constant conserved exactly
+            Defaults to ``"python"``
+        adaptive : bool
+            Whether to adapt the step-size, so that the local error
+            over each step, estimated by step doubling, stays within ``adaptive_tol``
+            Only available with the ``"python"`` backend
+            Defaults to ``False``
+        adaptive_tol : float
+            Tolerance on the (relative) local error per step
+            Defaults to ``1e-6``
+        delta_min : float
+            Lower bound on the adapted step-size
+            Defaults to ``1e-3 * delta``
+        delta_max : float
+            Upper bound on the adapted step-size
+            Defaults to ``10 * delta``
+        horizon : bool or float or ~einsteinpy.metric.BaseMetric
+            Whether to stop integration, once the outer event horizon is crossed
+            ``True`` uses the outer horizon of ``metric``, a float
+            specifies the radius, and a metric object uses the
+            ``"outer_horizon"`` from its ``singularities()``
+            Defaults to ``False``
+        r_escape : float
+            Radius, at which escaping geodesics are stopped
+            Defaults to ``None``
+        max_affine : float
+            Maximum value of the affine parameter
+            Defaults to ``None``
+        stop_condition : callable
+            Function of ``(q, p)``, the Shape-(..., 4) 4-Positions and
+            4-Momenta in Spherical Polar / Boyer-Lindquist Coordinates,
+            returning ``True``, where integration is to be stopped
+            Defaults to ``None``
+        out : str or os.PathLike
+            Path to a ``.npy`` file, into which the trajectory is written,
+            through a growable ``numpy.memmap``, with a JSON metadata sidecar
+            The trajectory is then returned as a read-only, file-backed array,
+            in Spherical Polar Coordinates, unless ``return_cartesian`` is set
+            See ``einsteinpy.integrators.load_trajectory`` to reopen it
+            Defaults to ``None``
+        record_every : int
+            Only every ``record_every``-th step is stored and returned,
+            so that memory usage and coordinate conversion scale
+            with the number of output samples, instead of steps
+            Defaults to ``1``
+        record_dt : float
+            Minimum coordinate time between stored steps
+            Termination events are evaluated on every step with the
+            ``"python"`` backend, and on stored steps otherwise
+            Defaults to ``None``
+        dense_output : bool
+            Whether to build a ``DenseOutput``, available as ``dense_output``,
+            that interpolates the stored steps, so that the trajectory can be
+            evaluated at arbitrary affine parameter or coordinate time
+            Defaults to ``False``
+        equatorial : bool
+            Whether to integrate only ``(t, r, phi)``, and their momenta, for
+            geodesics in the equatorial plane, with ``theta = pi / 2`` and
+            ``p_theta = 0``, initially. The metric must be reflection-symmetric
+            about that plane. Metric derivatives w.r.t. ``theta`` are skipped,
+            and for built-in metrics, only those w.r.t. ``r`` are computed
+            Only available with the ``"python"`` backend
+            Defaults to ``False``
+        autotune : float
+            Tolerance on the drift of the Hamiltonian constraint, for which
+            ``order``, ``delta`` and ``omega`` are chosen from short pilot
+            integrations, overriding any supplied values. ``steps`` is kept.
+            Pilots run on ``backend``, with the supplied ``scheme``, and, for
+            the ``"python"`` backend, ``equatorial`` and adaptive settings
+            Choices are cached for later geodesics of the same orbit class
+            See ``einsteinpy.integrators.autotune`` and ``tuned_settings``
+            Only available with the ``"python"`` and ``"numba"`` backends
+            Defaults to ``None``
 
         """
-        g, g_prms = self.metric, self.metric_params
-        q0, p0 = self.position, self.momentum
-        tl = self.time_like
+        kwargs = self._autotune(kwargs)
         N = kwargs.get("steps", 50)
         dl = kwargs.get("delta", 0.5)
         rtol = kwargs.get("rtol", 1e-2)
         atol = kwargs.get("atol", 1e-2)
         order = kwargs.get("order", 2)
+        scheme = kwargs.get("scheme", "triple_jump")
         omega = kwargs.get("omega", 1.0)
         sw = kwargs.get("suppress_warnings", False)
-        steps = np.arange(N)
-
-        geodint = GeodesicIntegrator(
-            metric=g,
-            metric_params=g_prms,
-            q0=q0,
-            p0=p0,
-            time_like=tl,
-            steps=N,
-            delta=dl,
-            rtol=rtol,
-            atol=atol,
-            order=order,
-            omega=omega,
-            suppress_warnings=sw,
+        backend = kwargs.get("backend", "python")
+        out = kwargs.get("out", None)
+        record = (kwargs.get("record_every", 1), kwargs.get("record_dt", None))
+        check = (
+            kwargs.get("constraint_check", "step"),
+            kwargs.get("check_every", 1),
         )
+        events = self._events(kwargs)
+        self._constraint = None, None
+
+        if backend not in ("python", "numba", "analytic", "mino"):
+            raise NotImplementedError(
+                f"'{backend}' backend is unsupported. "
+                "Use 'python', 'numba', 'analytic' or 'mino'."
+            )
+
+        if backend in ("numba", "analytic", "mino"):
+            self._geodint = None
+            if kwargs.get("adaptive", False):
+                raise NotImplementedError(
+                    "Adaptive step-size control is only available with the 'python' backend."
+                )
+            if kwargs.get("equatorial", False):
+                raise NotImplementedError(
+                    "Equatorial integration is only available with the 'python' backend."
+                )
+            stride, a, Q = self._compiled_settings(backend, record, check)
+            if backend == "numba":
+                raw = self._calculate_trajectory_jit(
+                    N, dl, stride, a, Q, order, omega, scheme
+                )
+            elif backend == "analytic":
+                raw = self._calculate_trajectory_analytic(N, dl, stride)
+            else:
+                raw = self._calculate_trajectory_mino(N, dl, stride, a, Q)
+            steps, vecs, affine = self._postprocess(
+                *raw, a, Q, events, record[1], rtol, atol, sw, check
+            )
+            # Affine step-sizes vary in Mino time, and
+            # are averaged over steps, that were not stored
+            gaps = np.diff(steps, prepend=-1).reshape((-1,) + (1,) * (affine.ndim - 1))
+            self._step_sizes = np.diff(affine, axis=0, prepend=0.0) / gaps
+            self._dense_knots = self._initial_knot()
+            if kwargs.get("dense_output", False) and affine.ndim > 1:
+                raise NotImplementedError(
+                    "Dense output of batches is not available with the 'mino' backend."
+                )
+            self._dense(kwargs, affine, vecs)
+            if out is not None:
+                sink = MemmapSink(out, vecs.shape, metadata=self._metadata(kwargs))
+                sink.array[: vecs.shape[0]] = vecs
+                sink.close(vecs.shape[0])
+                vecs = load_trajectory(out)[0]
+            return steps, self._output(vecs)
+
+        geodint = self._make_integrator(kwargs, out=out)
+        self._attach(geodint, kwargs, events)
+        for _ in self._integrate(geodint, N, events):
+            pass
+        geodint.close()
+        if out is not None:
+            # File-backed results cannot be extended
+            self._geodint = None
+
+        # (q1, p1) for each step, without the shadow copy, (q2, p2)
+        vecs = geodint.results
+        self._step_sizes = geodint.step_sizes
+        self._dense(kwargs, geodint.affine_parameters, vecs)
+        self._check(geodint, kwargs)
+
+        return geodint.step_indices.copy(), self._output(vecs)
+
+    def calculate_trajectory_iter(self, chunk_size=1000, **kwargs):
+        """
+        Calculate trajectory in spacetime, yielding it in chunks, as it
+        is produced, so that memory usage is bounded by ``chunk_size``,
+        regardless of the number of steps
+        To skip calculating the trajectory on construction,
+        initialize the Geodesic with ``steps=0``
 
-        for i in steps:
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Maximum number of steps per chunk
+            Defaults to ``1000``
+        kwargs : dict
+            Keyword parameters for the Geodesic Integrator
+            See ``calculate_trajectory`` for details.
+            Only the ``"python"`` backend is supported.
+            With ``constraint_check="deferred"``, each chunk is checked,
+            before it is yielded, and one warning, summarizing all chunks,
+            is issued, once the iterator is exhausted. Only
+            ``constraint_summary`` is then available, as the violation
+            for each step is not kept.
+
+        Yields
+        ------
+        ~numpy.ndarray
+            n-element numpy array, containing step count
+        ~numpy.ndarray
+            Shape-(n, 8) numpy array, containing
+            (4-Position, 4-Momentum) for each step in the chunk
+
+        Raises
+        ------
+        NotImplementedError
+            If ``backend`` is not ``"python"``
+
+        """
+        backend = kwargs.get("backend", "python")
+        if backend != "python":
+            raise NotImplementedError(
+                f"'{backend}' backend does not support streaming. Use 'python'."
+            )
+
+        kwargs = self._autotune(kwargs)
+        N = kwargs.get("steps", 50)
+        # Storage is only needed for one chunk
+        geodint = self._make_integrator(dict(kwargs, steps=min(N, chunk_size)))
+        events = self._events(kwargs)
+        self._attach(geodint, kwargs, events)
+        # Chunks are not kept, for dense output
+        self._dense_knots, self._dense_output = None, None
+        self._constraint = None, None
+        deferred = kwargs.get("constraint_check", "step") == "deferred"
+        summary, n_valid, n_steps = None, 0, 0
+        for _ in self._integrate(geodint, N, events, chunk_size):
+            steps = geodint.step_indices.copy()
+            if deferred and steps.size:
+                violation, chunk = geodint.check_constraint(warn=False)
+                n_chunk = int(np.count_nonzero(~np.isnan(violation)))
+                if summary is not None:
+                    chunk = _merge_constraint_summaries(
+                        summary, chunk, n_valid, n_chunk
+                    )
+                summary, n_valid = chunk, n_valid + n_chunk
+                n_steps += steps.size
+            vecs = geodint._flush()
+            if vecs.shape[0]:
+                yield steps, self._output(vecs)
+
+        if summary is not None:
+            self._constraint = None, summary
+            if not kwargs.get("suppress_warnings", False):
+                _warn_constraint(summary, n_steps)
+
+    def _autotune(self, kwargs):
+        """
+        Returns ``kwargs``, with ``order``, ``delta`` and ``omega``
+        chosen by ``einsteinpy.integrators.autotune``, if requested
+
+        """
+        self._tuned = None
+        tol = kwargs.get("autotune", None)
+        if tol is None:
+            return kwargs
+
+        # Pilots run on the same backend, and with the same settings
+        backend = kwargs.get("backend", "python")
+        keys = ("scheme",)
+        if backend == "python":
+            keys += ("equatorial", "adaptive", "adaptive_tol", "delta_min", "delta_max")
+        settings = {k: kwargs[k] for k in keys if k in kwargs}
+        self._tuned = autotune(
+            self.metric,
+            self.metric_params,
+            self.position,
+            self.momentum,
+            tol,
+            time_like=self.time_like,
+            backend=backend,
+            **settings,
+        )
+
+        return dict(
+            kwargs,
+            order=self._tuned["order"],
+            delta=self._tuned["delta"],
+            omega=self._tuned["omega"],
+        )
+
+    def _make_integrator(self, kwargs, out=None):
+        """
+        Returns the Geodesic Integrator, set up with ``kwargs``,
+        that optionally writes its results to ``out``
+
+        """
+        return self._integrator(
+            metric=self.metric,
+            metric_params=self.metric_params,
+            q0=self.position,
+            p0=self.momentum,
+            time_like=self.time_like,
+            steps=kwargs.get("steps", 50),
+            delta=kwargs.get("delta", 0.5),
+            rtol=kwargs.get("rtol", 1e-2),
+            atol=kwargs.get("atol", 1e-2),
+            order=kwargs.get("order", 2),
+            scheme=kwargs.get("scheme", "triple_jump"),
+            omega=kwargs.get("omega", 1.0),
+            suppress_warnings=kwargs.get("suppress_warnings", False),
+            constraint_check=kwargs.get("constraint_check", "step"),
+            check_every=kwargs.get("check_every", 1),
+            equatorial=kwargs.get("equatorial", False),
+            adaptive=kwargs.get("adaptive", False),
+            adaptive_tol=kwargs.get("adaptive_tol", 1e-6),
+            delta_min=kwargs.get("delta_min", None),
+            delta_max=kwargs.get("delta_max", None),
+            record_every=kwargs.get("record_every", 1),
+            record_dt=kwargs.get("record_dt", None),
+            out=out,
+            metadata=None if out is None else self._metadata(kwargs),
+        )
+
+    def _metadata(self, kwargs):
+        """
+        Returns metadata, describing the Geodesic, for on-disk trajectories
+
+        """
+        return {
+            "metric": self.metric_name,
+            "metric_params": np.asarray(self.metric_params, dtype=float).tolist(),
+            "order": kwargs.get("order", 2),
+            "scheme": kwargs.get("scheme", "triple_jump"),
+            "delta": kwargs.get("delta", 0.5),
+            "omega": kwargs.get("omega", 1.0),
+            "time_like": self.time_like,
+            "q0": self.position.tolist(),
+            "p0": self.momentum.tolist(),
+            "backend": kwargs.get("backend", "python"),
+        }
+
+    def _events(self, kwargs):
+        """
+        Returns the termination events, set up with ``kwargs``
+
+        """
+        return dict(
+            r_horizon=self._horizon_radius(kwargs.get("horizon", False)),
+            r_escape=kwargs.get("r_escape", None),
+            max_affine=kwargs.get("max_affine", None),
+            stop_condition=kwargs.get("stop_condition", None),
+        )
+
+    def _integrate(self, geodint, N, events, chunk_size=None):
+        """
+        Advances ``geodint`` by up to ``N`` steps, until all
+        geodesics have hit a termination event in ``events``
+        Yields after every ``chunk_size`` steps, and once integration stops
+
+        """
+        check = any(v is not None for v in events.values())
+        codes = self._codes
+        if check and np.all(codes > 0):
+            # Already terminated
+            N = 0
+        for i in range(N):
             geodint.step()
+            if check:
+                q, p = np.asarray(geodint.res_list[0]), np.asarray(geodint.res_list[1])
+                hit = _termination(q, p, geodint.affine, **events)
+                if codes.ndim == 0:
+                    codes = hit
+                else:
+                    # Finished geodesics are removed from the batch
+                    codes[geodint.active] = hit
+                    geodint.deactivate(hit > 0)
+                self._codes = codes
+                if np.all(codes > 0):
+                    break
+            if chunk_size is not None and (i + 1) % chunk_size == 0:
+                yield
+
+        self._termination_reason = np.asarray(_TERMINATION_REASONS)[codes]
+        yield
+
+    def _attach(self, geodint, kwargs, events):
+        """
+        Keeps a reference to ``geodint``, along with its settings
+        and the state of termination events, so that
+        integration can be extended or checkpointed
+
+        """
+        self._geodint = geodint
+        self._settings = dict(kwargs)
+        self._event_settings = events
+        self._codes = np.zeros(self.position.shape[:-1], dtype=int)
+        self._dense_knots = self._initial_knot()
+
+    def _initial_knot(self):
+        """
+        Returns the affine parameter and (4-Position, 4-Momentum)
+        of the initial state, as the first knot of dense output
+
+        """
+        state = np.concatenate((self.position, self.momentum), axis=-1)
+
+        return np.zeros(1), state[None]
+
+    def _dense(self, kwargs, affine, vecs):
+        """
+        Appends stored steps ``vecs``, at affine parameters ``affine``,
+        in Spherical Polar Coordinates, to the knots of dense output,
+        and rebuilds it, if requested in ``kwargs``
+
+        """
+        self._dense_output = None
+        if not kwargs.get("dense_output", False) or self._dense_knots is None:
+            return
+
+        lam, states = self._dense_knots
+        lam = np.concatenate((lam, affine))
+        states = np.concatenate((states, vecs))
+        self._dense_knots = lam, states
+        if lam.size >= 2:
+            self._dense_output = DenseOutput(
+                self.metric, self.metric_params, lam, states, output=self._output
+            )
+
+    def _check(self, geodint, kwargs, start=0):
+        """
+        Checks the Hamiltonian constraint for all steps, stored in
+        ``geodint``, if requested with ``constraint_check="deferred"``
+        Steps before ``start`` have already been prepared for output,
+        and keep their earlier violation, or ``NaN``, if there is none
+
+        """
+        if kwargs.get("constraint_check", "step") == "deferred":
+            sw = kwargs.get("suppress_warnings", False)
+            previous = None
+            if start:
+                previous = self._constraint[0]
+                if previous is None or previous.shape[0] != start:
+                    shape = (start,) + geodint.results.shape[1:-1]
+                    previous = np.full(shape, np.nan)
+            self._constraint = geodint.check_constraint(warn=not sw, previous=previous)
+
+    def extend(self, n_steps):
+        """
+        Continues integration by up to ``n_steps`` steps, from the end
+        of the trajectory, instead of recomputing it from the start
+        Termination events, set up on calculation, still apply.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of additional integration steps
+
+        Returns
+        -------
+        ~numpy.ndarray
+            N-element numpy array, containing step count
+        ~numpy.ndarray
+            Shape-(N, 8) numpy array, containing
+            (4-Position, 4-Momentum) for each step
+
+        Raises
+        ------
+        NotImplementedError
+            If the trajectory was not calculated with the ``"python"``
+            backend, or was written to ``out``
+
+        """
+        self._trajectory = self._continue(n_steps)
+
+        return self._trajectory
+
+    def _continue(self, n_steps):
+        """
+        Continues integration by up to ``n_steps`` steps, and returns
+        the trajectory, stored in the integrator
+
+        """
+        geodint = self._geodint
+        if geodint is None:
+            raise NotImplementedError(
+                "Only trajectories, calculated in memory, with the 'python' backend, "
+                "can be extended or checkpointed."
+            )
+
+        n = geodint.results.shape[0]
+        for _ in self._integrate(geodint, n_steps, self._event_settings):
+            pass
+
+        # Previous steps have already been prepared for output
+        vecs = geodint.results
+        self._dense(self._settings, geodint.affine_parameters[n:], vecs[n:])
+        self._check(geodint, self._settings, start=n)
+        self._output(vecs[n:])
+        self._step_sizes = geodint.step_sizes
+        steps = geodint.step_indices.copy()
+
+        return steps, vecs
+
+    def checkpoint(self):
+        """
+        Returns the state of the Geodesic, and its integrator,
+        so that integration can be resumed later, with ``from_checkpoint``
+        The trajectory itself is not part of the checkpoint.
+
+        Returns
+        -------
+        dict
+            JSON-serializable state of the Geodesic
+
+        Raises
+        ------
+        NotImplementedError
+            If the trajectory was not calculated with the ``"python"``
+            backend, or was written to ``out``, or if ``metric`` is
+            not one of the supported metrics, or their metric objects
+
+        """
+        if self._geodint is None:
+            raise NotImplementedError(
+                "Only trajectories, calculated in memory, with the 'python' backend, "
+                "can be extended or checkpointed."
+            )
+        if not self._closed_form:
+            raise NotImplementedError(
+                "Only geodesics in the Schwarzschild, Kerr and KerrNewman metrics "
+                "can be checkpointed."
+            )
+
+        settings = {
+            k: v for k, v in self._settings.items() if k in _CHECKPOINT_SETTINGS
+        }
+        events = self._event_settings
+
+        return {
+            "metric": self.metric_name,
+            "metric_params": np.asarray(self.metric_params, dtype=float).tolist(),
+            "position": self.position[..., 1:].tolist(),
+            "momentum": self.momentum[..., 1:].tolist(),
+            "time_like": self.time_like,
+            "return_cartesian": self.coords == "Cartesian",
+            "settings": settings,
+            "horizon": events["r_horizon"],
+            "r_escape": events["r_escape"],
+            "max_affine": events["max_affine"],
+            "termination": self._codes.tolist(),
+            "integrator": self._geodint.checkpoint(),
+        }
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint, stop_condition=None):
+        """
+        Restores a Geodesic from ``checkpoint``
+        Its trajectory is empty, until it is extended with ``extend``.
+
+        Parameters
+        ----------
+        checkpoint : dict
+            State of the Geodesic, returned by ``checkpoint``
+        stop_condition : callable, optional
+            Function of ``(q, p)``, returning ``True``, where
+            integration is to be stopped. Callables are not part
+            of checkpoints, and need to be supplied again.
+            Defaults to ``None``
+
+        Returns
+        -------
+        ~einsteinpy.geodesic.Geodesic
+            Geodesic, ready to be extended
+
+        """
+        geod = cls.__new__(cls)
+        horizon = checkpoint["horizon"]
+        Geodesic.__init__(
+            geod,
+            metric=checkpoint["metric"],
+            metric_params=tuple(checkpoint["metric_params"]),
+            position=checkpoint["position"],
+            momentum=checkpoint["momentum"],
+            time_like=checkpoint["time_like"],
+            return_cartesian=checkpoint["return_cartesian"],
+            **dict(checkpoint["settings"], steps=0),
+            horizon=False if horizon is None else horizon,
+            r_escape=checkpoint["r_escape"],
+            max_affine=checkpoint["max_affine"],
+            stop_condition=stop_condition,
+        )
+        geod._geodint.resume(checkpoint["integrator"])
+        # Dense output starts from the first step, after resuming
+        state = np.empty(geod.position.shape[:-1] + (8,))
+        geod._dense_knots = np.empty(0), state[None][:0]
+        geod._settings["steps"] = checkpoint["settings"].get("steps", 50)
+        geod._codes = np.asarray(checkpoint["termination"], dtype=int)
+        geod._termination_reason = np.asarray(_TERMINATION_REASONS)[geod._codes]
+        geod.extend(0)
+
+        return geod
+
+    def _horizon_radius(self, horizon):
+        """
+        Returns the radius of the outer event horizon, in M-Units,
+        at which integration is stopped, or ``None``
+
+        """
+        if horizon is None or horizon is False:
+            return None
+        if horizon is True:
+            if self._closed_form:
+                return _OUTER_HORIZONS[self.metric_name](*self.metric_params)
+            if self._metric_object is None:
+                raise NotImplementedError(
+                    f"Outer horizon of '{self.metric_name}' is unknown. "
+                    "Supply its radius as horizon."
+                )
+            horizon = self._metric_object
+        if hasattr(horizon, "singularities"):
+            return _outer_horizon(horizon)
+
+        return float(horizon)
 
-        vecs = np.array(geodint.results, dtype=float)
+    def _compiled_settings(self, backend, record, check):
+        """
+        Validates the settings, shared by the compiled backends,
+        ``"numba"``, ``"analytic"`` and ``"mino"``, which are only
+        available for the Schwarzschild, Kerr and KerrNewman metrics
+
+        Parameters
+        ----------
+        backend : str
+            Name of the backend
+        record : tuple
+            ``(record_every, record_dt)``
+        check : tuple
+            ``(constraint_check, check_every)``
+
+        Returns
+        -------
+        int
+            Number of integration steps per stored step
+        float
+            Spin Parameter, ``a``, of the metric
+        float
+            Charge, ``Q``, of the metric
+
+        Raises
+        ------
+        NotImplementedError
+            If ``check[0]`` is not supported, or if ``metric`` is not one
+            of the supported metrics, or their metric objects
+        ValueError
+            If ``record[0]`` is not a positive integer
+
+        """
+        if not self._closed_form:
+            raise NotImplementedError(
+                f"The '{backend}' backend is only available for the "
+                "Schwarzschild, Kerr and KerrNewman metrics."
+            )
+        if check[0] not in ("step", "deferred"):
+            raise NotImplementedError(
+                f"'{check[0]}' constraint check is unsupported. "
+                "Use 'step' or 'deferred'."
+            )
+        stride = record[0]
+        if int(stride) != stride or stride < 1:
+            raise ValueError(
+                f"record_every must be a positive integer. Supplied: {stride}"
+            )
+
+        prms = tuple(self.metric_params) + (0.0, 0.0)
+        a, Q = _SPIN_CHARGE[self.metric_name](*prms)
+
+        return int(stride), a, Q
+
+    def _calculate_trajectory_jit(
+        self, N, dl, stride, a, Q, order, omega, scheme="triple_jump"
+    ):
+        """
+        Calculate trajectory using compiled kernels, that store
+        every ``stride``-th step
+
+        Returns
+        -------
+        tuple
+            Step count, (4-Position, 4-Momentum) and affine parameter
+            of each stored step, to be passed to ``_postprocess``
+
+        Raises
+        ------
+        NotImplementedError
+            If ``order`` is not in [2, 4, 6, 8], or ``scheme``
+            is not supported
+
+        """
+        if order not in (2, 4, 6, 8):
+            raise NotImplementedError(
+                f"Order {order} integrator has not been implemented."
+            )
+
+        q0 = self.position.astype(float)
+        p0 = self.momentum.astype(float)
+        weights = _composition_weights(order, scheme)
+
+        if q0.ndim == 1:
+            vecs = _kn_integrate(q0, p0, a, Q, N, dl, omega, weights, stride)
+        else:
+            vecs = _kn_integrate_batch(q0, p0, a, Q, N, dl, omega, weights, stride)
+        steps = np.arange(stride - 1, N, stride)[: vecs.shape[0]]
+
+        return steps, vecs, dl * (steps + 1.0)
+
+    def _calculate_trajectory_analytic(self, N, dl, stride):
+        """
+        Calculate trajectory by evaluating the closed-form solution,
+        ``AnalyticGeodesic``, at the affine parameter of
+        every ``stride``-th step
+        Available for bound, Time-like geodesics
+
+        Returns
+        -------
+        tuple
+            Step count, (4-Position, 4-Momentum) and affine parameter
+            of each stored step, to be passed to ``_postprocess``
+
+        Raises
+        ------
+        NotImplementedError
+            If the geodesic is Null-like
+        ValueError
+            If any of the geodesics is not bound
+
+        """
+        solution = AnalyticGeodesic(
+            self.metric_name,
+            self.metric_params,
+            self.position[..., 1:],
+            self.momentum[..., 1:],
+            self.time_like,
+        )
+        steps = np.arange(stride - 1, N, stride)
+        affine = dl * (steps + 1.0)
+        vecs = solution(affine)
+        # Batches are evaluated as (n, M, 8)
+        vecs = np.ascontiguousarray(np.moveaxis(vecs, -2, 0))
+
+        return steps, vecs, affine
+
+    def _calculate_trajectory_mino(self, N, dl, stride, a, Q):
+        """
+        Calculate trajectory using the compiled, reduced integrators
+        in Mino time, that conserve energy, angular momentum and
+        the Carter constant exactly, and store every ``stride``-th step
+        Affine parameters differ between geodesics of a batch.
+
+        Returns
+        -------
+        tuple
+            Step count, (4-Position, 4-Momentum) and affine parameter
+            of each stored step, to be passed to ``_postprocess``
+
+        """
+        q0 = self.position.astype(float)
+        p0 = self.momentum.astype(float)
+        mu2 = float(self.time_like)
+
+        if q0.ndim == 1:
+            vecs, affine = _mino_integrate(q0, p0, a, Q, mu2, N, dl, stride)
+        else:
+            vecs, affine = _mino_integrate_batch(q0, p0, a, Q, mu2, N, dl, stride)
+        steps = np.arange(stride - 1, N, stride)[: vecs.shape[0]]
+
+        return steps, vecs, affine
+
+    def _postprocess(
+        self, steps, vecs, affine, a, Q, events, record_dt, rtol, atol, sw, check
+    ):
+        """
+        Post-processes the stored steps of the ``"numba"``, ``"analytic"``
+        and ``"mino"`` backends, at affine parameters ``affine``. Steps
+        closer than ``record_dt`` in coordinate time are dropped.
+        Termination events are then evaluated
+        on the stored steps, and the trajectories are truncated accordingly.
+        The Hamiltonian constraint is checked on the stored steps, either
+        with a warning per step, or with a single one, if ``check[0]``
+        is ``"deferred"``
 
-        q1 = vecs[:, 0]
-        p1 = vecs[:, 1]
-        results = np.hstack((q1, p1))
-        # Ignoring
-        # q2 = vecs[:, 2]
-        # p2 = vecs[:, 3]
+        Returns
+        -------
+        ~numpy.ndarray
+            M-element numpy array, containing step count
+        ~numpy.ndarray
+            Shape-(M, 8) numpy array, or Shape-(M, n, 8) array
+            for ``n`` geodesics, containing (4-Position, 4-Momentum)
+            for each stored step
+        ~numpy.ndarray
+            Shape-(M,) numpy array, or Shape-(M, n) array
+            for ``n`` geodesics, containing the affine
+            parameter of each stored step
+
+        """
+        q0 = self.position.astype(float)
+        if record_dt is not None:
+            t = vecs[..., 0].reshape(vecs.shape[0], -1).max(axis=-1)
+            keep = _record_dt(t, np.max(q0[..., 0]), record_dt)
+            steps, vecs, affine = steps[keep], vecs[keep], affine[keep]
+
+        codes = np.zeros(q0.shape[:-1], dtype=int)
+        M = vecs.shape[0]
+        if M and any(v is not None for v in events.values()):
+            lam = affine.reshape((M,) + (-1,) * (q0.ndim - 1))
+            hits = _termination(vecs[..., :4], vecs[..., 4:], lam, **events)
+            # First stored step with an event, for each geodesic
+            first = np.where(hits.any(axis=0), hits.argmax(axis=0), M - 1)
+            codes = np.take_along_axis(hits, first[None], axis=0)[0]
+            vecs = vecs[: np.max(first) + 1]
+            steps, affine = steps[: vecs.shape[0]], affine[: vecs.shape[0]]
+            # Padding geodesics, that terminated earlier
+            step = np.arange(vecs.shape[0]).reshape((-1,) + (1,) * (q0.ndim - 1))
+            vecs[step > first] = np.nan
+        self._termination_reason = np.asarray(_TERMINATION_REASONS)[codes]
+
+        const = -int(self.time_like)
+        if check[0] == "deferred":
+            gpp = _kn_constraint(vecs.reshape(-1, 8), a, Q).reshape(vecs.shape[:-1])
+            violation = gpp - const
+            summary = _constraint_summary(violation, const, rtol, atol, steps)
+            self._constraint = violation, summary
+            if not sw:
+                _warn_constraint(summary, vecs.shape[0])
+        elif not sw:
+            gpp = _kn_constraint(vecs.reshape(-1, 8), a, Q).reshape(vecs.shape[:-1])
+            failed = ~np.isclose(gpp, const, rtol=rtol, atol=atol)
+            # Ignoring padding, after termination
+            failed &= ~np.isnan(vecs).all(axis=-1)
+            failed = failed.reshape(vecs.shape[0], -1).any(axis=-1)
+            failed &= (steps + 1) % check[1] == 0
+            for i in np.flatnonzero(failed):
+                warnings.warn(
+                    f"Numerical error has exceeded specified tolerance at step = {steps[i] + 1}.",
+                    RuntimeWarning,
+                )
+
+        return steps, vecs, affine
+
+    def _output(self, vecs):
+        """
+        Prepares the output array, containing 4-Positions and 4-Momenta
+        Positions are converted to Cartesian Coordinates in-place,
+        if ``return_cartesian`` is set. Read-only (file-backed) arrays
+        are copied, before conversion.
+
+        Parameters
+        ----------
+        vecs : ~numpy.ndarray
+            (4-Position, 4-Momentum), with shape (..., 8)
 
+        Returns
+        -------
+        ~numpy.ndarray
+            (4-Position, 4-Momentum), with shape (..., 8)
+
+        """
         if self.coords == "Cartesian":
             # Converting to Cartesian from Spherical Polar Coordinates
             # Note that momenta cannot be converted this way,
             # due to ambiguities in the signs of v_r and v_th (velocities)
-            t, r, th, ph = q1.T
-            pt, pr, pth, pph = p1.T
+            if not vecs.flags.writeable:
+                vecs = np.array(vecs)
+            r, th, ph = vecs[..., 1], vecs[..., 2], vecs[..., 3]
             x = r * np.sin(th) * np.cos(ph)
             y = r * np.sin(th) * np.sin(ph)
             z = r * np.cos(th)
+            vecs[..., 1], vecs[..., 2], vecs[..., 3] = x, y, z
 
-            cart_results = np.vstack((t, x, y, z, pt, pr, pth, pph)).T
+        return vecs
 
-            return steps, cart_results
 
-        return steps, results
+class BatchGeodesic(Geodesic):
+    """
+    Class for defining a batch of Geodesics, that share the
+    same metric and are integrated together, in lock-step
+    Working in Geometrized Units (M-Units),
+    with :math:`c = G = M = k_e = 1`
+
+    """
+
+    _integrator = BatchGeodesicIntegrator
+
+    def __init__(
+        self,
+        metric,
+        metric_params,
+        position,
+        momentum,
+        time_like=True,
+        return_cartesian=True,
+        **kwargs,
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        metric : str or callable or ~einsteinpy.metric.BaseMetric
+            Name of the metric. Currently, these metrics are supported:
+            1. Schwarzschild
+            2. Kerr
+            3. KerrNewman
+            Alternatively, a function of ``(x_vec, *metric_params)``,
+            returning the Contravariant Metric Tensor in M-Units, with
+            signature ``(-, +, +, +)``, in coordinates ``(t, r, theta, phi)``,
+            or a metric object, e.g. ``einsteinpy.metric.Kerr``
+        metric_params : array_like
+            Tuple of parameters to pass to the metric
+            E.g., ``(a,)`` for Kerr
+            Ignored for metric objects, whose parameters are used instead
+        position : array_like
+            3-Positions of ``N`` test particles
+            Shape-(N, 3) array
+            4-Positions are initialized by taking ``t = 0.0``
+        momentum : array_like
+            3-Momenta of ``N`` test particles
+            Shape-(N, 3) array
+            4-Momenta are calculated automatically,
+            considering the value of ``time_like``
+        time_like : bool, optional
+            Determines type of Geodesics
+            ``True`` for Time-like geodesics
+            ``False`` for Null-like geodesics
+            Defaults to ``True``
+        return_cartesian : bool, optional
+            Whether to return calculated positions in Cartesian Coordinates
+            This only affects the coordinates. Momenta are dimensionless
+            quantities, and are returned in Spherical Polar Coordinates.
+            Defaults to ``True``
+        kwargs : dict
+            Keyword parameters for the Geodesic Integrator
+            See ``Geodesic`` for details.
+
+        Raises
+        ------
+        ValueError
+            If ``position`` or ``momentum`` are not Shape-(N, 3) arrays of equal shape
+
+        """
+        position = np.asarray(position, dtype=float)
+        momentum = np.asarray(momentum, dtype=float)
+        if (
+            position.ndim != 2
+            or position.shape[-1] != 3
+            or position.shape != momentum.shape
+        ):
+            raise ValueError(
+                "position and momentum must be arrays of shape (N, 3). "
+                f"Supplied shapes: {position.shape}, {momentum.shape}"
+            )
+
+        super().__init__(
+            metric=metric,
+            metric_params=metric_params,
+            position=position,
+            momentum=momentum,
+            time_like=time_like,
+            return_cartesian=return_cartesian,
+            **kwargs,
+        )
+
+    def calculate_trajectory(self, **kwargs):
+        """
+        Calculate trajectories of all geodesics in the batch
+
+        Parameters
+        ----------
+        kwargs : dict
+            Keyword parameters for the Geodesic Integrator
+            See ``Geodesic.calculate_trajectory`` for details.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(steps,) numpy array, containing step count,
+            shared by all ``N`` geodesics
+        ~numpy.ndarray
+            Shape-(N, steps, 8) numpy array, containing
+            (4-Position, 4-Momentum) for each geodesic and step
+
+        """
+        steps, results = super().calculate_trajectory(**kwargs)
+
+        return steps, np.swapaxes(results, 0, 1)
+
+    def calculate_trajectory_iter(self, chunk_size=1000, **kwargs):
+        """
+        Calculate trajectories of all geodesics in the batch,
+        yielding them in chunks, as they are produced
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Maximum number of steps per chunk
+            Defaults to ``1000``
+        kwargs : dict
+            Keyword parameters for the Geodesic Integrator
+            See ``Geodesic.calculate_trajectory_iter`` for details.
+
+        Yields
+        ------
+        ~numpy.ndarray
+            Shape-(n,) numpy array, containing step count,
+            shared by all ``N`` geodesics
+        ~numpy.ndarray
+            Shape-(N, n, 8) numpy array, containing
+            (4-Position, 4-Momentum) for each geodesic and step in the chunk
+
+        """
+        for steps, results in super().calculate_trajectory_iter(chunk_size, **kwargs):
+            yield steps, np.swapaxes(results, 0, 1)
+
+    def extend(self, n_steps):
+        """
+        Continues integration of all geodesics in the batch,
+        by up to ``n_steps`` steps, from the end of their trajectories
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of additional integration steps
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(steps,) numpy array, containing step count,
+            shared by all ``N`` geodesics
+        ~numpy.ndarray
+            Shape-(N, steps, 8) numpy array, containing
+            (4-Position, 4-Momentum) for each geodesic and step
+
+        """
+        steps, results = self._continue(n_steps)
+        self._trajectory = steps, np.swapaxes(results, 0, 1)
+
+        return self._trajectory
 
 
 class Nulllike(Geodesic):
@@ -264,14 +1465,19 @@ class Nulllike(Geodesic):
 
         Parameters
         ----------
-        metric : str
+        metric : str or callable or ~einsteinpy.metric.BaseMetric
             Name of the metric. Currently, these metrics are supported:
             1. Schwarzschild
             2. Kerr
             3. KerrNewman
+            Alternatively, a function of ``(x_vec, *metric_params)``,
+            returning the Contravariant Metric Tensor in M-Units, with
+            signature ``(-, +, +, +)``, in coordinates ``(t, r, theta, phi)``,
+            or a metric object, e.g. ``einsteinpy.metric.Kerr``
         metric_params : array_like
             Tuple of parameters to pass to the metric
             E.g., ``(a,)`` for Kerr
+            Ignored for metric objects, whose parameters are used instead
         position : array_like
             3-Position
             4-Position is initialized by taking ``t = 0.0``
@@ -305,6 +1511,11 @@ class Nulllike(Geodesic):
         order : int
             Integration Order
             Defaults to ``2``
+        scheme : str
+            Composition of Order 2 steps, used for orders 6 and 8
+            One of ``"triple_jump"``, ``"yoshida"`` or ``"kahan_li"``
+            See ``einsteinpy.integrators.GeodesicIntegrator`` for details
+            Defaults to ``"triple_jump"``
         omega : float
             Coupling between Hamiltonian Flows
             Smaller values imply smaller integration error, but too
@@ -318,6 +1529,100 @@ class Nulllike(Geodesic):
             Warnings are shown for every step, where numerical errors
             exceed specified tolerance (controlled by ``rtol`` and ``atol``)
             Defaults to ``False``
+        constraint_check : str
+            ``"step"`` checks the Hamiltonian constraint after every
+            ``check_every``-th step, and warns for each step, that exceeds
+            tolerance. ``"deferred"`` checks all stored steps at once, after
+            integration, and issues a single warning. The violation is then
+            available as ``constraint_violation``, with ``constraint_summary``
+            Defaults to ``"step"``
+        check_every : int
+            Number of steps between checks, with ``constraint_check="step"``
+            Defaults to ``1``
+        backend : str
+            Integration backend, ``"python"``, ``"numba"``, ``"analytic"`` or ``"mino"``
+            ``"numba"`` runs a compiled integration loop, and is
+            only available for the Schwarzschild, Kerr and KerrNewman metrics
+            Falls back to (slow) pure Python execution, if ``numba``
+            is not installed
+            ``"analytic"`` evaluates the closed-form solution of bound,
+            Time-like geodesics in these metrics, at each step, without
+            integration error. See ``einsteinpy.geodesic.AnalyticGeodesic``
+            ``"mino"`` integrates the decoupled radial and polar equations
+            of these metrics in Mino time, with energy, angular momentum
+            and Carter constant conserved exactly
+            Defaults to ``"python"``
+        adaptive : bool
+            Whether to adapt the step-size, so that the local error
+            over each step, estimated by step doubling, stays within ``adaptive_tol``
+            Only available with the ``"python"`` backend
+            Defaults to ``False``
+        adaptive_tol : float
+            Tolerance on the (relative) local error per step
+            Defaults to ``1e-6``
+        delta_min : float
+            Lower bound on the adapted step-size
+            Defaults to ``1e-3 * delta``
+        delta_max : float
+            Upper bound on the adapted step-size
+            Defaults to ``10 * delta``
+        horizon : bool or float or ~einsteinpy.metric.BaseMetric
+            Whether to stop integration, once the outer event horizon is crossed
+            ``True`` uses the outer horizon of ``metric``, a float
+            specifies the radius, and a metric object uses the
+            ``"outer_horizon"`` from its ``singularities()``
+            Defaults to ``False``
+        r_escape : float
+            Radius, at which escaping geodesics are stopped
+            Defaults to ``None``
+        max_affine : float
+            Maximum value of the affine parameter
+            Defaults to ``None``
+        stop_condition : callable
+            Function of ``(q, p)``, the Shape-(..., 4) 4-Positions and
+            4-Momenta in Spherical Polar / Boyer-Lindquist Coordinates,
+            returning ``True``, where integration is to be stopped
+            Defaults to ``None``
+        out : str or os.PathLike
+            Path to a ``.npy`` file, into which the trajectory is written,
+            through a growable ``numpy.memmap``, with a JSON metadata sidecar
+            The trajectory is then returned as a read-only, file-backed array,
+            in Spherical Polar Coordinates, unless ``return_cartesian`` is set
+            See ``einsteinpy.integrators.load_trajectory`` to reopen it
+            Defaults to ``None``
+        record_every : int
+            Only every ``record_every``-th step is stored and returned,
+            so that memory usage and coordinate conversion scale
+            with the number of output samples, instead of steps
+            Defaults to ``1``
+        record_dt : float
+            Minimum coordinate time between stored steps
+            Termination events are evaluated on every step with the
+            ``"python"`` backend, and on stored steps otherwise
+            Defaults to ``None``
+        dense_output : bool
+            Whether to build a ``DenseOutput``, available as ``dense_output``,
+            that interpolates the stored steps, so that the trajectory can be
+            evaluated at arbitrary affine parameter or coordinate time
+            Defaults to ``False``
+        equatorial : bool
+            Whether to integrate only ``(t, r, phi)``, and their momenta, for
+            geodesics in the equatorial plane, with ``theta = pi / 2`` and
+            ``p_theta = 0``, initially. The metric must be reflection-symmetric
+            about that plane. Metric derivatives w.r.t. ``theta`` are skipped,
+            and for built-in metrics, only those w.r.t. ``r`` are computed
+            Only available with the ``"python"`` backend
+            Defaults to ``False``
+        autotune : float
+            Tolerance on the drift of the Hamiltonian constraint, for which
+            ``order``, ``delta`` and ``omega`` are chosen from short pilot
+            integrations, overriding any supplied values. ``steps`` is kept.
+            Pilots run on ``backend``, with the supplied ``scheme``, and, for
+            the ``"python"`` backend, ``equatorial`` and adaptive settings
+            Choices are cached for later geodesics of the same orbit class
+            See ``einsteinpy.integrators.autotune`` and ``tuned_settings``
+            Only available with the ``"python"`` and ``"numba"`` backends
+            Defaults to ``None``
 
         """
         super().__init__(
@@ -345,14 +1650,19 @@ class Timelike(Geodesic):
 
         Parameters
         ----------
-        metric : str
+        metric : str or callable or ~einsteinpy.metric.BaseMetric
             Name of the metric. Currently, these metrics are supported:
             1. Schwarzschild
             2. Kerr
             3. KerrNewman
+            Alternatively, a function of ``(x_vec, *metric_params)``,
+            returning the Contravariant Metric Tensor in M-Units, with
+            signature ``(-, +, +, +)``, in coordinates ``(t, r, theta, phi)``,
+            or a metric object, e.g. ``einsteinpy.metric.Kerr``
         metric_params : array_like
             Tuple of parameters to pass to the metric
             E.g., ``(a,)`` for Kerr
+            Ignored for metric objects, whose parameters are used instead
         position : array_like
             3-Position
             4-Position is initialized by taking ``t = 0.0``
@@ -386,6 +1696,11 @@ class Timelike(Geodesic):
         order : int
             Integration Order
             Defaults to ``2``
+        scheme : str
+            Composition of Order 2 steps, used for orders 6 and 8
+            One of ``"triple_jump"``, ``"yoshida"`` or ``"kahan_li"``
+            See ``einsteinpy.integrators.GeodesicIntegrator`` for details
+            Defaults to ``"triple_jump"``
         omega : float
             Coupling between Hamiltonian Flows
             Smaller values imply smaller integration error, but too
@@ -399,6 +1714,100 @@ class Timelike(Geodesic):
             Warnings are shown for every step, where numerical errors
             exceed specified tolerance (controlled by ``rtol`` and ``atol``)
             Defaults to ``False``
+        constraint_check : str
+            ``"step"`` checks the Hamiltonian constraint after every
+            ``check_every``-th step, and warns for each step, that exceeds
+            tolerance. ``"deferred"`` checks all stored steps at once, after
+            integration, and issues a single warning. The violation is then
+            available as ``constraint_violation``, with ``constraint_summary``
+            Defaults to ``"step"``
+        check_every : int
+            Number of steps between checks, with ``constraint_check="step"``
+            Defaults to ``1``
+        backend : str
+            Integration backend, ``"python"``, ``"numba"``, ``"analytic"`` or ``"mino"``
+            ``"numba"`` runs a compiled integration loop, and is
+            only available for the Schwarzschild, Kerr and KerrNewman metrics
+            Falls back to (slow) pure Python execution, if ``numba``
+            is not installed
+            ``"analytic"`` evaluates the closed-form solution of bound,
+            Time-like geodesics in these metrics, at each step, without
+            integration error. See ``einsteinpy.geodesic.AnalyticGeodesic``
+            ``"mino"`` integrates the decoupled radial and polar equations
+            of these metrics in Mino time, with energy, angular momentum
+            and Carter constant conserved exactly
+            Defaults to ``"python"``
+        adaptive : bool
+            Whether to adapt the step-size, so that the local error
+            over each step, estimated by step doubling, stays within ``adaptive_tol``
+            Only available with the ``"python"`` backend
+            Defaults to ``False``
+        adaptive_tol : float
+            Tolerance on the (relative) local error per step
+            Defaults to ``1e-6``
+        delta_min : float
+            Lower bound on the adapted step-size
+            Defaults to ``1e-3 * delta``
+        delta_max : float
+            Upper bound on the adapted step-size
+            Defaults to ``10 * delta``
+        horizon : bool or float or ~einsteinpy.metric.BaseMetric
+            Whether to stop integration, once the outer event horizon is crossed
+            ``True`` uses the outer horizon of ``metric``, a float
+            specifies the radius, and a metric object uses the
+            ``"outer_horizon"`` from its ``singularities()``
+            Defaults to ``False``
+        r_escape : float
+            Radius, at which escaping geodesics are stopped
+            Defaults to ``None``
+        max_affine : float
+            Maximum value of the affine parameter
+            Defaults to ``None``
+        stop_condition : callable
+            Function of ``(q, p)``, the Shape-(..., 4) 4-Positions and
+            4-Momenta in Spherical Polar / Boyer-Lindquist Coordinates,
+            returning ``True``, where integration is to be stopped
+            Defaults to ``None``
+        out : str or os.PathLike
+            Path to a ``.npy`` file, into which the trajectory is written,
+            through a growable ``numpy.memmap``, with a JSON metadata sidecar
+            The trajectory is then returned as a read-only, file-backed array,
+            in Spherical Polar Coordinates, unless ``return_cartesian`` is set
+            See ``einsteinpy.integrators.load_trajectory`` to reopen it
+            Defaults to ``None``
+        record_every : int
+            Only every ``record_every``-th step is stored and returned,
+            so that memory usage and coordinate conversion scale
+            with the number of output samples, instead of steps
+            Defaults to ``1``
+        record_dt : float
+            Minimum coordinate time between stored steps
+            Termination events are evaluated on every step with the
+            ``"python"`` backend, and on stored steps otherwise
+            Defaults to ``None``
+        dense_output : bool
+            Whether to build a ``DenseOutput``, available as ``dense_output``,
+            that interpolates the stored steps, so that the trajectory can be
+            evaluated at arbitrary affine parameter or coordinate time
+            Defaults to ``False``
+        equatorial : bool
+            Whether to integrate only ``(t, r, phi)``, and their momenta, for
+            geodesics in the equatorial plane, with ``theta = pi / 2`` and
+            ``p_theta = 0``, initially. The metric must be reflection-symmetric
+            about that plane. Metric derivatives w.r.t. ``theta`` are skipped,
+            and for built-in metrics, only those w.r.t. ``r`` are computed
+            Only available with the ``"python"`` backend
+            Defaults to ``False``
+        autotune : float
+            Tolerance on the drift of the Hamiltonian constraint, for which
+            ``order``, ``delta`` and ``omega`` are chosen from short pilot
+            integrations, overriding any supplied values. ``steps`` is kept.
+            Pilots run on ``backend``, with the supplied ``scheme``, and, for
+            the ``"python"`` backend, ``equatorial`` and adaptive settings
+            Choices are cached for later geodesics of the same orbit class
+            See ``einsteinpy.integrators.autotune`` and ``tuned_settings``
+            Only available with the ``"python"`` and ``"numba"`` backends
+            Defaults to ``None``
 
         """
         super().__init__(
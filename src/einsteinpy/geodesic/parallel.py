@@ -0,0 +1,335 @@
+"""
+Parallel execution of collections of Geodesics, through a
+``concurrent.futures.ProcessPoolExecutor``
+
+Results are either returned through the pool, or written in-place by the
+workers, into a buffer in ``multiprocessing.shared_memory``.
+
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .geodesic import Geodesic
+
+
+class SharedResults:
+    """
+    Trajectories of a collection of Geodesics, stored in a
+    ``multiprocessing.shared_memory`` buffer, that is owned by this object
+    The buffer is released by ``close``, or on leaving a ``with`` block.
+
+    """
+
+    def __init__(self, shape):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the buffer, ``(N, steps, 8)``
+
+        """
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=max(1, 8 * int(np.prod(shape)))
+        )
+        self.name = self._shm.name
+        self.shape = tuple(shape)
+        self.array = np.ndarray(self.shape, dtype=float, buffer=self._shm.buf)
+        self.array[:] = np.nan
+        self.n_steps = np.zeros(self.shape[0], dtype=int)
+        self.termination_reason = np.full(self.shape[0], "", dtype=object)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Releases the shared memory buffer
+        ``array`` cannot be used afterwards
+
+        """
+        if self._shm is None:
+            return
+
+        self.array = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # Views of `array` are still alive, and are unmapped on garbage collection
+            pass
+        self._shm.unlink()
+        self._shm = None
+
+
+def _attach(name, shape):
+    """
+    Attaches to a shared memory buffer, created by another process
+
+    """
+    # Pool workers share the resource tracker of the creating process,
+    # which remains responsible for unlinking the buffer
+    shm = shared_memory.SharedMemory(name=name)
+
+    return shm, np.ndarray(shape, dtype=float, buffer=shm.buf)
+
+
+def _run_chunk(
+    indices, metric, metric_params, positions, momenta, time_like, kwargs, shared=None
+):
+    """
+    Integrates a chunk of Geodesics, in a worker process
+    Failures are captured per Geodesic, and do not affect the rest of the chunk
+    If ``shared`` is ``(name, shape)`` of a shared memory buffer, trajectories
+    are written into it, instead of being returned
+
+    Returns
+    -------
+    list
+        ``(index, result, error)`` for each Geodesic in the chunk, where
+        ``result`` is ``(steps, trajectory, termination_reason)``,
+        or ``(n_steps, termination_reason)``, if ``shared`` is set,
+        or ``None``, if integration failed with ``error``
+
+    """
+    shm, buf = (None, None) if shared is None else _attach(*shared)
+
+    out = list()
+    try:
+        for i, prms, position, momentum in zip(
+            indices, metric_params, positions, momenta
+        ):
+            try:
+                geod = Geodesic(
+                    metric=metric,
+                    metric_params=prms,
+                    position=position,
+                    momentum=momentum,
+                    time_like=time_like,
+                    **kwargs,
+                )
+                steps, trajectory = geod.trajectory
+                reason = str(geod.termination_reason)
+                if buf is None:
+                    out.append((i, (steps, trajectory, reason), None))
+                else:
+                    buf[i, : steps.size] = trajectory
+                    out.append((i, (steps.size, reason), None))
+            except Exception as e:
+                out.append((i, None, e))
+    finally:
+        if shm is not None:
+            del buf
+            shm.close()
+
+    return out
+
+
+def run_batch(
+    metric,
+    metric_params,
+    positions,
+    momenta,
+    time_like=True,
+    n_workers=None,
+    chunk_size=None,
+    progress=None,
+    shared=False,
+    **kwargs,
+):
+    """
+    Integrates a collection of Geodesics in parallel, by distributing
+    them in chunks, across a pool of worker processes
+    A failure in one Geodesic does not abort the rest of the batch.
+
+    Parameters
+    ----------
+    metric : str or callable or ~einsteinpy.metric.BaseMetric
+        Name of the metric. Currently, these metrics are supported:
+        1. Schwarzschild
+        2. Kerr
+        3. KerrNewman
+        Alternatively, a Contravariant Metric Function, or a metric object
+        See ``Geodesic`` for details. Functions must be picklable.
+    metric_params : array_like
+        Tuple of parameters to pass to the metric, shared by all Geodesics,
+        e.g. ``(a,)`` for Kerr, or a sequence of such tuples, one per Geodesic
+    positions : array_like
+        3-Positions, Shape-(N, 3) array
+    momenta : array_like
+        3-Momenta, Shape-(N, 3) array
+    time_like : bool, optional
+        Determines type of Geodesics
+        ``True`` for Time-like geodesics
+        ``False`` for Null-like geodesics
+        Defaults to ``True``
+    n_workers : int, optional
+        Number of worker processes. ``1`` integrates in the current process.
+        Defaults to ``os.cpu_count()``
+    chunk_size : int, optional
+        Number of Geodesics per task
+        Defaults to splitting the batch into ~4 tasks per worker
+    progress : callable, optional
+        Function of ``(n_done, n_total)``, called in the current
+        process, every time a chunk of Geodesics is completed
+        Defaults to ``None``
+    shared : bool, optional
+        Whether workers should write trajectories in-place, into a buffer
+        in shared memory, instead of returning them through the pool
+        Defaults to ``False``
+    kwargs : dict
+        Keyword parameters for ``Geodesic``, e.g. ``steps``, ``delta``,
+        ``return_cartesian``, or ``backend``. Callables, such as
+        ``stop_condition``, must be picklable, i.e. defined at module level.
+
+    Returns
+    -------
+    list or ~einsteinpy.geodesic.parallel.SharedResults
+        ``(steps, trajectory, termination_reason)`` for each Geodesic,
+        in the order supplied, or ``None``, if integration failed
+        If ``shared`` is set, ``SharedResults``, whose ``array`` is a
+        zero-copy, Shape-(N, steps, 8) view of the shared buffer, padded
+        with ``NaN`` after termination, or failure. It should be closed,
+        once the results are no longer needed.
+    dict
+        Exceptions, keyed by the index of the failed Geodesic
+
+    Raises
+    ------
+    ValueError
+        If ``positions`` or ``momenta`` are not Shape-(N, 3) arrays of equal shape,
+        or if ``metric_params`` are supplied per Geodesic, but not for all of them
+
+    """
+    positions = np.asarray(positions, dtype=float)
+    momenta = np.asarray(momenta, dtype=float)
+    if (
+        positions.ndim != 2
+        or positions.shape[-1] != 3
+        or positions.shape != momenta.shape
+    ):
+        raise ValueError(
+            "positions and momenta must be arrays of shape (N, 3). "
+            f"Supplied shapes: {positions.shape}, {momenta.shape}"
+        )
+
+    N = positions.shape[0]
+    # Parameters are supplied per Geodesic, if they are a sequence of sequences
+    if len(metric_params) and np.ndim(metric_params[0]) == 1:
+        metric_params = [tuple(prms) for prms in metric_params]
+        if len(metric_params) != N:
+            raise ValueError(
+                f"Expected metric_params for {N} geodesics. "
+                f"Supplied: {len(metric_params)}"
+            )
+    else:
+        metric_params = [tuple(metric_params)] * N
+
+    n_workers = os.cpu_count() if n_workers is None else n_workers
+    if chunk_size is None:
+        chunk_size = max(1, -(-N // (4 * n_workers)))
+
+    results = [None] * N
+    if shared:
+        n_stored = kwargs.get("steps", 50) // kwargs.get("record_every", 1)
+        results = SharedResults((N, n_stored, 8))
+
+    try:
+        return _run_chunks(
+            metric,
+            metric_params,
+            positions,
+            momenta,
+            time_like,
+            n_workers,
+            chunk_size,
+            progress,
+            results,
+            kwargs,
+        )
+    except BaseException:
+        if shared:
+            results.close()
+        raise
+
+
+def _run_chunks(
+    metric,
+    metric_params,
+    positions,
+    momenta,
+    time_like,
+    n_workers,
+    chunk_size,
+    progress,
+    results,
+    kwargs,
+):
+    """
+    Distributes Geodesics in chunks, across a pool of worker
+    processes, and collects their ``results``
+
+    """
+    N = positions.shape[0]
+    shared = None
+    if isinstance(results, SharedResults):
+        shared = (results.name, results.shape)
+
+    chunks = [np.arange(N)[i : i + chunk_size] for i in range(0, N, chunk_size)]
+    args = [
+        (
+            idx,
+            metric,
+            [metric_params[i] for i in idx],
+            positions[idx],
+            momenta[idx],
+            time_like,
+            kwargs,
+            shared,
+        )
+        for idx in chunks
+    ]
+
+    errors = dict()
+    n_done = 0
+
+    def _collect(idx, out):
+        nonlocal n_done
+        for i, result, error in out:
+            if error is not None:
+                errors[i] = error
+                if shared is not None:
+                    # Discarding partially written trajectories
+                    results.array[i] = np.nan
+            elif shared is None:
+                results[i] = result
+            else:
+                results.n_steps[i], results.termination_reason[i] = result
+        n_done += len(idx)
+        if progress is not None:
+            progress(n_done, N)
+
+    if n_workers == 1:
+        for arg in args:
+            _collect(arg[0], _run_chunk(*arg))
+
+        return results, errors
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {executor.submit(_run_chunk, *arg): arg[0] for arg in args}
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                out = future.result()
+            except Exception as e:
+                # Worker failed as a whole, e.g. due to pickling errors
+                out = [(i, None, e) for i in idx]
+            _collect(idx, out)
+
+    return results, errors
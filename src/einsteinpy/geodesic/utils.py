@@ -7,8 +7,18 @@ Metric Signature => :math:`(-, +, +, +)`
 """
 import numpy as np
 
+from einsteinpy import constant
+from einsteinpy.integrators import register_metric_derivative
+from einsteinpy.metric import BaseMetric, Kerr, KerrNewman, Schwarzschild
 from einsteinpy.utils.dual import DualNumber
 
+_c = constant.c.value
+_G = constant.G.value
+_Cc = constant.coulombs_const.value
+
+# Reasons for terminating integration, indexed by `_termination`
+_TERMINATION_REASONS = ("steps", "horizon", "escape", "affine", "condition")
+
 
 def _P(g, g_prms, q, p, time_like=True):
     """
@@ -23,8 +33,10 @@ def _P(g, g_prms, q, p, time_like=True):
         E.g., ``(a,)`` for Kerr
     q : array_like
         Initial 4-Position
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` particles
     p : array_like
         Initial 3-Momentum
+        Shape-(3,) array, or Shape-(N, 3) array for ``N`` particles
     time_like: bool, optional
         Determines type of Geodesic
         ``True`` for Time-like geodesics
@@ -35,25 +47,102 @@ def _P(g, g_prms, q, p, time_like=True):
     -------
     P: numpy.ndarray
         4-Momentum
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` particles
 
     """
-    guu = g(q, *g_prms)
-    P = np.array([0.0, *p])
+    guu = g(np.asarray(q).T, *g_prms)
+    P = np.insert(np.asarray(p, dtype=float), 0, 0.0, axis=-1)
+    Pi = P.T
 
+    # g^{mu nu} P_mu P_nu = -time_like, as a quadratic in P_0,
+    # including all off-diagonal components, for arbitrary metrics
     A = guu[0, 0]
-    B = 2 * guu[0, 3] * P[3]
+    B = 2 * sum(guu[0, i] * Pi[i] for i in range(1, 4))
     C = (
-        guu[1, 1] * P[1] * P[1]
-        + guu[2, 2] * P[2] * P[2]
-        + guu[3, 3] * P[3] * P[3]
+        sum(guu[i, j] * Pi[i] * Pi[j] for i in range(1, 4) for j in range(1, 4))
         + int(time_like)
     )
 
-    P[0] = (-B + np.sqrt(B ** 2 - 4 * A * C)) / (2 * A)
+    P[..., 0] = (-B + np.sqrt(B ** 2 - 4 * A * C)) / (2 * A)
 
     return P
 
 
+def _outer_horizon(metric):
+    """
+    Utility function to compute the radius of the outer event horizon,
+    in M-Units, from ``BaseMetric.singularities``
+
+    Parameters
+    ----------
+    metric : ~einsteinpy.metric.BaseMetric
+        Metric object, e.g. ``einsteinpy.metric.Kerr``
+
+    Returns
+    -------
+    float
+        Radius of the outer event horizon, in M-Units
+
+    """
+    r_h = metric.singularities()["outer_horizon"]
+
+    return r_h / (_G * metric.M.value / _c ** 2)
+
+
+def _termination(
+    q, p, lam, r_horizon=None, r_escape=None, max_affine=None, stop_condition=None
+):
+    """
+    Utility function to evaluate termination events for geodesics
+    If several events occur at once, the earliest in
+    ``("horizon", "escape", "affine", "condition")`` is reported
+
+    Parameters
+    ----------
+    q : numpy.ndarray
+        4-Positions, Shape-(..., 4) array
+    p : numpy.ndarray
+        4-Momenta, Shape-(..., 4) array
+    lam : float or numpy.ndarray
+        Affine parameter, broadcastable to ``q.shape[:-1]``
+    r_horizon : float, optional
+        Integration stops, once ``r <= r_horizon``,
+        or ``r`` is no longer finite
+    r_escape : float, optional
+        Integration stops, once ``r >= r_escape``
+    max_affine : float, optional
+        Integration stops, once ``lam >= max_affine``
+    stop_condition : callable, optional
+        Function of ``(q, p)``, returning ``True``, where
+        integration is to be stopped
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer array of shape ``q.shape[:-1]``, indexing into
+        ``_TERMINATION_REASONS``. ``0`` implies no event has occurred.
+
+    """
+    r = q[..., 1]
+    events = list()
+    if r_horizon is not None:
+        # Also catches NaN
+        events.append((1, ~(r > r_horizon)))
+    if r_escape is not None:
+        events.append((2, r >= r_escape))
+    if max_affine is not None:
+        events.append((3, np.broadcast_to(lam >= max_affine, r.shape)))
+    if stop_condition is not None:
+        hit = np.asarray(stop_condition(q, p), dtype=bool)
+        events.append((4, np.broadcast_to(hit, r.shape)))
+
+    codes = np.zeros(r.shape, dtype=int)
+    for code, hit in reversed(events):
+        codes[hit] = code
+
+    return codes
+
+
 def sigma(r, theta, a):
     """
     Returns the value of :math:`r^2 + a^2 * \\cos^2(\\theta)`
@@ -221,3 +310,517 @@ def _kerrnewman(x_vec, *params):
     g[0, 3] = g[3, 0] = -(4 * a * (a2 - dl + r2) * sg / denom)
 
     return g
+
+
+def _sch_dg_dx(x_vec, *params):
+    """
+    Closed-form derivatives of Contravariant Schwarzschild Metric
+    in Spherical Polar coordinates
+    Uses natural units, with :math:`c = G = M = k_e = 1`
+
+    Parameters
+    ----------
+    x_vec : array_like
+        4-Position
+
+    Other Parameters
+    ----------------
+    params : array_like
+        Tuple of parameters to pass to the metric
+
+    Returns
+    -------
+    numpy.ndarray
+        Derivatives of Contravariant Schwarzschild Metric Tensor
+        Indexed as ``[alpha, mu, nu]``, for
+        :math:`\\partial_{\\alpha} g^{\\mu \\nu}`
+
+    """
+    r, th = x_vec[1], x_vec[2]
+    sint, cost = np.sin(th), np.cos(th)
+
+    dg = np.zeros(shape=(4, 4, 4) + np.shape(r + th), dtype=float)
+
+    # Metric depends only on r & theta
+    dg[1, 0, 0] = 2 / (r - 2) ** 2
+    dg[1, 1, 1] = 2 / r ** 2
+    dg[1, 2, 2] = -2 / r ** 3
+    dg[1, 3, 3] = -2 / (r ** 3 * sint ** 2)
+    dg[2, 3, 3] = -2 * cost / (r ** 2 * sint ** 3)
+
+    return dg
+
+
+def _sch_dg_dr(x_vec, *params):
+    """
+    Closed-form derivative w.r.t. ``r`` of Contravariant Schwarzschild
+    Metric in Spherical Polar coordinates, in the equatorial plane,
+    where the other derivatives vanish
+    Uses natural units, with :math:`c = G = M = k_e = 1`
+
+    Parameters
+    ----------
+    x_vec : array_like
+        4-Position, with ``theta = pi / 2``
+
+    Other Parameters
+    ----------------
+    params : array_like
+        Tuple of parameters to pass to the metric
+
+    Returns
+    -------
+    numpy.ndarray
+        Derivative of Contravariant Schwarzschild Metric Tensor
+        Indexed as ``[mu, nu]``, for :math:`\\partial_r g^{\\mu \\nu}`
+
+    """
+    r = x_vec[1]
+
+    dg = np.zeros(shape=(4, 4) + np.shape(r), dtype=float)
+
+    dg[0, 0] = 2 / (r - 2) ** 2
+    dg[1, 1] = 2 / r ** 2
+    dg[2, 2] = dg[3, 3] = -2 / r ** 3
+
+    return dg
+
+
+def _kerrnewman_dg_dx(x_vec, *params):
+    """
+    Closed-form derivatives of Contravariant Kerr-Newman Metric
+    in Boyer-Lindquist coordinates
+    Uses natural units, with :math:`c = G = M = k_e = 1`
+
+    Parameters
+    ----------
+    x_vec : array_like
+        4-Position
+
+    Other Parameters
+    ----------------
+    params : array_like
+        Tuple of parameters to pass to the metric
+        Should contain Spin, ``a``, and Charge, ``Q``
+
+    Returns
+    -------
+    numpy.ndarray
+        Derivatives of Contravariant Kerr-Newman Metric Tensor
+        Indexed as ``[alpha, mu, nu]``, for
+        :math:`\\partial_{\\alpha} g^{\\mu \\nu}`
+
+    """
+    a, Q = params[0], params[1]
+
+    r, th = x_vec[1], x_vec[2]
+    sint, cost = np.sin(th), np.cos(th)
+    sint2 = sint ** 2
+    a2 = a ** 2
+
+    sg, dl = sigma(r, th, a), delta(r, a, Q)
+    # Derivatives of sigma & delta
+    sg_r, sg_th = 2 * r, -2 * a2 * sint * cost
+    dl_r = 2 * r - 2
+
+    D = sg * dl
+    D_r, D_th = sg_r * dl + sg * dl_r, sg_th * dl
+
+    # g^tt = -A / D
+    A = (r ** 2 + a2) ** 2 - a2 * dl * sint2
+    A_r = 4 * r * (r ** 2 + a2) - a2 * dl_r * sint2
+    A_th = -2 * a2 * dl * sint * cost
+    # g^tphi = -a * B / D
+    B = r ** 2 + a2 - dl
+    B_r = 2 * r - dl_r
+    # g^phiphi = C / E
+    C = dl - a2 * sint2
+    C_r, C_th = dl_r, -2 * a2 * sint * cost
+    E = D * sint2
+    E_r, E_th = D_r * sint2, D_th * sint2 + 2 * D * sint * cost
+
+    dg = np.zeros(shape=(4, 4, 4) + np.shape(r + th), dtype=float)
+
+    # Metric depends only on r & theta
+    dg[1, 0, 0] = -(A_r * D - A * D_r) / D ** 2
+    dg[2, 0, 0] = -(A_th * D - A * D_th) / D ** 2
+    dg[1, 1, 1] = (dl_r * sg - dl * sg_r) / sg ** 2
+    dg[2, 1, 1] = -dl * sg_th / sg ** 2
+    dg[1, 2, 2] = -sg_r / sg ** 2
+    dg[2, 2, 2] = -sg_th / sg ** 2
+    dg[1, 3, 3] = (C_r * E - C * E_r) / E ** 2
+    dg[2, 3, 3] = (C_th * E - C * E_th) / E ** 2
+    dg[1, 0, 3] = dg[1, 3, 0] = -a * (B_r * D - B * D_r) / D ** 2
+    dg[2, 0, 3] = dg[2, 3, 0] = a * B * D_th / D ** 2
+
+    return dg
+
+
+def _kerr_dg_dx(x_vec, *params):
+    """
+    Closed-form derivatives of Contravariant Kerr Metric
+    in Boyer-Lindquist coordinates
+    Uses natural units, with :math:`c = G = M = k_e = 1`
+
+    Parameters
+    ----------
+    x_vec : array_like
+        4-Position
+
+    Other Parameters
+    ----------------
+    params : array_like
+        Tuple of parameters to pass to the metric
+        Should contain Spin Parameter, ``a``
+
+    Returns
+    -------
+    numpy.ndarray
+        Derivatives of Contravariant Kerr Metric Tensor
+        Indexed as ``[alpha, mu, nu]``, for
+        :math:`\\partial_{\\alpha} g^{\\mu \\nu}`
+
+    """
+    return _kerrnewman_dg_dx(x_vec, params[0], 0.0)
+
+
+def _kerrnewman_dg_dr(x_vec, *params):
+    """
+    Closed-form derivative w.r.t. ``r`` of Contravariant Kerr-Newman
+    Metric in Boyer-Lindquist coordinates, in the equatorial plane,
+    where the other derivatives vanish
+    Uses natural units, with :math:`c = G = M = k_e = 1`
+
+    Parameters
+    ----------
+    x_vec : array_like
+        4-Position, with ``theta = pi / 2``
+
+    Other Parameters
+    ----------------
+    params : array_like
+        Tuple of parameters to pass to the metric
+        Should contain Spin, ``a``, and Charge, ``Q``
+
+    Returns
+    -------
+    numpy.ndarray
+        Derivative of Contravariant Kerr-Newman Metric Tensor
+        Indexed as ``[mu, nu]``, for :math:`\\partial_r g^{\\mu \\nu}`
+
+    """
+    a, Q = params[0], params[1]
+
+    r = x_vec[1]
+    r2, a2 = r ** 2, a ** 2
+
+    # sigma = r^2, in the equatorial plane
+    dl, dl_r = delta(r, a, Q), 2 * r - 2
+    D = r2 * dl
+    D_r = 2 * r * dl + r2 * dl_r
+    # g^tt = -A / D
+    A = (r2 + a2) ** 2 - a2 * dl
+    A_r = 4 * r * (r2 + a2) - a2 * dl_r
+    # g^tphi = -a * B / D
+    B = r2 + a2 - dl
+    B_r = 2 * r - dl_r
+    # g^phiphi = C / D
+    C = dl - a2
+
+    dg = np.zeros(shape=(4, 4) + np.shape(r), dtype=float)
+
+    dg[0, 0] = -(A_r * D - A * D_r) / D ** 2
+    dg[1, 1] = (dl_r * r - 2 * dl) / r ** 3
+    dg[2, 2] = -2 / r ** 3
+    dg[3, 3] = (dl_r * D - C * D_r) / D ** 2
+    dg[0, 3] = dg[3, 0] = -a * (B_r * D - B * D_r) / D ** 2
+
+    return dg
+
+
+def _kerr_dg_dr(x_vec, *params):
+    """
+    Closed-form derivative w.r.t. ``r`` of Contravariant Kerr Metric
+    in Boyer-Lindquist coordinates, in the equatorial plane,
+    where the other derivatives vanish
+    Uses natural units, with :math:`c = G = M = k_e = 1`
+
+    Parameters
+    ----------
+    x_vec : array_like
+        4-Position, with ``theta = pi / 2``
+
+    Other Parameters
+    ----------------
+    params : array_like
+        Tuple of parameters to pass to the metric
+        Should contain Spin Parameter, ``a``
+
+    Returns
+    -------
+    numpy.ndarray
+        Derivative of Contravariant Kerr Metric Tensor
+        Indexed as ``[mu, nu]``, for :math:`\\partial_r g^{\\mu \\nu}`
+
+    """
+    return _kerrnewman_dg_dr(x_vec, params[0], 0.0)
+
+
+register_metric_derivative(_sch, _sch_dg_dx, equatorial=_sch_dg_dr)
+register_metric_derivative(_kerr, _kerr_dg_dx, equatorial=_kerr_dg_dr)
+register_metric_derivative(
+    _kerrnewman, _kerrnewman_dg_dx, equatorial=_kerrnewman_dg_dr
+)
+
+# Contravariant Metrics, with closed-form derivatives, defined so far
+_METRICS = {
+    "Schwarzschild": _sch,
+    "Kerr": _kerr,
+    "KerrNewman": _kerrnewman,
+}
+
+# Spin & Charge of the Kerr-Newman family, from metric parameters
+_SPIN_CHARGE = {
+    "Schwarzschild": lambda *prms: (0.0, 0.0),
+    "Kerr": lambda a, *prms: (a, 0.0),
+    "KerrNewman": lambda a, Q, *prms: (a, Q),
+}
+
+
+class _BaseMetricFunction:
+    """
+    Contravariant Metric Function, in M-Units, for a ``BaseMetric`` object
+    Covariant Metrics, evaluated in SI Units, are rescaled to M-Units and
+    inverted for all supplied positions at once. Metric objects, whose
+    functions do not broadcast over positions, are evaluated point by point.
+    Derivatives, supplied as ``dg_dx``, follow from the Christoffel Symbols of
+    the metric object, if defined, and from central differences otherwise.
+    The most recent inversion is cached, as integrators evaluate the Metric
+    and its derivatives at the same positions.
+
+    """
+
+    def __init__(self, metric, eps=1e-6):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        metric : ~einsteinpy.metric.BaseMetric
+            Metric object, in coordinates of the form ``(t, r, theta, phi)``
+        eps : float, optional
+            Relative step, used for central differences
+            Defaults to ``1e-6``
+
+        """
+        self.metric = metric
+        self.eps = eps
+        self.__name__ = metric.name
+
+        L = _G * metric.M.value / _c ** 2
+        # (t, r, theta, phi) in M-Units => SI Units
+        self._scale = np.array([L / _c, L, 1.0, 1.0])
+        # SI Units, with signature (+, -, -, -) => M-Units, with (-, +, +, +)
+        self._factor = -np.outer(self._scale, self._scale) / L ** 2
+        # Christoffel Symbols, in SI Units => M-Units
+        self._chl_factor = (
+            self._scale[None, :, None] * self._scale[None, None, :]
+        ) / self._scale[:, None, None]
+        # Functions of the metric object, that broadcast over positions
+        self._vectorized = dict()
+        self._cached = None, None
+
+    def __repr__(self):
+        return f"_BaseMetricFunction({self.metric.name})"
+
+    def __str__(self):
+        return self.__repr__()
+
+    @staticmethod
+    def _positions(x_vec):
+        """
+        Returns the 4-Position(s) ``x_vec``, as a Shape-(K, 4) array
+
+        """
+        return np.asarray(x_vec, dtype=float).T.reshape(-1, 4)
+
+    def _evaluate(self, name, x, shape):
+        """
+        Evaluates ``name``, a function of the metric object, returning
+        Shape-``shape`` arrays, at Shape-(K, 4) positions ``x``, in SI Units,
+        as a Shape-(K, ...) array. All positions are passed at once, unless
+        the function has failed to broadcast over them before.
+
+        """
+        func = getattr(self.metric, name)
+        if x.shape[0] > 1 and self._vectorized.get(name, True):
+            try:
+                f = np.asarray(func(x.T), dtype=float)
+            except (IndexError, TypeError, ValueError):
+                f = None
+            if f is not None and f.shape == shape + x.shape[:1]:
+                self._vectorized[name] = True
+                return np.moveaxis(f, -1, 0)
+            self._vectorized[name] = False
+
+        return np.asarray([func(xi) for xi in x], dtype=float)
+
+    def _covariant(self, x):
+        """
+        Returns the Covariant Metric, in M-Units, at Shape-(K, 4)
+        positions ``x``, as a Shape-(K, 4, 4) array
+
+        """
+        g = self._evaluate("metric_covariant", x * self._scale, (4, 4))
+
+        return g * self._factor
+
+    def _contravariant(self, x):
+        """
+        Returns the Contravariant Metric, in M-Units, at Shape-(K, 4)
+        positions ``x``, as a Shape-(K, 4, 4) array
+
+        """
+        key = (x.shape, x.tobytes())
+        if self._cached[0] != key:
+            self._cached = key, np.linalg.inv(self._covariant(x))
+
+        return self._cached[1]
+
+    def __call__(self, x_vec, *params):
+        """
+        Returns the Contravariant Metric, in M-Units
+
+        Parameters
+        ----------
+        x_vec : array_like
+            4-Position, whose components can be arrays of shape ``(N,)``
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(4, 4) array, or Shape-(4, 4, N) array for ``N`` positions
+
+        """
+        G = self._contravariant(self._positions(x_vec))
+        if np.ndim(x_vec) == 1:
+            return G[0]
+
+        return np.moveaxis(G, 0, -1)
+
+    def dg_dx(self, x_vec, *params):
+        """
+        Returns the derivatives of the Contravariant Metric, in M-Units
+
+        These follow from the Christoffel Symbols of the metric object, using
+        :math:`\\partial_{\\alpha} g^{\\mu \\nu} =
+        -\\Gamma^{\\mu}_{\\alpha \\rho} g^{\\rho \\nu}
+        -\\Gamma^{\\nu}_{\\alpha \\rho} g^{\\mu \\rho}`, unless the metric
+        object lacks them, or is perturbed. Otherwise, central differences of
+        the Covariant Metric, evaluated for all displaced positions at once,
+        are used, with
+        :math:`\\partial_{\\alpha} g^{\\mu \\nu} =
+        -g^{\\mu \\rho} \\partial_{\\alpha} g_{\\rho \\sigma} g^{\\sigma \\nu}`.
+
+        Parameters
+        ----------
+        x_vec : array_like
+            4-Position, whose components can be arrays of shape ``(N,)``
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Derivatives, indexed as ``[alpha, mu, nu]``
+            Shape-(4, 4, 4) array, or Shape-(4, 4, 4, N) array for ``N`` positions
+
+        """
+        x = self._positions(x_vec)
+        G = self._contravariant(x)
+
+        if self.metric.christoffels is not None and not self.metric.perturbation:
+            chl = self._evaluate("christoffels", x * self._scale, (4, 4, 4))
+            chl *= self._chl_factor
+            # Indexed as [point, alpha, mu, nu]
+            dg = -np.einsum("kmar,krn->kamn", chl, G)
+            dg += np.swapaxes(dg, -1, -2)
+        else:
+            h = self.eps * np.maximum(1.0, np.abs(x))
+            # Displaced positions, indexed as [sign, alpha, point]
+            dx = np.einsum("ab,kb->akb", np.eye(4), h)
+            x_h = np.stack([x + dx, x - dx]).reshape(-1, 4)
+            cov = self._covariant(x_h).reshape(2, 4, -1, 4, 4)
+            dcov = (cov[0] - cov[1]) / (2 * h.T[:, :, None, None])
+            dg = -np.einsum("kmr,akrs,ksn->kamn", G, dcov, G)
+
+        if np.ndim(x_vec) == 1:
+            return dg[0]
+
+        return np.moveaxis(dg, 0, -1)
+
+
+def _metric_function(metric, metric_params):
+    """
+    Utility function to resolve ``metric`` into a
+    Contravariant Metric Function, in M-Units
+    Metric objects for Schwarzschild, Kerr and Kerr-Newman spacetimes
+    are resolved into the closed-form metrics, with their parameters
+    converted to M-Units.
+
+    Parameters
+    ----------
+    metric : str or callable or ~einsteinpy.metric.BaseMetric
+        Name of a closed-form metric, a Contravariant Metric Function,
+        or a metric object
+    metric_params : array_like
+        Tuple of parameters to pass to the metric
+        Ignored for metric objects
+
+    Returns
+    -------
+    str
+        Name of the metric
+    callable
+        Metric (Contravariant) Function
+    tuple
+        Parameters to pass to the metric
+
+    Raises
+    ------
+    NotImplementedError
+        If ``metric`` is neither a supported name,
+        nor a callable, nor a metric object
+
+    """
+    if isinstance(metric, str):
+        if metric not in _METRICS:
+            raise NotImplementedError(
+                f"'{metric}' is unsupported. Currently, these metrics are supported:\
+                \n1. Schwarzschild\n2. Kerr\n3. KerrNewman"
+            )
+        if metric == "Schwarzschild":
+            metric_params = (0.0,)
+        return metric, _METRICS[metric], metric_params
+
+    if isinstance(metric, BaseMetric):
+        system = metric.coords.system
+        if isinstance(metric, KerrNewman) and system == "BoyerLindquist":
+            # Geometrized Charge, in M-Units
+            L = _G * metric.M.value / _c ** 2
+            Q = metric.Q.value * np.sqrt(_G * _Cc) / _c ** 2 / L
+            return "KerrNewman", _kerrnewman, (metric.a.value, Q)
+        if isinstance(metric, Kerr) and system == "BoyerLindquist":
+            return "Kerr", _kerr, (metric.a.value,)
+        if isinstance(metric, Schwarzschild) and system == "Spherical":
+            return "Schwarzschild", _sch, (0.0,)
+
+        g = _BaseMetricFunction(metric)
+        return g.__name__, g, ()
+
+    if callable(metric):
+        name = getattr(metric, "__name__", type(metric).__name__)
+        return name, metric, tuple(metric_params)
+
+    raise NotImplementedError(
+        f"Metric of type '{type(metric).__name__}' is unsupported. Supply "
+        "the name of a metric, a Contravariant Metric Function, or a metric object."
+    )
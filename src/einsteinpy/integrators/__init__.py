@@ -1,4 +1,18 @@
-from .fantasy import GeodesicIntegrator
+from .autotune import autotune
+from .dense import DenseOutput
+from .fantasy import BatchGeodesicIntegrator, GeodesicIntegrator
 from .runge_kutta import RK45, RK4naive
+from .sink import MemmapSink, load_trajectory
+from .utils import register_metric_derivative
 
-__all__ = ["GeodesicIntegrator", "RK45", "RK4naive"]
+__all__ = [
+    "BatchGeodesicIntegrator",
+    "DenseOutput",
+    "GeodesicIntegrator",
+    "MemmapSink",
+    "RK45",
+    "RK4naive",
+    "autotune",
+    "load_trajectory",
+    "register_metric_derivative",
+]
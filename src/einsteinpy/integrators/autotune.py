@@ -0,0 +1,337 @@
+"""
+Selection of integration settings, ``(order, delta, omega)``, of
+``GeodesicIntegrator``, for a target accuracy, from short pilot integrations
+
+Each candidate is run over the same span of affine parameter, and is
+accepted, if the drift of the Hamiltonian constraint,
+:math:`\\max |g^{\\mu \\nu} p_{\\mu} p_{\\nu} - const|`, stays within tolerance.
+Among accepted candidates, the one with the smallest wall time per unit
+affine parameter is chosen. Pilots run on the backend, and with the
+integrator settings, e.g. the composition scheme, that will be used, so that
+both timing and error are those of the actual integration. Choices are cached
+per metric, metric parameters, orbit class, backend and settings, so that
+later geodesics of the same kind skip the pilots.
+
+"""
+import time
+import warnings
+
+import numpy as np
+
+from .fantasy import BatchGeodesicIntegrator, GeodesicIntegrator
+from .fantasy_jit import _kn_constraint, _kn_integrate, _kn_integrate_batch
+from .utils import _composition_weights
+
+# Settings, chosen by ``autotune``
+# Keyed by (metric, metric parameters, orbit class, tolerance, candidates,
+# backend, integrator settings)
+_AUTOTUNE_CACHE = dict()
+
+
+def orbit_class(q0, p0, time_like=True):
+    """
+    Classifies geodesics by their kind and initial radius, for caching
+    of integration settings. Time-like geodesics are ``"bound"`` for
+    :math:`E = -p_t < 1`, and ``"unbound"`` otherwise. Null-like
+    geodesics are ``"null"``. The radius enters through its octave,
+    :math:`\\lfloor \\log_2 r \\rfloor`, as step-sizes scale with it.
+
+    Parameters
+    ----------
+    q0 : array_like
+        Initial 4-Position
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` geodesics
+    p0 : array_like
+        Initial 4-Momentum
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` geodesics
+    time_like : bool, optional
+        Determines type of Geodesic
+        ``True`` for Time-like geodesics
+        ``False`` for Null-like geodesics
+        Defaults to ``True``
+
+    Returns
+    -------
+    tuple
+        Sorted, distinct ``(kind, octave)`` pairs of the geodesics
+
+    """
+    q0 = np.asarray(q0, dtype=float).reshape(-1, 4)
+    p0 = np.asarray(p0, dtype=float).reshape(-1, 4)
+
+    if time_like:
+        kinds = np.where(-p0[:, 0] < 1, "bound", "unbound")
+    else:
+        kinds = np.full(q0.shape[0], "null")
+    octaves = np.floor(np.log2(q0[:, 1])).astype(int)
+
+    return tuple(sorted({(str(k), int(o)) for k, o in zip(kinds, octaves)}))
+
+
+def _spin_charge(metric, metric_params):
+    """
+    Returns the Spin and Charge of ``metric``, for the compiled
+    kernels, which only support the closed-form metrics
+
+    """
+    # Imported here, as the Geodesic Module depends on this one
+    from einsteinpy.geodesic.utils import _METRICS, _SPIN_CHARGE
+
+    for name, g in _METRICS.items():
+        if g is metric:
+            prms = tuple(metric_params) + (0.0, 0.0)
+            return _SPIN_CHARGE[name](*prms)
+
+    raise NotImplementedError(
+        "The 'numba' backend is only available for the "
+        "Schwarzschild, Kerr and KerrNewman metrics."
+    )
+
+
+def _pilot(
+    metric,
+    metric_params,
+    q0,
+    p0,
+    time_like,
+    order,
+    delta,
+    omega,
+    steps,
+    backend="python",
+    settings=None,
+):
+    """
+    Runs a pilot integration, on ``backend``, with further integrator
+    ``settings``, and returns the drift of the Hamiltonian constraint,
+    which is ``inf``, if integration diverged, along with the wall time per step
+
+    """
+    settings = dict() if settings is None else settings
+    with warnings.catch_warnings(), np.errstate(all="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if backend == "numba":
+            a, Q = _spin_charge(metric, metric_params)
+            weights = _composition_weights(order, settings.get("scheme", "triple_jump"))
+            kernel = _kn_integrate if q0.ndim == 1 else _kn_integrate_batch
+            # Compiles the kernel, if needed, before timing it
+            kernel(q0, p0, a, Q, 1, delta, omega, weights)
+            start = time.perf_counter()
+            results = kernel(q0, p0, a, Q, steps, delta, omega, weights)
+            elapsed = time.perf_counter() - start
+            if not np.all(np.isfinite(results)):
+                return np.inf, elapsed / steps
+            violation = _kn_constraint(results.reshape(-1, 8), a, Q) + int(time_like)
+        else:
+            integrator = GeodesicIntegrator if q0.ndim == 1 else BatchGeodesicIntegrator
+            geodint = integrator(
+                metric=metric,
+                metric_params=metric_params,
+                q0=q0,
+                p0=p0,
+                time_like=time_like,
+                steps=steps,
+                delta=delta,
+                order=order,
+                omega=omega,
+                suppress_warnings=True,
+                constraint_check="deferred",
+                **settings,
+            )
+            start = time.perf_counter()
+            for _ in range(steps):
+                geodint.step()
+            elapsed = time.perf_counter() - start
+            if not np.all(np.isfinite(geodint.results)):
+                return np.inf, elapsed / steps
+            violation = geodint.check_constraint(warn=False)[0]
+
+    return float(np.abs(violation).max()), elapsed / steps
+
+
+def autotune(
+    metric,
+    metric_params,
+    q0,
+    p0,
+    tol,
+    time_like=True,
+    orders=(2, 4, 6, 8),
+    deltas=(2.0, 1.0, 0.5, 0.25, 0.125),
+    omegas=(1.0, 0.1, 0.01),
+    pilot_steps=20,
+    cache=True,
+    backend="python",
+    **kwargs,
+):
+    """
+    Selects the cheapest ``(order, delta, omega)``, for which the
+    Hamiltonian constraint drifts by at most ``tol``, over pilot
+    integrations of ``pilot_steps`` steps of the largest step-size
+
+    For each order and omega, step-sizes are tried from largest to
+    smallest, until one is accepted, or the cost, estimated from the wall
+    time per step, exceeds that of the best candidate so far.
+
+    Parameters
+    ----------
+    metric : callable
+        Metric (Contravariant) Function
+    metric_params : array_like
+        Tuple of parameters to pass to the metric
+        E.g., ``(a,)`` for Kerr
+    q0 : array_like
+        Initial 4-Position
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` geodesics
+    p0 : array_like
+        Initial 4-Momentum
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` geodesics
+    tol : float
+        Tolerance on the drift of the Hamiltonian constraint
+    time_like : bool, optional
+        Determines type of Geodesic
+        ``True`` for Time-like geodesics
+        ``False`` for Null-like geodesics
+        Defaults to ``True``
+    orders : tuple, optional
+        Candidate integration orders
+        Defaults to ``(2, 4, 6, 8)``
+    deltas : tuple, optional
+        Candidate step-sizes
+        Defaults to ``(2.0, 1.0, 0.5, 0.25, 0.125)``
+    omegas : tuple, optional
+        Candidate couplings between Hamiltonian Flows
+        Defaults to ``(1.0, 0.1, 0.01)``
+    pilot_steps : int, optional
+        Number of pilot steps with the largest step-size
+        Smaller step-sizes take proportionally more steps
+        Defaults to ``20``
+    cache : bool, optional
+        Whether to reuse, and store, settings chosen for the same metric,
+        metric parameters, orbit class, tolerance and candidates
+        See ``orbit_class``
+        Defaults to ``True``
+    backend : str, optional
+        Backend, on which pilots are run and timed, ``"python"``,
+        i.e. ``GeodesicIntegrator``, or ``"numba"``, i.e. the compiled
+        kernels, for the Schwarzschild, Kerr and KerrNewman metrics
+        Defaults to ``"python"``
+    kwargs : dict
+        Further keyword parameters of ``GeodesicIntegrator``, e.g.
+        ``scheme``, ``equatorial`` or ``adaptive``, with which pilots are run
+        Only ``scheme`` is supported with the ``"numba"`` backend
+
+    Returns
+    -------
+    dict
+        ``"order"``, ``"delta"`` and ``"omega"`` of the chosen settings,
+        along with their constraint ``"drift"`` and wall ``"time_per_step"``
+
+    Raises
+    ------
+    ValueError
+        If ``tol`` or ``pilot_steps`` are not positive
+    NotImplementedError
+        If ``backend`` is not supported, or if ``kwargs`` contain
+        settings, other than ``scheme``, with the ``"numba"`` backend
+
+    Warns
+    -----
+    RuntimeWarning
+        If no candidate meets ``tol``. The candidate with
+        the smallest drift is returned instead, and not cached.
+
+    """
+    if tol <= 0:
+        raise ValueError(f"Tolerance must be positive. Supplied: {tol}")
+    if int(pilot_steps) != pilot_steps or pilot_steps < 1:
+        raise ValueError(
+            f"pilot_steps must be a positive integer. Supplied: {pilot_steps}"
+        )
+    if backend not in ("python", "numba"):
+        raise NotImplementedError(
+            f"'{backend}' backend does not support autotuning. "
+            "Use 'python' or 'numba'."
+        )
+    kwargs = dict({"scheme": "triple_jump"}, **kwargs)
+    if backend == "numba" and set(kwargs) - {"scheme"}:
+        raise NotImplementedError(
+            f"{sorted(set(kwargs) - {'scheme'})} are unsupported with "
+            "the 'numba' backend. Only 'scheme' is supported."
+        )
+
+    q0 = np.asarray(q0, dtype=float)
+    p0 = np.asarray(p0, dtype=float)
+    deltas = tuple(sorted(deltas, reverse=True))
+    key = (
+        metric,
+        tuple(np.ravel(metric_params).tolist()),
+        time_like,
+        orbit_class(q0, p0, time_like),
+        tol,
+        tuple(orders),
+        deltas,
+        tuple(omegas),
+        backend,
+        tuple(sorted(kwargs.items())),
+    )
+    if cache and key in _AUTOTUNE_CACHE:
+        return dict(_AUTOTUNE_CACHE[key])
+
+    span = int(pilot_steps) * deltas[0]
+    best, fallback = None, None
+    # Wall time per step, for each order
+    timing = dict()
+    for order in orders:
+        for omega in omegas:
+            for delta in deltas:
+                if (
+                    best is not None
+                    and order in timing
+                    and timing[order] / delta >= best["time_per_step"] / best["delta"]
+                ):
+                    break
+
+                steps = int(np.ceil(span / delta))
+                drift, tps = _pilot(
+                    metric,
+                    metric_params,
+                    q0,
+                    p0,
+                    time_like,
+                    order,
+                    delta,
+                    omega,
+                    steps,
+                    backend,
+                    kwargs,
+                )
+                timing[order] = tps
+                candidate = {
+                    "order": order,
+                    "delta": delta,
+                    "omega": omega,
+                    "drift": drift,
+                    "time_per_step": tps,
+                }
+                if fallback is None or drift < fallback["drift"]:
+                    fallback = candidate
+                if drift <= tol:
+                    if best is None or (
+                        tps / delta < best["time_per_step"] / best["delta"]
+                    ):
+                        best = candidate
+                    break
+
+    if best is None:
+        warnings.warn(
+            f"No candidate settings meet tolerance = {tol}. Using those with "
+            f"the smallest drift of the Hamiltonian constraint, {fallback['drift']}.",
+            RuntimeWarning,
+        )
+        return fallback
+
+    if cache:
+        _AUTOTUNE_CACHE[key] = dict(best)
+
+    return best
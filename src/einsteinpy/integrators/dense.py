@@ -0,0 +1,229 @@
+"""
+Dense output for computed geodesics
+
+Stored states are interpolated with cubic Hermite polynomials, whose
+derivatives at the stored states follow from Hamilton's equations,
+:math:`\\dot{q}^{\\mu} = g^{\\mu \\nu} p_{\\nu}` and
+:math:`\\dot{p}_{\\mu} =
+-\\frac{1}{2} \\partial_{\\mu} g^{\\alpha \\beta} p_{\\alpha} p_{\\beta}`.
+
+"""
+import numpy as np
+
+from .utils import _dg_dx, _metric
+
+
+def _hamilton(g, g_prms, y):
+    """
+    Returns the derivatives of (4-Position, 4-Momentum),
+    w.r.t. the affine parameter, from Hamilton's equations
+
+    Parameters
+    ----------
+    g : callable
+        Metric (Contravariant) Function
+    g_prms : array_like
+        Tuple of parameters to pass to the metric
+    y : ~numpy.ndarray
+        (4-Position, 4-Momentum), with shape (K, 8)
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Derivatives of ``y``, with shape (K, 8)
+
+    """
+    q, p = y[:, :4], y[:, 4:]
+    dy = np.empty_like(y)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dy[:, :4] = np.einsum("...ij,...j->...i", _metric(g, g_prms, q), p)
+        dg = _dg_dx(g, g_prms, q)
+        dy[:, 4:] = -0.5 * np.einsum("aij...,...i,...j->...a", dg, p, p)
+
+    return dy
+
+
+def _hermite(y0, y1, f0, f1, h, s):
+    """
+    Evaluates the cubic Hermite polynomial, that matches values
+    ``y0``, ``y1`` and derivatives ``f0``, ``f1`` at the ends of an
+    interval of length ``h``, at the fraction ``s`` of the interval
+
+    """
+    s2 = s * s
+    h00 = 1 + s2 * (2 * s - 3)
+    h10 = s * (1 - s) ** 2
+    h01 = s2 * (3 - 2 * s)
+    h11 = s2 * (s - 1)
+
+    return h00 * y0 + h10 * h * f0 + h01 * y1 + h11 * h * f1
+
+
+class DenseOutput:
+    """
+    Continuous (dense) output of computed geodesics, that can be
+    evaluated at arbitrary values of the affine parameter,
+    or of coordinate time, in a vectorized way
+    Between stored states, (4-Position, 4-Momentum) are interpolated
+    with cubic Hermite polynomials, so that their local error is
+    of order 4 in the spacing of stored states.
+
+    """
+
+    def __init__(self, metric, metric_params, affine, states, output=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        metric : callable
+            Metric (Contravariant) Function
+        metric_params : array_like
+            Tuple of parameters to pass to the metric
+            E.g., ``(a,)`` for Kerr
+        affine : array_like
+            Shape-(M,) array, containing the (increasing)
+            affine parameter of each stored state
+        states : array_like
+            Shape-(M, 8) array, or Shape-(M, N, 8) array for ``N``
+            geodesics, containing (4-Position, 4-Momentum) of each
+            stored state, in the coordinates of ``metric``
+            States of geodesics, that have terminated, are ``NaN``
+        output : callable, optional
+            Applied to evaluated (4-Position, 4-Momentum) arrays,
+            e.g. to convert coordinates
+            Defaults to ``None``
+
+        Raises
+        ------
+        ValueError
+            If fewer than 2 states are supplied, or ``affine``
+            does not match ``states``
+
+        """
+        affine = np.asarray(affine, dtype=float)
+        states = np.asarray(states, dtype=float)
+        if affine.ndim != 1 or states.shape[:1] != affine.shape or affine.size < 2:
+            raise ValueError(
+                "Dense output requires at least 2 states, "
+                "with one affine parameter each. "
+                f"Supplied shapes: {affine.shape}, {states.shape}"
+            )
+
+        self.affine = affine
+        self._batch = states.shape[1:-1]
+        self._y = states.reshape(affine.size, -1, 8)
+        self._f = _hamilton(metric, metric_params, self._y.reshape(-1, 8))
+        self._f = self._f.reshape(self._y.shape)
+        self._output = output
+
+    def __repr__(self):
+        return (
+            f"DenseOutput(affine=[{self.affine[0]}, {self.affine[-1]}], "
+            f"states={self.affine.size})"
+        )
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __call__(self, lam):
+        """
+        Evaluates (4-Position, 4-Momentum) at affine parameter(s) ``lam``
+
+        Parameters
+        ----------
+        lam : float or array_like
+            Affine parameter(s)
+            Values outside the stored range evaluate to ``NaN``
+
+        Returns
+        -------
+        ~numpy.ndarray
+            (4-Position, 4-Momentum), with shape ``lam.shape + (8,)``,
+            or ``(N,) + lam.shape + (8,)`` for ``N`` geodesics
+
+        """
+        lam = np.asarray(lam, dtype=float)
+        x = lam.reshape(-1, 1)
+        K = self._y.shape[1]
+
+        i = np.searchsorted(self.affine, x[:, 0], side="right") - 1
+        i = np.clip(i, 0, self.affine.size - 2)
+        i = np.broadcast_to(i[:, None], (x.shape[0], K))
+        h = self.affine[i + 1] - self.affine[i]
+        s = (x - self.affine[i]) / h
+        outside = (x < self.affine[0]) | (x > self.affine[-1])
+
+        return self._evaluate(i, h, s, outside, lam.shape)
+
+    def at_time(self, t):
+        """
+        Evaluates (4-Position, 4-Momentum) at coordinate time(s) ``t``
+        The affine parameter, at which each geodesic reaches ``t``,
+        is found by inverting the interpolated coordinate time,
+        with Newton's method.
+
+        Parameters
+        ----------
+        t : float or array_like
+            Coordinate time(s)
+            Values outside the stored range of a geodesic evaluate to ``NaN``
+
+        Returns
+        -------
+        ~numpy.ndarray
+            (4-Position, 4-Momentum), with shape ``t.shape + (8,)``,
+            or ``(N,) + t.shape + (8,)`` for ``N`` geodesics
+
+        """
+        t = np.asarray(t, dtype=float)
+        x = t.reshape(-1, 1)
+        M, K = self._y.shape[:2]
+        tk, dtk = self._y[..., 0], self._f[..., 0]
+
+        # Coordinate time increases along each geodesic
+        i = np.empty((x.shape[0], K), dtype=int)
+        for k in range(K):
+            i[:, k] = np.searchsorted(tk[:, k], x[:, 0], side="right") - 1
+        i = np.clip(i, 0, M - 2)
+        k = np.arange(K)
+        h = self.affine[i + 1] - self.affine[i]
+        t0, t1 = tk[i, k], tk[i + 1, k]
+        f0, f1 = dtk[i, k], dtk[i + 1, k]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            s = (x - t0) / (t1 - t0)
+            for _ in range(8):
+                s2 = s * s
+                dt = (
+                    6 * s * (s - 1) * (t0 - t1)
+                    + (3 * s2 - 4 * s + 1) * h * f0
+                    + (3 * s2 - 2 * s) * h * f1
+                )
+                s = s - (_hermite(t0, t1, f0, f1, h, s) - x) / dt
+            outside = (x < tk[0]) | (x > np.nanmax(tk, axis=0))
+
+        return self._evaluate(i, h, s, outside, t.shape)
+
+    def _evaluate(self, i, h, s, outside, shape):
+        """
+        Evaluates the interpolants of intervals ``i``, with lengths ``h``,
+        at fractions ``s`` of the intervals, all with shape (Q, K),
+        and returns the states, with query shape ``shape``
+        States, that are ``outside`` of the stored range, are ``NaN``
+
+        """
+        k = np.arange(self._y.shape[1])
+        y0, y1 = self._y[i, k], self._y[i + 1, k]
+        f0, f1 = self._f[i, k], self._f[i + 1, k]
+        y = _hermite(y0, y1, f0, f1, h[..., None], s[..., None])
+        y[np.broadcast_to(outside, s.shape)] = np.nan
+
+        # Batch axes first, as in trajectories
+        n, m = len(shape), len(self._batch)
+        y = y.reshape(shape + self._batch + (8,))
+        y = np.moveaxis(y, tuple(range(n)), tuple(range(m, m + n)))
+        if self._output is not None:
+            y = self._output(y)
+
+        return y
@@ -2,7 +2,30 @@ import warnings
 
 import numpy as np
 
-from .utils import _Z, _flow_A, _flow_B, _flow_mixed
+from .sink import MemmapSink, load_trajectory
+from .utils import (
+    _EQUATORIAL,
+    _SCHEMES,
+    _Z,
+    MetricCache,
+    _composition_weights,
+    _constraint_summary,
+    _flow_A,
+    _flow_B,
+    _flow_mixed,
+    _metric,
+    _warn_constraint,
+)
+
+
+def _grow(arr):
+    """
+    Doubles the length of ``arr`` along the first axis
+
+    """
+    return np.concatenate(
+        (arr, np.empty_like(arr, shape=(max(len(arr), 1),) + arr.shape[1:]))
+    )
 
 
 class GeodesicIntegrator:
@@ -10,7 +33,8 @@ class GeodesicIntegrator:
     Geodesic Integrator, based on [1]_.
     This module uses Forward Mode Automatic Differentiation
     to calculate metric derivatives to machine precision
-    leading to stable simulations.
+    leading to stable simulations. Closed-form derivatives, registered
+    through ``register_metric_derivative``, are used instead, if available.
 
     References
     ----------
@@ -18,6 +42,15 @@ class GeodesicIntegrator:
         "FANTASY: User-Friendly Symplectic Geodesic Integrator
         for Arbitrary Metrics with Automatic Differentiation";
         `arXiv:2010.02237 <https://arxiv.org/abs/2010.02237>`__
+    .. [2] Yoshida, Haruo,
+        "Construction of higher order symplectic integrators";
+         Physics Letters A, vol. 150, no. 5-7, pp. 262-268, 1990.
+        `DOI: <https://doi.org/10.1016/0375-9601(90)90092-3>`__
+    .. [3] Kahan, William and Li, Ren-Cang;
+        "Composition constants for raising the orders of
+        unconventional schemes for ordinary differential equations";
+        Mathematics of Computation, vol. 66, no. 219, pp. 1089-1099, 1997.
+        `DOI: <https://doi.org/10.1090/S0025-5718-97-00873-9>`__
 
     """
 
@@ -36,6 +69,20 @@ class GeodesicIntegrator:
         order=2,
         omega=1.0,
         suppress_warnings=False,
+        store_shadow=False,
+        adaptive=False,
+        adaptive_tol=1e-6,
+        delta_min=None,
+        delta_max=None,
+        out=None,
+        metadata=None,
+        record_every=1,
+        record_dt=None,
+        scheme="triple_jump",
+        cache_metric=True,
+        constraint_check="step",
+        check_every=1,
+        equatorial=False,
     ):
         """
         Constructor
@@ -87,19 +134,92 @@ class GeodesicIntegrator:
             Warnings are shown for every step, where numerical errors
             exceed specified tolerance (controlled by ``rtol`` and ``atol``)
             Defaults to ``False``
+        store_shadow : bool
+            Whether to store the second (shadow) copy of the phase space,
+            ``(q2, p2)``, that is evolved alongside ``(q1, p1)``
+            Defaults to ``False``
+        adaptive : bool
+            Whether to adapt the step-size, based on a step doubling
+            estimate of the local error, i.e. the difference between one
+            step of size ``delta`` and two steps of size ``delta / 2``.
+            Steps, whose error exceeds ``adaptive_tol``, are rejected
+            and retried with a smaller step-size.
+            In this case, ``delta`` is only the initial step-size.
+            Defaults to ``False``
+        adaptive_tol : float
+            Tolerance on the (relative) local error per step,
+            used if ``adaptive`` is set
+            Defaults to ``1e-6``
+        delta_min : float, optional
+            Smallest step-size, used if ``adaptive`` is set
+            Defaults to ``1e-3 * delta``
+        delta_max : float, optional
+            Largest step-size, used if ``adaptive`` is set
+            Defaults to ``10 * delta``
+        out : str or os.PathLike, optional
+            Path to a ``.npy`` file, into which ``results`` are written,
+            through a growable ``numpy.memmap``, instead of memory
+            Call ``close`` after integration, to finalize the file.
+            Results can then be reopened with ``load_trajectory``.
+            Defaults to ``None``
+        metadata : dict, optional
+            Additional JSON-serializable metadata, written to the
+            sidecar of ``out``, alongside integrator settings
+            Defaults to ``None``
+        record_every : int, optional
+            Only every ``record_every``-th step is stored
+            Defaults to ``1``
+        record_dt : float, optional
+            Minimum coordinate time between stored steps
+            For ``N`` geodesics, the coordinate time of the
+            furthest advanced geodesic is used
+            Defaults to ``None``
+        scheme : str, optional
+            Composition of Order 2 steps, used for orders 6 and 8
+            ``"triple_jump"`` composes them recursively, with 9 and 27
+            Order 2 steps. ``"yoshida"`` uses the optimized compositions
+            of Yoshida (1990), with 7 and 15 steps, and ``"kahan_li"``
+            those of Kahan & Li (1997), with 9 and 17 steps, which have
+            the smallest error, at a given cost
+            Defaults to ``"triple_jump"``
+        cache_metric : bool, optional
+            Whether to cache Metric evaluations within each step, so that
+            positions, that are visited repeatedly by the partial flows
+            and the stability check, are only evaluated once
+            See ``metric_cache`` for hit counts
+            Defaults to ``True``
+        constraint_check : str, optional
+            How the Hamiltonian constraint is checked, unless
+            ``suppress_warnings`` is set. ``"step"`` checks it after every
+            ``check_every``-th step, and warns for each step, at which
+            tolerance is exceeded. ``"deferred"`` skips these checks,
+            so that ``check_constraint`` can evaluate the constraint for
+            all stored steps at once, after integration
+            Defaults to ``"step"``
+        check_every : int, optional
+            Number of steps between checks, with ``constraint_check="step"``
+            Defaults to ``1``
+        equatorial : bool, optional
+            Whether the geodesics lie in the equatorial plane, of a metric,
+            that is reflection-symmetric about it. Only ``(t, r, phi)`` and
+            their momenta are then integrated, with ``theta = pi / 2`` and
+            ``p_theta = 0`` held fixed, and Metric derivatives w.r.t.
+            ``theta`` are not computed. For metrics with an equatorial
+            derivative, registered through ``register_metric_derivative``,
+            only those w.r.t. ``r`` are computed
+            Defaults to ``False``
 
         Raises
         ------
         NotImplementedError
-            If ``order`` is not in [2, 4, 6, 8]
+            If ``order`` is not in [2, 4, 6, 8], or ``scheme``
+            or ``constraint_check`` are not supported
+        ValueError
+            If ``record_every`` or ``check_every`` are not positive integers,
+            or if ``equatorial`` is set, and the initial conditions
+            are not equatorial
 
         """
-        ORDERS = {
-            2: self._ord_2,
-            4: self._ord_4,
-            6: self._ord_6,
-            8: self._ord_8,
-        }
         self.metric = metric
         self.metric_params = metric_params
         self.q0 = q0
@@ -108,19 +228,85 @@ class GeodesicIntegrator:
         self.steps = steps
         self.delta = delta
         self.omega = omega
-        if order not in ORDERS:
-            raise NotImplementedError(
-                f"Order {order} integrator has not been implemented."
-            )
-        self.order = order
-        self.integrator = ORDERS[order]
+        self._set_order(order, scheme)
         self.rtol = rtol
         self.atol = atol
         self.suppress_warnings = suppress_warnings
 
+        if equatorial:
+            q0_ = np.asarray(q0, dtype=float)
+            p0_ = np.asarray(p0, dtype=float)
+            if not (
+                np.allclose(q0_[..., 2], np.pi / 2, rtol=0, atol=1e-12)
+                and np.allclose(p0_[..., 2], 0.0, rtol=0, atol=1e-12)
+            ):
+                raise ValueError(
+                    "Equatorial integration requires theta = pi / 2 "
+                    "and p_theta = 0, initially."
+                )
+        self.equatorial = equatorial
+        self._wrt = _EQUATORIAL if equatorial else None
+
+        self._cache = (
+            MetricCache(metric, metric_params, wrt=self._wrt) if cache_metric else None
+        )
+
+        self.store_shadow = store_shadow
+        self.adaptive = adaptive
+        self.adaptive_tol = adaptive_tol
+        self.delta_min = 1e-3 * delta if delta_min is None else delta_min
+        self.delta_max = 10 * delta if delta_max is None else delta_max
+
+        if int(record_every) != record_every or record_every < 1:
+            raise ValueError(
+                f"record_every must be a positive integer. Supplied: {record_every}"
+            )
+        self.record_every = int(record_every)
+        self.record_dt = record_dt
+
+        if constraint_check not in ("step", "deferred"):
+            raise NotImplementedError(
+                f"'{constraint_check}' constraint check is unsupported. "
+                "Use 'step' or 'deferred'."
+            )
+        if int(check_every) != check_every or check_every < 1:
+            raise ValueError(
+                f"check_every must be a positive integer. Supplied: {check_every}"
+            )
+        self.constraint_check = constraint_check
+        self.check_every = int(check_every)
+
         self.step_num = 0
+        # Affine parameter, after `step_num` steps
+        self.affine = 0.0
         self.res_list = [q0, p0, q0, p0]
-        self.results = list()
+        # Coordinate time, when a step was last stored
+        self._t_last = np.max(np.asarray(q0, dtype=float)[..., 0])
+        # Preallocated storage for (q1, p1) and, optionally, (q2, p2)
+        shape = (steps,) + np.shape(q0)[:-1] + (8,)
+        self._sink = None
+        if out is None:
+            self._results = np.empty(shape, dtype=float)
+        else:
+            info = {
+                "metric": getattr(metric, "__name__", str(metric)),
+                "metric_params": np.asarray(metric_params, dtype=float).tolist(),
+                "order": order,
+                "delta": delta,
+                "omega": omega,
+                "time_like": time_like,
+                "q0": np.asarray(q0, dtype=float).tolist(),
+                "p0": np.asarray(p0, dtype=float).tolist(),
+            }
+            info.update(dict() if metadata is None else metadata)
+            self._sink = MemmapSink(out, shape, metadata=info)
+            self._results = self._sink.array
+        self._shadow_results = np.empty(shape, dtype=float) if store_shadow else None
+        self._step_sizes = np.empty(steps, dtype=float)
+        self._step_indices = np.empty(steps, dtype=int)
+        self._affine = np.empty(steps, dtype=float)
+        # Number of steps in storage
+        self._n_stored = 0
 
     def __str__(self):
         return f"""{self.__class__.__name__}(\n\
@@ -135,12 +321,303 @@ class GeodesicIntegrator:
                 order : {self.order},\n\
                 rtol : {self.rtol},\n\
                 atol : {self.atol}\n\
-                suppress_warnings : {self.suppress_warnings}
+                suppress_warnings : {self.suppress_warnings}\n\
+                store_shadow : {self.store_shadow}\n\
+                adaptive : {self.adaptive}
             )"""
 
     def __repr__(self):
         return self.__str__()
 
+    @property
+    def results(self):
+        """
+        Returns the (4-Position, 4-Momentum), i.e. ``(q1, p1)``,
+        after each step, as a view into the integrator's storage
+        Only steps after the last chunk, yielded by ``iter_chunks``,
+        are stored
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(n, 8) array, or Shape-(n, N, 8) array
+            for ``N`` geodesics, where ``n`` is the number of stored steps
+
+        """
+        return self._results[: self._n_stored]
+
+    @property
+    def shadow_results(self):
+        """
+        Returns the shadow copy of the phase space, i.e. ``(q2, p2)``,
+        after each step, if ``store_shadow`` is set
+
+        Returns
+        -------
+        ~numpy.ndarray or None
+            Shape-(n, 8) array, or Shape-(n, N, 8) array
+            for ``N`` geodesics, where ``n`` is the number of stored steps
+            ``None``, if ``store_shadow`` is not set
+
+        """
+        if self._shadow_results is None:
+            return None
+
+        return self._shadow_results[: self._n_stored]
+
+    @property
+    def step_sizes(self):
+        """
+        Returns the step-size, used for each stored step
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(n,) array, where ``n`` is the number of stored steps
+
+        """
+        return self._step_sizes[: self._n_stored]
+
+    @property
+    def metric_cache(self):
+        """
+        Returns the cache of Metric evaluations, whose ``hits``,
+        ``misses`` and ``hit_rate`` show the number of saved
+        Metric evaluations, or ``None``, if caching is disabled
+
+        """
+        return self._cache
+
+    @property
+    def step_indices(self):
+        """
+        Returns the (zero-based) index of each stored step
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(n,) array, where ``n`` is the number of stored steps
+
+        """
+        return self._step_indices[: self._n_stored]
+
+    @property
+    def affine_parameters(self):
+        """
+        Returns the affine parameter after each stored step
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(n,) array, where ``n`` is the number of stored steps
+
+        """
+        return self._affine[: self._n_stored]
+
+    def _reserve(self, i):
+        """
+        Grows storage, if step ``i`` does not fit in it
+
+        """
+        if i >= self._results.shape[0]:
+            if self._sink is None:
+                self._results = _grow(self._results)
+            else:
+                self._results = self._sink.grow()
+            self._step_sizes = _grow(self._step_sizes)
+            self._step_indices = _grow(self._step_indices)
+            self._affine = _grow(self._affine)
+            if self._shadow_results is not None:
+                self._shadow_results = _grow(self._shadow_results)
+
+    def _set_order(self, order, scheme):
+        """
+        Selects the integration scheme, for ``order`` and ``scheme``
+
+        """
+        ORDERS = {
+            2: self._ord_2,
+            4: self._ord_4,
+            6: self._ord_6,
+            8: self._ord_8,
+        }
+        if order not in ORDERS:
+            raise NotImplementedError(
+                f"Order {order} integrator has not been implemented."
+            )
+        if scheme not in _SCHEMES:
+            raise NotImplementedError(
+                f"'{scheme}' composition scheme is unsupported. Use one of {_SCHEMES}."
+            )
+
+        self.order = order
+        self.scheme = scheme
+        self.integrator = ORDERS[order]
+        if scheme != "triple_jump" and order > 4:
+            self._weights = _composition_weights(order, scheme)
+            self.integrator = self._ord_composed
+
+    def _records(self, q):
+        """
+        Returns whether the current step, ending at
+        4-Position(s) ``q``, is to be stored
+
+        """
+        if self.step_num % self.record_every:
+            return False
+        if self.record_dt is None:
+            return True
+
+        t = np.max(np.asarray(q)[..., 0])
+        if t - self._t_last < self.record_dt:
+            return False
+        self._t_last = t
+
+        return True
+
+    def _record(self, arr, delta):
+        """
+        Writes the state after the current step into storage
+        Storage is grown, if more than ``steps`` steps are stored
+
+        """
+        i = self._n_stored
+        self._reserve(i)
+        self._n_stored += 1
+
+        self._step_sizes[i] = delta
+        self._step_indices[i] = self.step_num - 1
+        self._affine[i] = self.affine
+        self._write(i, arr)
+
+    def _write(self, i, arr):
+        """
+        Writes ``arr`` into storage, at index ``i``
+
+        """
+        self._results[i, ..., :4] = arr[0]
+        self._results[i, ..., 4:] = arr[1]
+        if self._shadow_results is not None:
+            self._shadow_results[i, ..., :4] = arr[2]
+            self._shadow_results[i, ..., 4:] = arr[3]
+
+    def close(self):
+        """
+        Finalizes the ``.npy`` file, that ``results`` are written into,
+        if ``out`` is set, and reopens it lazily, as a read-only array
+        No further steps can be taken afterwards.
+
+        """
+        if self._sink is None:
+            return
+
+        self._sink.close(self._n_stored)
+        self._results = load_trajectory(self._sink.path)[0]
+
+    def checkpoint(self):
+        """
+        Returns the state of the integrator, so that
+        integration can be resumed later, with ``resume``
+
+        Returns
+        -------
+        dict
+            JSON-serializable state of the integrator
+
+        """
+        return {
+            "res_list": [np.asarray(v, dtype=float).tolist() for v in self.res_list],
+            "step_num": self.step_num,
+            "affine": self.affine,
+            "t_last": float(self._t_last),
+            "delta": self.delta,
+            "order": self.order,
+            "scheme": self.scheme,
+            "omega": self.omega,
+        }
+
+    def resume(self, checkpoint):
+        """
+        Restores the state of the integrator, from ``checkpoint``
+        Storage is emptied, so that ``results`` only contain
+        steps, taken after resuming
+
+        Parameters
+        ----------
+        checkpoint : dict
+            State of the integrator, returned by ``checkpoint``
+
+        Raises
+        ------
+        NotImplementedError
+            If ``checkpoint["order"]`` is not in [2, 4, 6, 8], or
+            ``checkpoint["scheme"]`` is not supported
+
+        """
+        self._set_order(checkpoint["order"], checkpoint.get("scheme", "triple_jump"))
+        self.res_list = [np.asarray(v, dtype=float) for v in checkpoint["res_list"]]
+        self.step_num = checkpoint["step_num"]
+        self.affine = checkpoint["affine"]
+        self._t_last = checkpoint["t_last"]
+        self.delta = checkpoint["delta"]
+        self.omega = checkpoint["omega"]
+        self._n_stored = 0
+
+    def _flush(self):
+        """
+        Empties storage
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Copy of ``results``, before storage was emptied
+
+        """
+        chunk = self.results.copy()
+        self._n_stored = 0
+
+        return chunk
+
+    def iter_chunks(self, n_steps, chunk_size=1000):
+        """
+        Advances integration by ``n_steps`` steps, yielding the
+        results in chunks, as they are produced
+        Storage is emptied after each chunk, so that memory usage
+        is bounded by ``chunk_size``, regardless of ``n_steps``
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of integration steps
+        chunk_size : int, optional
+            Maximum number of steps per chunk
+            Defaults to ``1000``
+
+        Yields
+        ------
+        ~numpy.ndarray
+            Shape-(n, 8) array, or Shape-(n, N, 8) array for ``N``
+            geodesics, containing (4-Position, 4-Momentum) for
+            each of the ``n <= chunk_size`` steps in the chunk
+
+        Raises
+        ------
+        ValueError
+            If results are being written to ``out``
+
+        """
+        if self._sink is not None:
+            raise ValueError(
+                "Results, that are written to 'out', cannot be streamed in chunks."
+            )
+
+        self._flush()
+        for start in range(0, n_steps, chunk_size):
+            for _ in range(min(chunk_size, n_steps - start)):
+                self.step()
+
+            yield self._flush()
+
     def _ord_2(self, q1, p1, q2, p2, delta):
         """
         Order 2 Integration Scheme
@@ -157,41 +634,16 @@ class GeodesicIntegrator:
         g = self.metric
         g_prms = self.metric_params
 
-        HA1 = np.array(
-            [
-                q1,
-                _flow_A(g, g_prms, q1, p1, q2, p2, 0.5 * dl)[1],
-                _flow_A(g, g_prms, q1, p1, q2, p2, 0.5 * dl)[0],
-                p2,
-            ]
-        )
-        HB1 = np.array(
-            [
-                _flow_B(g, g_prms, HA1[0], HA1[1], HA1[2], HA1[3], 0.5 * dl)[0],
-                HA1[1],
-                HA1[2],
-                _flow_B(g, g_prms, HA1[0], HA1[1], HA1[2], HA1[3], 0.5 * dl)[1],
-            ]
-        )
-        HC = _flow_mixed(HB1[0], HB1[1], HB1[2], HB1[3], dl, omg)
-        HB2 = np.array(
-            [
-                _flow_B(g, g_prms, HC[0], HC[1], HC[2], HC[3], 0.5 * dl)[0],
-                HC[1],
-                HC[2],
-                _flow_B(g, g_prms, HC[0], HC[1], HC[2], HC[3], 0.5 * dl)[1],
-            ]
-        )
-        HA2 = np.array(
-            [
-                HB2[0],
-                _flow_A(g, g_prms, HB2[0], HB2[1], HB2[2], HB2[3], 0.5 * dl)[1],
-                _flow_A(g, g_prms, HB2[0], HB2[1], HB2[2], HB2[3], 0.5 * dl)[0],
-                HB2[3],
-            ]
-        )
+        # Each partial flow is evaluated once, and returns only the
+        # components of (q1, p1, q2, p2), that it advances
+        c, wrt = self._cache, self._wrt
+        q2, p1 = _flow_A(g, g_prms, q1, p1, q2, p2, 0.5 * dl, c, wrt)
+        q1, p2 = _flow_B(g, g_prms, q1, p1, q2, p2, 0.5 * dl, c, wrt)
+        q1, p1, q2, p2 = _flow_mixed(q1, p1, q2, p2, dl, omg)
+        q1, p2 = _flow_B(g, g_prms, q1, p1, q2, p2, 0.5 * dl, c, wrt)
+        q2, p1 = _flow_A(g, g_prms, q1, p1, q2, p2, 0.5 * dl, c, wrt)
 
-        return HA2
+        return q1, p1, q2, p2
 
     def _ord_4(self, q1, p1, q2, p2, delta):
         """
@@ -207,7 +659,7 @@ class GeodesicIntegrator:
         """
         dl = delta
 
-        Z0, Z1 = _Z(self.order)
+        Z0, Z1 = _Z(4)
         step1 = self._ord_2(q1, p1, q2, p2, dl * Z1)
         step2 = self._ord_2(step1[0], step1[1], step1[2], step1[3], dl * Z0)
         step3 = self._ord_2(step2[0], step2[1], step2[2], step2[3], dl * Z1)
@@ -228,7 +680,7 @@ class GeodesicIntegrator:
         """
         dl = delta
 
-        Z0, Z1 = _Z(self.order)
+        Z0, Z1 = _Z(6)
         step1 = self._ord_4(q1, p1, q2, p2, dl * Z1)
         step2 = self._ord_4(step1[0], step1[1], step1[2], step1[3], dl * Z0)
         step3 = self._ord_4(step2[0], step2[1], step2[2], step2[3], dl * Z1)
@@ -249,30 +701,62 @@ class GeodesicIntegrator:
         """
         dl = delta
 
-        Z0, Z1 = _Z(self.order)
+        Z0, Z1 = _Z(8)
         step1 = self._ord_6(q1, p1, q2, p2, dl * Z1)
         step2 = self._ord_6(step1[0], step1[1], step1[2], step1[3], dl * Z0)
         step3 = self._ord_6(step2[0], step2[1], step2[2], step2[3], dl * Z1)
 
         return step3
 
+    def _ord_composed(self, q1, p1, q2, p2, delta):
+        """
+        Order 6 or 8 Integration Scheme, composed of Order 2 steps,
+        with the step-size fractions of ``scheme``
+
+        References
+        ----------
+        .. [1] Yoshida, Haruo,
+            "Construction of higher order symplectic integrators";
+             Physics Letters A, vol. 150, no. 5-7, pp. 262-268, 1990.
+            `DOI: <https://doi.org/10.1016/0375-9601(90)90092-3>`__
+        .. [2] Kahan, William and Li, Ren-Cang;
+            "Composition constants for raising the orders of
+            unconventional schemes for ordinary differential equations";
+            Mathematics of Computation, vol. 66, no. 219, pp. 1089-1099, 1997.
+            `DOI: <https://doi.org/10.1090/S0025-5718-97-00873-9>`__
+
+        """
+        step = (q1, p1, q2, p2)
+        for w in self._weights:
+            step = self._ord_2(step[0], step[1], step[2], step[3], delta * w)
+
+        return step
+
     def step(self):
         """
         Advances integration by one step
 
         """
         rl = self.res_list
+        if self._cache is not None:
+            self._cache.clear()
 
-        arr = self.integrator(rl[0], rl[1], rl[2], rl[3], self.delta)
+        if self.adaptive:
+            arr, delta = self._adaptive_step(rl)
+        else:
+            delta = self.delta
+            arr = self.integrator(rl[0], rl[1], rl[2], rl[3], delta)
 
         self.res_list = arr
         self.step_num += 1
+        self.affine += delta
 
         # Stability check
-        if not self.suppress_warnings:
-            g = self.metric
-            g_prms = self.metric_params
-
+        if (
+            not self.suppress_warnings
+            and self.constraint_check == "step"
+            and self.step_num % self.check_every == 0
+        ):
             q1 = arr[0]
             p1 = arr[1]
             # Ignoring
@@ -281,12 +765,247 @@ class GeodesicIntegrator:
 
             const = -int(self.time_like)
             # g.p.p ~ -1 or 0 (const)
-            if not np.allclose(
-                g(q1, *g_prms) @ p1 @ p1, const, rtol=self.rtol, atol=self.atol
-            ):
+            gpp = self._hamiltonian_constraint(q1, p1)
+            if not np.allclose(gpp, const, rtol=self.rtol, atol=self.atol):
                 warnings.warn(
                     f"Numerical error has exceeded specified tolerance at step = {self.step_num}.",
                     RuntimeWarning,
                 )
 
-        self.results.append(self.res_list)
+        if self._records(arr[0]):
+            self._record(arr, delta)
+
+    def check_constraint(self, warn=True, previous=None):
+        """
+        Evaluates the Hamiltonian constraint for all stored steps,
+        in one vectorized pass, and issues a single warning, summarizing
+        the steps, at which it exceeded tolerance (``rtol`` and ``atol``)
+
+        Parameters
+        ----------
+        warn : bool, optional
+            Whether to warn, if tolerance was exceeded
+            Defaults to ``True``
+        previous : ~numpy.ndarray, optional
+            Violation of the first stored steps, as returned by an earlier
+            check, so that only the remaining steps are evaluated, e.g.
+            after the earlier steps were converted for output
+            Defaults to ``None``
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(n,) array, or Shape-(n, N) array for ``N`` geodesics,
+            containing :math:`g^{\\mu \\nu} p_{\\mu} p_{\\nu} - const`
+            for each of the ``n`` stored steps
+            Entries of inactive geodesics are ``NaN``
+        dict
+            Summary statistics of the violation
+            ``"max"``, ``"mean"``, ``"rms"``, ``"n_exceeded"`` and
+            ``"first_exceeded"`` (step, counting from ``1``, or ``None``)
+
+        """
+        n = 0 if previous is None else previous.shape[0]
+        results = self.results[n:]
+        vecs = results.reshape(-1, 8)
+        const = -int(self.time_like)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            G = _metric(self.metric, self.metric_params, vecs[:, :4])
+            gpp = np.einsum("...ij,...i,...j->...", G, vecs[:, 4:], vecs[:, 4:])
+        violation = gpp.reshape(results.shape[:-1]) - const
+        if previous is not None:
+            violation = np.concatenate((previous, violation))
+
+        summary = _constraint_summary(
+            violation, const, self.rtol, self.atol, self.step_indices
+        )
+        if warn:
+            _warn_constraint(summary, self._n_stored)
+
+        return violation, summary
+
+    def _hamiltonian_constraint(self, q, p):
+        """
+        Returns :math:`g^{\\mu \\nu} p_{\\mu} p_{\\nu}` at ``(q, p)``
+
+        """
+        if self._cache is None:
+            G = _metric(self.metric, self.metric_params, q)
+        else:
+            G = self._cache.metric(q)
+
+        return np.einsum("...ij,...i,...j->...", G, p, p)
+
+    def _adaptive_step(self, rl):
+        """
+        Takes one step with adaptive step-size control
+        The local error is estimated by step doubling, i.e. by comparing
+        one step of size ``delta`` against two steps of size ``delta / 2``.
+        The step is retried with smaller step-sizes, until the error is
+        within ``adaptive_tol``, or ``delta_min`` is reached. The step-size
+        for the next step is then grown or shrunk, based on the error.
+
+        Parameters
+        ----------
+        rl : array_like
+            Current state, ``(q1, p1, q2, p2)``
+
+        Returns
+        -------
+        ~numpy.ndarray
+            State after the step
+        float
+            Step-size, used for the step
+
+        """
+        exponent = 1 / (self.order + 1)
+        delta = self.delta
+        while True:
+            full = np.asarray(self.integrator(rl[0], rl[1], rl[2], rl[3], delta))
+            half = self.integrator(rl[0], rl[1], rl[2], rl[3], 0.5 * delta)
+            half = np.asarray(
+                self.integrator(half[0], half[1], half[2], half[3], 0.5 * delta)
+            )
+            err = np.max(np.abs(full - half) / (1.0 + np.abs(half)))
+            factor = 0.9 * (self.adaptive_tol / err) ** exponent if err > 0 else 2.0
+            if err <= self.adaptive_tol or delta <= self.delta_min:
+                break
+            # Rejected
+            delta = max(delta * max(factor, 0.2), self.delta_min)
+
+        # Limiting growth, so that step-sizes vary smoothly
+        self.delta = min(max(delta * min(factor, 2.0), self.delta_min), self.delta_max)
+
+        return half, delta
+
+
+class BatchGeodesicIntegrator(GeodesicIntegrator):
+    """
+    Batched version of ``GeodesicIntegrator``, that advances
+    ``N`` geodesics in lock-step, with array operations.
+    All geodesics share the same metric, step-size and order.
+    Geodesics can be removed from the batch with ``deactivate``,
+    after which they are no longer integrated, and their
+    results are padded with ``NaN``.
+
+    """
+
+    def __init__(self, metric, metric_params, q0, p0, **kwargs):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        metric : callable
+            Metric Function. Currently, these metrics are supported:
+            1. Schwarzschild
+            2. Kerr
+            3. KerrNewman
+        metric_params : array_like
+            Tuple of parameters to pass to the metric
+            E.g., ``(a,)`` for Kerr
+        q0 : array_like
+            Initial 4-Positions
+            Shape-(N, 4) array
+        p0 : array_like
+            Initial 4-Momenta
+            Shape-(N, 4) array
+        kwargs : dict
+            Keyword parameters, passed to ``GeodesicIntegrator``
+
+        Raises
+        ------
+        ValueError
+            If ``q0`` or ``p0`` are not Shape-(N, 4) arrays of equal shape
+
+        """
+        q0 = np.asarray(q0, dtype=float)
+        p0 = np.asarray(p0, dtype=float)
+        if q0.ndim != 2 or q0.shape[-1] != 4 or q0.shape != p0.shape:
+            raise ValueError(
+                "q0 and p0 must be arrays of shape (N, 4). "
+                f"Supplied shapes: {q0.shape}, {p0.shape}"
+            )
+
+        super().__init__(
+            metric=metric, metric_params=metric_params, q0=q0, p0=p0, **kwargs
+        )
+        self._active = np.arange(q0.shape[0])
+
+    @property
+    def n_geodesics(self):
+        """
+        Returns the number of geodesics in the batch
+
+        """
+        return self.q0.shape[0]
+
+    @property
+    def active(self):
+        """
+        Returns the indices of geodesics, that are still being integrated
+
+        """
+        return self._active
+
+    def checkpoint(self):
+        """
+        Returns the state of the integrator, including the
+        indices of active geodesics
+
+        Returns
+        -------
+        dict
+            JSON-serializable state of the integrator
+
+        """
+        checkpoint = super().checkpoint()
+        checkpoint["active"] = self._active.tolist()
+
+        return checkpoint
+
+    def resume(self, checkpoint):
+        """
+        Restores the state of the integrator, from ``checkpoint``
+
+        Parameters
+        ----------
+        checkpoint : dict
+            State of the integrator, returned by ``checkpoint``
+
+        """
+        super().resume(checkpoint)
+        # Preserving shape, if no geodesics are active
+        self.res_list = [v.reshape(-1, 4) for v in self.res_list]
+        self._active = np.asarray(checkpoint["active"], dtype=int)
+
+    def deactivate(self, mask):
+        """
+        Removes geodesics from the batch
+        Deactivated geodesics cost nothing in subsequent steps
+
+        Parameters
+        ----------
+        mask : array_like
+            Boolean array of shape ``active.shape``, that is ``True``
+            for the active geodesics, that are to be removed
+
+        """
+        keep = ~np.asarray(mask, dtype=bool)
+        self._active = self._active[keep]
+        self.res_list = [np.asarray(v)[keep] for v in self.res_list]
+
+    def _write(self, i, arr):
+        """
+        Writes the state of active geodesics into storage, at index ``i``
+        Inactive geodesics are set to ``NaN``
+
+        """
+        idx = self._active
+        self._results[i] = np.nan
+        self._results[i, idx, :4] = arr[0]
+        self._results[i, idx, 4:] = arr[1]
+        if self._shadow_results is not None:
+            self._shadow_results[i] = np.nan
+            self._shadow_results[i, idx, :4] = arr[2]
+            self._shadow_results[i, idx, 4:] = arr[3]
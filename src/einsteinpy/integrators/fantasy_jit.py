@@ -0,0 +1,350 @@
+"""
+Compiled FANTASY kernels for Schwarzschild, Kerr & Kerr-Newman spacetimes
+These are used by the ``"numba"`` backend of ``einsteinpy.geodesic.Geodesic``.
+Metric and metric derivatives are hardcoded in closed form, for the
+Contravariant Kerr-Newman Metric, in Boyer-Lindquist coordinates.
+Schwarzschild (``a = Q = 0``) and Kerr (``Q = 0``) are special cases.
+If ``numba`` is not installed, the kernels run as regular Python functions.
+
+Unit System: M-Units => :math:`c = G = M = k_e = 1`
+Metric Signature => :math:`(-, +, +, +)`
+
+"""
+import numpy as np
+
+from einsteinpy.ijit import jit
+
+
+@jit(cache=True)
+def _kn_metric(r, th, a, Q):
+    """
+    Non-zero components of Contravariant Kerr-Newman Metric
+
+    Parameters
+    ----------
+    r : float
+        r-component of 4-Position
+    th : float
+        theta-component of 4-Position
+    a : float
+        Spin Parameter
+    Q : float
+        Charge on gravitating body
+
+    Returns
+    -------
+    tuple
+        ``(g^tt, g^rr, g^thth, g^phph, g^tph)``
+
+    """
+    a2 = a ** 2
+    sint2 = np.sin(th) ** 2
+    sg = r ** 2 + a2 * np.cos(th) ** 2
+    dl = r ** 2 - 2 * r + a2 + Q ** 2
+    D = sg * dl
+
+    gtt = -((r ** 2 + a2) ** 2 - a2 * dl * sint2) / D
+    grr = dl / sg
+    gthth = 1 / sg
+    gphph = (dl - a2 * sint2) / (D * sint2)
+    gtph = -a * (r ** 2 + a2 - dl) / D
+
+    return gtt, grr, gthth, gphph, gtph
+
+
+@jit(cache=True)
+def _kn_hamflow(q, p, a, Q):
+    """
+    Derivatives of the Hamiltonian, :math:`H = g^{\\mu \\nu} p_{\\mu} p_{\\nu} / 2`
+
+    Parameters
+    ----------
+    q : ~numpy.ndarray
+        4-Position
+    p : ~numpy.ndarray
+        4-Momentum
+    a : float
+        Spin Parameter
+    Q : float
+        Charge on gravitating body
+
+    Returns
+    -------
+    dq : ~numpy.ndarray
+        :math:`\\partial H / \\partial p_{\\mu} = g^{\\mu \\nu} p_{\\nu}`
+    dp : ~numpy.ndarray
+        :math:`\\partial H / \\partial x^{\\alpha} =
+        \\partial_{\\alpha} g^{\\mu \\nu} p_{\\mu} p_{\\nu} / 2`
+
+    """
+    r, th = q[1], q[2]
+    sint, cost = np.sin(th), np.cos(th)
+    sint2 = sint ** 2
+    a2 = a ** 2
+
+    sg = r ** 2 + a2 * cost ** 2
+    dl = r ** 2 - 2 * r + a2 + Q ** 2
+    sg_r, sg_th = 2 * r, -2 * a2 * sint * cost
+    dl_r = 2 * r - 2
+
+    D = sg * dl
+    D_r, D_th = sg_r * dl + sg * dl_r, sg_th * dl
+    A = (r ** 2 + a2) ** 2 - a2 * dl * sint2
+    A_r = 4 * r * (r ** 2 + a2) - a2 * dl_r * sint2
+    A_th = -2 * a2 * dl * sint * cost
+    B = r ** 2 + a2 - dl
+    B_r = 2 * r - dl_r
+    C = dl - a2 * sint2
+    C_r, C_th = dl_r, -2 * a2 * sint * cost
+    E = D * sint2
+    E_r, E_th = D_r * sint2, D_th * sint2 + 2 * D * sint * cost
+
+    gtt = -A / D
+    grr = dl / sg
+    gthth = 1 / sg
+    gphph = C / E
+    gtph = -a * B / D
+
+    dq = np.empty(4)
+    dq[0] = gtt * p[0] + gtph * p[3]
+    dq[1] = grr * p[1]
+    dq[2] = gthth * p[2]
+    dq[3] = gtph * p[0] + gphph * p[3]
+
+    # Metric depends only on r & theta
+    dtt_r = -(A_r * D - A * D_r) / D ** 2
+    dtt_th = -(A_th * D - A * D_th) / D ** 2
+    drr_r = (dl_r * sg - dl * sg_r) / sg ** 2
+    drr_th = -dl * sg_th / sg ** 2
+    dthth_r = -sg_r / sg ** 2
+    dthth_th = -sg_th / sg ** 2
+    dphph_r = (C_r * E - C * E_r) / E ** 2
+    dphph_th = (C_th * E - C * E_th) / E ** 2
+    dtph_r = -a * (B_r * D - B * D_r) / D ** 2
+    dtph_th = a * B * D_th / D ** 2
+
+    dp = np.zeros(4)
+    dp[1] = 0.5 * (
+        dtt_r * p[0] ** 2
+        + 2 * dtph_r * p[0] * p[3]
+        + drr_r * p[1] ** 2
+        + dthth_r * p[2] ** 2
+        + dphph_r * p[3] ** 2
+    )
+    dp[2] = 0.5 * (
+        dtt_th * p[0] ** 2
+        + 2 * dtph_th * p[0] * p[3]
+        + drr_th * p[1] ** 2
+        + dthth_th * p[2] ** 2
+        + dphph_th * p[3] ** 2
+    )
+
+    return dq, dp
+
+
+@jit(cache=True)
+def _kn_ord_2(q1, p1, q2, p2, delta, omega, a, Q):
+    """
+    Order 2 Integration Scheme, updating the state in-place
+
+    References
+    ----------
+    .. [1] Christian, Pierre and Chan, Chi-Kwan;
+        "FANTASY : User-Friendly Symplectic Geodesic Integrator
+        for Arbitrary Metrics with Automatic Differentiation";
+        `arXiv:2010.02237 <https://arxiv.org/abs/2010.02237>`__
+
+    """
+    hdl = 0.5 * delta
+
+    # Flow A
+    dq, dp = _kn_hamflow(q1, p2, a, Q)
+    p1 -= hdl * dp
+    q2 += hdl * dq
+    # Flow B
+    dq, dp = _kn_hamflow(q2, p1, a, Q)
+    p2 -= hdl * dp
+    q1 += hdl * dq
+    # Mixed Flow
+    q_sum, q_dif = q1 + q2, q1 - q2
+    p_sum, p_dif = p1 + p2, p1 - p2
+    cos = np.cos(2.0 * omega * delta)
+    sin = np.sin(2.0 * omega * delta)
+    q1[:] = 0.5 * (q_sum + q_dif * cos + p_dif * sin)
+    p1[:] = 0.5 * (p_sum + p_dif * cos - q_dif * sin)
+    q2[:] = 0.5 * (q_sum - q_dif * cos - p_dif * sin)
+    p2[:] = 0.5 * (p_sum - p_dif * cos + q_dif * sin)
+    # Flow B
+    dq, dp = _kn_hamflow(q2, p1, a, Q)
+    p2 -= hdl * dp
+    q1 += hdl * dq
+    # Flow A
+    dq, dp = _kn_hamflow(q1, p2, a, Q)
+    p1 -= hdl * dp
+    q2 += hdl * dq
+
+
+@jit(cache=True)
+def _kn_integrate(q0, p0, a, Q, steps, delta, omega, weights, stride=1):
+    """
+    Integrates a Geodesic in Kerr-Newman spacetime
+
+    Parameters
+    ----------
+    q0 : ~numpy.ndarray
+        Initial 4-Position
+    p0 : ~numpy.ndarray
+        Initial 4-Momentum
+    a : float
+        Spin Parameter
+    Q : float
+        Charge on gravitating body
+    steps : int
+        Number of integration steps
+    delta : float
+        Integration step-size
+    omega : float
+        Coupling between Hamiltonian Flows
+    weights : ~numpy.ndarray
+        Fractions of ``delta``, for the order 2 substeps,
+        that compose one step of the integrator
+    stride : int, optional
+        Records every ``stride``-th step
+        Defaults to ``1``
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Shape-(steps // stride, 8) array, containing
+        (4-Position, 4-Momentum) after each recorded step
+
+    """
+    q1, p1 = q0.copy(), p0.copy()
+    q2, p2 = q0.copy(), p0.copy()
+    results = np.empty((steps // stride, 8))
+
+    for i in range(steps):
+        for w in weights:
+            _kn_ord_2(q1, p1, q2, p2, delta * w, omega, a, Q)
+
+        if (i + 1) % stride == 0:
+            results[(i + 1) // stride - 1, :4] = q1
+            results[(i + 1) // stride - 1, 4:] = p1
+
+    return results
+
+
+@jit(cache=True)
+def _kn_integrate_batch(q0, p0, a, Q, steps, delta, omega, weights, stride=1):
+    """
+    Integrates ``N`` Geodesics in Kerr-Newman spacetime
+
+    Parameters
+    ----------
+    q0 : ~numpy.ndarray
+        Initial 4-Positions, Shape-(N, 4) array
+    p0 : ~numpy.ndarray
+        Initial 4-Momenta, Shape-(N, 4) array
+    a : float
+        Spin Parameter
+    Q : float
+        Charge on gravitating body
+    steps : int
+        Number of integration steps
+    delta : float
+        Integration step-size
+    omega : float
+        Coupling between Hamiltonian Flows
+    weights : ~numpy.ndarray
+        Fractions of ``delta``, for the order 2 substeps,
+        that compose one step of the integrator
+    stride : int, optional
+        Records every ``stride``-th step
+        Defaults to ``1``
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Shape-(steps // stride, N, 8) array, containing
+        (4-Position, 4-Momentum) for each geodesic, after each recorded step
+
+    """
+    N = q0.shape[0]
+    results = np.empty((steps // stride, N, 8))
+
+    for n in range(N):
+        results[:, n] = _kn_integrate(
+            q0[n], p0[n], a, Q, steps, delta, omega, weights, stride
+        )
+
+    return results
+
+
+@jit(cache=True)
+def _record_dt(t, t0, dt):
+    """
+    Selects samples, spaced by at least ``dt`` in coordinate time,
+    starting from ``t0``
+
+    Parameters
+    ----------
+    t : ~numpy.ndarray
+        Coordinate time of each sample
+    t0 : float
+        Initial coordinate time
+    dt : float
+        Minimum spacing between selected samples
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Indices of selected samples
+
+    """
+    keep = np.zeros(t.shape[0], dtype=np.bool_)
+    t_last = t0
+
+    for i in range(t.shape[0]):
+        # NaN-padding is never selected
+        if t[i] - t_last >= dt:
+            keep[i] = True
+            t_last = t[i]
+
+    return np.flatnonzero(keep)
+
+
+@jit(cache=True)
+def _kn_constraint(results, a, Q):
+    """
+    Computes :math:`g^{\\mu \\nu} p_{\\mu} p_{\\nu}` for each state
+
+    Parameters
+    ----------
+    results : ~numpy.ndarray
+        Shape-(M, 8) array, containing (4-Position, 4-Momentum)
+    a : float
+        Spin Parameter
+    Q : float
+        Charge on gravitating body
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Shape-(M,) array
+
+    """
+    M = results.shape[0]
+    gpp = np.empty(M)
+
+    for i in range(M):
+        gtt, grr, gthth, gphph, gtph = _kn_metric(results[i, 1], results[i, 2], a, Q)
+        pt, pr, pth, pph = results[i, 4], results[i, 5], results[i, 6], results[i, 7]
+        gpp[i] = (
+            gtt * pt ** 2
+            + 2 * gtph * pt * pph
+            + grr * pr ** 2
+            + gthth * pth ** 2
+            + gphph * pph ** 2
+        )
+
+    return gpp
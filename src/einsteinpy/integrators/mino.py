@@ -0,0 +1,201 @@
+"""
+Compiled, reduced integrators for geodesics in Kerr-Newman spacetimes,
+in Mino time, :math:`\\lambda`, with :math:`d\\tau = \\Sigma d\\lambda`
+These are used by the ``"mino"`` backend of ``einsteinpy.geodesic.Geodesic``.
+
+Energy, ``E``, angular momentum, ``L``, and the Carter constant, ``C``, are
+conserved exactly, so that only the decoupled radial and polar equations,
+
+.. math::
+
+    \\frac{d^2 r}{d\\lambda^2} = \\frac{1}{2} \\frac{dR}{dr}, \\quad
+    \\frac{d^2 \\theta}{d\\lambda^2} = \\frac{1}{2} \\frac{d\\Theta}{d\\theta}
+
+along with quadratures for ``t``, ``phi`` and the affine parameter, are
+integrated with the classical 4th order Runge-Kutta method. Radial and polar
+velocities pass smoothly through zero at turning points, without the sign
+changes of :math:`dr / d\\lambda = \\pm \\sqrt{R}`.
+If ``numba`` is not installed, the kernels run as regular Python functions.
+
+Unit System: M-Units => :math:`c = G = M = k_e = 1`
+Metric Signature => :math:`(-, +, +, +)`
+
+"""
+import numpy as np
+
+from einsteinpy.ijit import jit
+
+
+@jit(cache=True)
+def _mino_constants(q, p, a, mu2):
+    """
+    Computes the conserved quantities of a geodesic
+
+    Parameters
+    ----------
+    q : ~numpy.ndarray
+        4-Position
+    p : ~numpy.ndarray
+        4-Momentum
+    a : float
+        Spin Parameter
+    mu2 : float
+        Squared rest mass, ``1.0`` for Time-like
+        and ``0.0`` for Null-like geodesics
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Energy, angular momentum and Carter constant, ``(E, L, C)``
+
+    """
+    E, L = -p[0], p[3]
+    u2 = np.cos(q[2]) ** 2
+    C = p[2] ** 2 + u2 * (a ** 2 * (mu2 - E ** 2) + L ** 2 / (1 - u2))
+
+    return np.array([E, L, C])
+
+
+@jit(cache=True)
+def _mino_rhs(y, consts, a, Q, mu2):
+    """
+    Computes derivatives w.r.t. Mino time of the reduced state,
+    ``(t, r, theta, phi, dr/dlambda, dtheta/dlambda, tau)``
+
+    """
+    E, L, C = consts[0], consts[1], consts[2]
+    r, th = y[1], y[2]
+    s, c = np.sin(th), np.cos(th)
+    r2a2 = r ** 2 + a ** 2
+    delta = r ** 2 - 2 * r + a ** 2 + Q ** 2
+    P = E * r2a2 - a * L
+    K = C + (L - a * E) ** 2
+    dR = 4 * E * r * P - (2 * r - 2) * (mu2 * r ** 2 + K) - 2 * mu2 * r * delta
+    dTh = 2 * s * c * a ** 2 * (mu2 - E ** 2) + 2 * L ** 2 * c / s ** 3
+
+    dy = np.empty(7)
+    dy[0] = r2a2 * P / delta - a * (a * E * s ** 2 - L)
+    dy[1] = y[4]
+    dy[2] = y[5]
+    dy[3] = a * P / delta - (a * E - L / s ** 2)
+    dy[4] = dR / 2
+    dy[5] = dTh / 2
+    dy[6] = r ** 2 + a ** 2 * c ** 2
+
+    return dy
+
+
+@jit(cache=True)
+def _mino_state(y, consts, a, Q):
+    """
+    Returns (4-Position, 4-Momentum) of the reduced state ``y``
+
+    """
+    delta = y[1] ** 2 - 2 * y[1] + a ** 2 + Q ** 2
+    out = np.empty(8)
+    out[:4] = y[:4]
+    out[4] = -consts[0]
+    out[5] = y[4] / delta
+    out[6] = y[5]
+    out[7] = consts[1]
+
+    return out
+
+
+@jit(cache=True)
+def _mino_integrate(q0, p0, a, Q, mu2, steps, delta, stride=1):
+    """
+    Integrates a geodesic in Mino time, with steps of
+    :math:`\\delta / \\Sigma`, so that each step advances
+    the affine parameter by approximately ``delta``
+
+    Parameters
+    ----------
+    q0 : ~numpy.ndarray
+        Initial 4-Position
+    p0 : ~numpy.ndarray
+        Initial 4-Momentum
+    a : float
+        Spin Parameter
+    Q : float
+        Charge on gravitating body
+    mu2 : float
+        Squared rest mass, ``1.0`` for Time-like
+        and ``0.0`` for Null-like geodesics
+    steps : int
+        Number of integration steps
+    delta : float
+        Affine step-size
+    stride : int, optional
+        Only every ``stride``-th step is stored
+        Defaults to ``1``
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Shape-(steps // stride, 8) array, containing
+        (4-Position, 4-Momentum) for each stored step
+    ~numpy.ndarray
+        Shape-(steps // stride,) array, containing
+        the affine parameter of each stored step
+
+    """
+    consts = _mino_constants(q0, p0, a, mu2)
+    y = np.empty(7)
+    y[:4] = q0
+    y[4] = (q0[1] ** 2 - 2 * q0[1] + a ** 2 + Q ** 2) * p0[1]
+    y[5] = p0[2]
+    y[6] = 0.0
+
+    n = steps // stride
+    results = np.empty((n, 8))
+    affine = np.empty(n)
+    j = 0
+    for i in range(steps):
+        h = delta / (y[1] ** 2 + a ** 2 * np.cos(y[2]) ** 2)
+        k1 = _mino_rhs(y, consts, a, Q, mu2)
+        k2 = _mino_rhs(y + h / 2 * k1, consts, a, Q, mu2)
+        k3 = _mino_rhs(y + h / 2 * k2, consts, a, Q, mu2)
+        k4 = _mino_rhs(y + h * k3, consts, a, Q, mu2)
+        y = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        if (i + 1) % stride == 0:
+            results[j] = _mino_state(y, consts, a, Q)
+            affine[j] = y[6]
+            j += 1
+
+    return results, affine
+
+
+@jit(cache=True)
+def _mino_integrate_batch(q0, p0, a, Q, mu2, steps, delta, stride=1):
+    """
+    Integrates a batch of geodesics in Mino time
+    See ``_mino_integrate``
+
+    Parameters
+    ----------
+    q0 : ~numpy.ndarray
+        Shape-(n, 4) array of initial 4-Positions
+    p0 : ~numpy.ndarray
+        Shape-(n, 4) array of initial 4-Momenta
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Shape-(steps // stride, n, 8) array, containing
+        (4-Position, 4-Momentum) for each stored step
+    ~numpy.ndarray
+        Shape-(steps // stride, n) array, containing
+        the affine parameter of each stored step
+
+    """
+    n = steps // stride
+    results = np.empty((n, q0.shape[0], 8))
+    affine = np.empty((n, q0.shape[0]))
+    for k in range(q0.shape[0]):
+        res, aff = _mino_integrate(q0[k], p0[k], a, Q, mu2, steps, delta, stride)
+        results[:, k] = res
+        affine[:, k] = aff
+
+    return results, affine
@@ -0,0 +1,152 @@
+"""
+On-disk storage for integration results
+
+Results are written into a ``numpy.memmap``-backed ``.npy`` file, that grows
+in chunks, alongside a JSON metadata sidecar, with the same name and a
+``.json`` extension. The ``.npy`` header is padded to a fixed size, so that
+it can be rewritten in-place, as the file grows.
+
+"""
+import json
+import os
+import struct
+
+import numpy as np
+
+# Total size of `.npy` header, in bytes
+_HEADER_SIZE = 128
+_MAGIC = b"\x93NUMPY\x01\x00"
+
+
+def _npy_header(shape):
+    """
+    Returns a fixed-size ``.npy`` (Version 1.0) header,
+    for a C-contiguous ``float64`` array of shape ``shape``
+
+    """
+    header = str({"descr": "<f8", "fortran_order": False, "shape": tuple(shape)})
+    header = header.ljust(_HEADER_SIZE - len(_MAGIC) - 3) + "\n"
+
+    return _MAGIC + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+def _sidecar(path):
+    """
+    Returns the path of the metadata sidecar, for ``path``
+
+    """
+    return os.path.splitext(os.fspath(path))[0] + ".json"
+
+
+class MemmapSink:
+    """
+    Growable, ``numpy.memmap``-backed ``.npy`` file,
+    with a JSON metadata sidecar
+
+    """
+
+    def __init__(self, path, shape, metadata=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path to the ``.npy`` file. Existing files are overwritten.
+        shape : tuple
+            Initial shape of the array. The array grows along the first axis.
+        metadata : dict, optional
+            JSON-serializable metadata, written to the sidecar on ``close``
+            Defaults to ``None``
+
+        """
+        self.path = os.fspath(path)
+        self.metadata = dict() if metadata is None else dict(metadata)
+        self._row_shape = tuple(shape[1:])
+        self._row_bytes = 8 * int(np.prod(self._row_shape))
+        self.array = None
+
+        open(self.path, "wb").close()
+        self._remap(shape[0])
+
+    def _remap(self, n_rows):
+        """
+        Resizes the file to ``n_rows`` rows, and maps it into memory
+
+        """
+        self.array = None
+        # Empty files cannot be mapped
+        capacity = max(n_rows, 1)
+        os.truncate(self.path, _HEADER_SIZE + capacity * self._row_bytes)
+        with open(self.path, "r+b") as f:
+            f.write(_npy_header((n_rows,) + self._row_shape))
+
+        self.array = np.memmap(
+            self.path,
+            dtype="<f8",
+            mode="r+",
+            offset=_HEADER_SIZE,
+            shape=(capacity,) + self._row_shape,
+        )
+
+        return self.array
+
+    def grow(self):
+        """
+        Doubles the length of the array along the first axis
+
+        Returns
+        -------
+        numpy.memmap
+            The grown array
+
+        """
+        self.array.flush()
+
+        return self._remap(2 * self.array.shape[0])
+
+    def close(self, n_rows):
+        """
+        Truncates the file to the first ``n_rows`` rows,
+        and writes the metadata sidecar, with ``n_rows`` as ``"steps"``
+
+        Parameters
+        ----------
+        n_rows : int
+            Number of rows to keep
+
+        """
+        self.array.flush()
+        self.array = None
+        os.truncate(self.path, _HEADER_SIZE + n_rows * self._row_bytes)
+        with open(self.path, "r+b") as f:
+            f.write(_npy_header((n_rows,) + self._row_shape))
+
+        self.metadata["steps"] = n_rows
+        with open(_sidecar(self.path), "w") as f:
+            json.dump(self.metadata, f, indent=4)
+
+
+def load_trajectory(path):
+    """
+    Lazily opens results, written by ``MemmapSink``, as a read-only array
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path to the ``.npy`` file
+
+    Returns
+    -------
+    numpy.memmap
+        Read-only array of results
+    dict
+        Metadata from the sidecar. Empty, if the sidecar does not exist.
+
+    """
+    metadata = dict()
+    if os.path.exists(_sidecar(path)):
+        with open(_sidecar(path)) as f:
+            metadata = json.load(f)
+
+    return np.load(path, mmap_mode="r"), metadata
@@ -2,10 +2,327 @@
 Utilities for Integration Module
 
 """
+import warnings
+
 import numpy as np
 
 from einsteinpy.utils.dual import _jacobian_g
 
+# Closed-form derivatives of contravariant metric functions
+# Populated through ``register_metric_derivative``
+_METRIC_DERIVATIVES = dict()
+
+# Closed-form derivatives w.r.t. r, in the equatorial plane, of stationary,
+# axisymmetric metrics, where they are the only non-vanishing derivatives
+# Populated through ``register_metric_derivative``
+_EQUATORIAL_DERIVATIVES = dict()
+
+# Coordinates (t, r, phi) of equatorial motion, with fixed theta
+_EQUATORIAL = np.array([0, 1, 3])
+
+
+def register_metric_derivative(metric, derivative, equatorial=None):
+    """
+    Registers a closed-form derivative for a contravariant metric function.
+    Integrators use the registered function, instead of
+    Automatic Differentiation, to compute metric derivatives.
+
+    Parameters
+    ----------
+    metric : callable
+        Metric (Contravariant) Function
+    derivative : callable
+        Function, with the same signature as ``metric``,
+        returning :math:`\\partial_{\\alpha} g^{\\mu \\nu}`
+        as a real-valued array of shape ``(4, 4, 4)``,
+        indexed as ``[alpha, mu, nu]``
+        If components of the 4-Position are arrays of shape ``(N,)``,
+        it should return an array of shape ``(4, 4, 4, N)``
+    equatorial : callable, optional
+        Function, with the same signature as ``metric``, returning
+        :math:`\\partial_r g^{\\mu \\nu}` in the equatorial plane,
+        ``theta = pi / 2``, as a real-valued array of shape ``(4, 4)``,
+        or ``(4, 4, N)``, for ``N`` positions
+        Only valid for stationary metrics, that are axisymmetric, and
+        reflection-symmetric about the equatorial plane, as all other
+        derivatives vanish there. Used for equatorial integration.
+        Defaults to ``None``
+
+    Notes
+    -----
+    Metric callables can also supply their derivative
+    as a ``dg_dx`` attribute, instead of being registered.
+
+    """
+    _METRIC_DERIVATIVES[metric] = derivative
+    if equatorial is not None:
+        _EQUATORIAL_DERIVATIVES[metric] = equatorial
+    else:
+        _EQUATORIAL_DERIVATIVES.pop(metric, None)
+
+
+def _derivative(g):
+    """
+    Returns the closed-form derivative of Metric ``g``,
+    either registered, or supplied as its ``dg_dx`` attribute, or ``None``
+
+    """
+    if g in _METRIC_DERIVATIVES:
+        return _METRIC_DERIVATIVES[g]
+
+    return getattr(g, "dg_dx", None)
+
+
+def _dg_dx(g, g_prms, q, wrt=None):
+    """
+    Derivatives of Metric, w.r.t. all coordinates, or those in ``wrt``
+    Uses the closed-form derivative, registered for ``g``,
+    if available, and Automatic Differentiation otherwise
+
+    Parameters
+    ----------
+    g : callable
+        Metric (Contravariant) Function
+    g_prms : array_like
+        Tuple of parameters to pass to the metric
+        E.g., ``(a,)`` for Kerr
+    q : array_like
+        4-Position
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` positions
+    wrt : ~numpy.ndarray, optional
+        Coordinates, w.r.t. which derivatives are needed, for equatorial
+        motion. Automatic Differentiation only computes these, and returns
+        ``[wrt, mu, nu]``. Metrics with an equatorial derivative, registered
+        through ``register_metric_derivative``, only return that w.r.t. ``r``,
+        as the others vanish. Other closed-form derivatives are evaluated at
+        once, and returned for all coordinates, as slicing them costs more,
+        than contracting the complete array.
+        Defaults to ``None``, i.e. all coordinates
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Derivatives of Metric, indexed as ``[alpha, mu, nu]``
+        Shape-(4, 4, 4) array, or Shape-(4, 4, 4, N) array for ``N`` positions
+        With ``wrt`` and Automatic Differentiation, Shape-(k, 4, 4) array,
+        or Shape-(k, 4, 4, N) array, for ``k`` coordinates
+        With ``wrt`` and an equatorial derivative, Shape-(1, 4, 4) array,
+        or Shape-(1, 4, 4, N) array, w.r.t. ``r``
+
+    """
+    q = np.asarray(q)
+
+    if wrt is not None and g in _EQUATORIAL_DERIVATIVES:
+        dg = np.asarray(_EQUATORIAL_DERIVATIVES[g](q.T, *g_prms))
+        shape = (4, 4) + q.shape[:-1]
+        return (dg if dg.shape == shape else np.broadcast_to(dg, shape))[None]
+
+    derivative = _derivative(g)
+    if derivative is not None:
+        dg = np.asarray(derivative(q.T, *g_prms))
+        shape = (4, 4, 4) + q.shape[:-1]
+        return dg if dg.shape == shape else np.broadcast_to(dg, shape)
+
+    idx = range(4) if wrt is None else wrt
+    return np.array([_jacobian_g(g, g_prms, q.T, i) for i in idx])
+
+
+def _metric_and_dg_dx(g, g_prms, q, wrt=None):
+    """
+    Evaluates the Metric, along with its derivatives, w.r.t. all
+    coordinates, or those in ``wrt``
+    With Automatic Differentiation, the Metric is taken from the
+    real part of the dual evaluations, instead of being evaluated again
+
+    Parameters
+    ----------
+    g : callable
+        Metric (Contravariant) Function
+    g_prms : array_like
+        Tuple of parameters to pass to the metric
+        E.g., ``(a,)`` for Kerr
+    q : array_like
+        4-Position
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` positions
+    wrt : ~numpy.ndarray, optional
+        Coordinates, w.r.t. which derivatives are needed
+        See ``_dg_dx``
+        Defaults to ``None``, i.e. all coordinates
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Metric Tensor
+        Shape-(4, 4) array, or Shape-(N, 4, 4) array for ``N`` positions
+    ~numpy.ndarray
+        Derivatives of Metric, indexed as ``[alpha, mu, nu]``
+        Shape-(4, 4, 4) array, or Shape-(4, 4, 4, N) array for ``N`` positions
+        With ``wrt``, as returned by ``_dg_dx``
+
+    """
+    q = np.asarray(q)
+
+    if _derivative(g) is not None:
+        return _metric(g, g_prms, q), _dg_dx(g, g_prms, q, wrt)
+
+    idx = range(4) if wrt is None else wrt
+    J, G = _jacobian_g(g, g_prms, q.T, idx[0], return_metric=True)
+    dG = np.array([J] + [_jacobian_g(g, g_prms, q.T, i) for i in idx[1:]])
+
+    return np.moveaxis(G, (0, 1), (-2, -1)), dG
+
+
+class MetricCache:
+    """
+    Bounded cache of Metric evaluations, and their derivatives,
+    keyed on the bytes of the 4-Position(s), at which they were evaluated
+    Integrators clear it on every step, so that positions, that are
+    visited more than once within a step, are only evaluated once.
+    ``hits`` and ``misses`` count evaluations, over all steps.
+
+    """
+
+    def __init__(self, g, g_prms, maxsize=8, wrt=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        g : callable
+            Metric (Contravariant) Function
+        g_prms : array_like
+            Tuple of parameters to pass to the metric
+            E.g., ``(a,)`` for Kerr
+        maxsize : int, optional
+            Maximum number of cached positions
+            Oldest entries are evicted first
+            Defaults to ``8``
+        wrt : ~numpy.ndarray, optional
+            Coordinates, w.r.t. which derivatives are needed
+            See ``_dg_dx``
+            Defaults to ``None``, i.e. all coordinates
+
+        """
+        self.g = g
+        self.g_prms = g_prms
+        self.maxsize = maxsize
+        self.wrt = wrt
+        self.hits = 0
+        self.misses = 0
+        # Key -> [Metric, Derivatives of Metric or None]
+        self._entries = dict()
+
+    def __repr__(self):
+        return (
+            f"MetricCache(hits={self.hits}, misses={self.misses}, "
+            f"hit_rate={self.hit_rate:.3f})"
+        )
+
+    def __str__(self):
+        return self.__repr__()
+
+    @property
+    def hit_rate(self):
+        """
+        Returns the fraction of evaluations, that were served from the cache
+
+        """
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """
+        Empties the cache, keeping the counters
+
+        """
+        self._entries.clear()
+
+    def _entry(self, q):
+        """
+        Returns the entry for ``q``, creating an empty one, if needed
+
+        """
+        q = np.ascontiguousarray(q, dtype=float)
+        key = (q.shape, q.tobytes())
+        entry = self._entries.get(key)
+        if entry is None:
+            if len(self._entries) >= self.maxsize:
+                # Dictionaries preserve insertion order
+                del self._entries[next(iter(self._entries))]
+            entry = self._entries[key] = [None, None]
+
+        return q, entry
+
+    def metric(self, q):
+        """
+        Evaluates the Metric at ``q``, as ``_metric`` does
+
+        """
+        q, entry = self._entry(q)
+        if entry[0] is None:
+            self.misses += 1
+            entry[0] = _metric(self.g, self.g_prms, q)
+        else:
+            self.hits += 1
+
+        return entry[0]
+
+    def metric_and_dg_dx(self, q):
+        """
+        Evaluates the Metric and its derivatives at ``q``,
+        as ``_metric_and_dg_dx`` does
+
+        """
+        q, entry = self._entry(q)
+        if entry[1] is None:
+            self.misses += 1
+            if entry[0] is None:
+                entry[0], entry[1] = _metric_and_dg_dx(self.g, self.g_prms, q, self.wrt)
+            else:
+                entry[1] = _dg_dx(self.g, self.g_prms, q, self.wrt)
+        else:
+            self.hits += 1
+
+        return entry[0], entry[1]
+
+
+def _metric(g, g_prms, q):
+    """
+    Evaluates the Metric as a real-valued array
+
+    Parameters
+    ----------
+    g : callable
+        Metric Function
+    g_prms : array_like
+        Tuple of parameters to pass to the metric
+        E.g., ``(a,)`` for Kerr
+    q : array_like
+        4-Position
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` positions
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Metric Tensor
+        Shape-(4, 4) array, or Shape-(N, 4, 4) array for ``N`` positions
+
+    """
+    q = np.asarray(q)
+    G = g(q.T, *g_prms)
+
+    if q.ndim == 1:
+        return G.astype(float)
+
+    shape = q.shape[:-1]
+    G = np.array(
+        [[np.broadcast_to(G[i, j], shape) for j in range(4)] for i in range(4)],
+        dtype=float,
+    )
+
+    return np.moveaxis(G, (0, 1), (-2, -1))
+
 
 def _PartHamFlow(g, g_prms, q, p, wrt):
     """
@@ -20,8 +337,10 @@ def _PartHamFlow(g, g_prms, q, p, wrt):
         E.g., ``(a,)`` for Kerr
     q : array_like
         Initial 4-Position
+        Shape-(4,) array, or Shape-(N, 4) array for ``N`` positions
     p : array_like
         Initial 3-Momentum
+        Same shape as ``q``
     wrt : int
         Coordinate, with respect to which, the derivative
         will be calculated
@@ -29,8 +348,9 @@ def _PartHamFlow(g, g_prms, q, p, wrt):
 
     Returns
     -------
-    float
+    float or ~numpy.ndarray
         Partial Hamiltonian Flow
+        Shape-(N,) array for ``N`` positions
 
     References
     ----------
@@ -40,12 +360,47 @@ def _PartHamFlow(g, g_prms, q, p, wrt):
         `arXiv:2010.02237 <https://arxiv.org/abs/2010.02237>`__
 
     """
-    return _jacobian_g(g, g_prms, q, wrt) @ p @ p
+    J = _dg_dx(g, g_prms, q)[wrt]
+
+    return np.einsum("ij...,...i,...j->...", J, p, p)
+
+
+def _kick_drift(G, dG, p, wrt=None):
+    """
+    Returns the momentum kick, :math:`\\frac{1}{2} \\partial_{\\alpha} g^{ij} p_i p_j`,
+    and the position drift, :math:`g^{ij} p_j`, of a partial flow
+    With ``wrt``, the kick vanishes for all other coordinates, and ``dG``
+    may only hold derivatives w.r.t. ``wrt``, or only w.r.t. ``r``,
+    as returned by ``_dg_dx``.
+    Momenta of the other coordinates, and the Metric components, that
+    couple them to ``wrt``, are assumed to vanish, as for ``theta`` of
+    equatorial motion, so that the drift vanishes for them as well.
+
+    """
+    dp = 0.5 * np.einsum("aij...,...i,...j->...a", dG, p, p)
+    dq = np.einsum("...ij,...j->...i", G, p)
+    if wrt is None:
+        return dp, dq
+
+    if dG.shape[0] == 4:
+        mask = np.zeros(4)
+        mask[wrt] = 1.0
+        return dp * mask, dq
 
+    dp_all = np.zeros(np.shape(p))
+    if dG.shape[0] == 1:
+        dp_all[..., 1] = dp[..., 0]
+    else:
+        dp_all[..., wrt] = dp
 
-def _flow_A(g, g_prms, q1, p1, q2, p2, delta=0.5):
+    return dp_all, dq
+
+
+def _flow_A(g, g_prms, q1, p1, q2, p2, delta=0.5, cache=None, wrt=None):
     """
     Overall flow of Hamiltonian, :math:`H_A`
+    Positions and Momenta may be Shape-(4,) arrays, or Shape-(N, 4)
+    arrays, to advance ``N`` geodesics at once
 
     Parameters
     ----------
@@ -65,6 +420,13 @@ def _flow_A(g, g_prms, q1, p1, q2, p2, delta=0.5):
     delta : float
         Initial integration step-size
         Defaults to ``0.5``
+    cache : ~einsteinpy.integrators.utils.MetricCache, optional
+        Cache of Metric evaluations, for ``g``
+        Defaults to ``None``
+    wrt : ~numpy.ndarray, optional
+        Coordinates, that are advanced by the flow
+        Others, e.g. ``theta`` of equatorial motion, are kept fixed
+        Defaults to ``None``, i.e. all coordinates
 
     Returns
     -------
@@ -79,20 +441,22 @@ def _flow_A(g, g_prms, q1, p1, q2, p2, delta=0.5):
         `arXiv:2010.02237 <https://arxiv.org/abs/2010.02237>`__
 
     """
-    dH1 = [0.5 * (_PartHamFlow(g, g_prms, q1, p2, i)) for i in range(4)]
-    dp1 = np.array(dH1)
+    if cache is None:
+        G, dG = _metric_and_dg_dx(g, g_prms, q1, wrt)
+    else:
+        G, dG = cache.metric_and_dg_dx(q1)
+    dp1, dq2 = _kick_drift(G, dG, p2, wrt)
     p1_next = p1 - delta * dp1
-
-    dH2 = g(q1, *g_prms) @ p2
-    dq2 = np.array(dH2)
     q2_next = q2 + delta * dq2
 
     return q2_next, p1_next
 
 
-def _flow_B(g, g_prms, q1, p1, q2, p2, delta=0.5):
+def _flow_B(g, g_prms, q1, p1, q2, p2, delta=0.5, cache=None, wrt=None):
     """
     Overall flow of Hamiltonian, :math:`H_B`
+    Positions and Momenta may be Shape-(4,) arrays, or Shape-(N, 4)
+    arrays, to advance ``N`` geodesics at once
 
     Parameters
     ----------
@@ -112,6 +476,13 @@ def _flow_B(g, g_prms, q1, p1, q2, p2, delta=0.5):
     delta : float
         Initial integration step-size
         Defaults to ``0.5``
+    cache : ~einsteinpy.integrators.utils.MetricCache, optional
+        Cache of Metric evaluations, for ``g``
+        Defaults to ``None``
+    wrt : ~numpy.ndarray, optional
+        Coordinates, that are advanced by the flow
+        Others, e.g. ``theta`` of equatorial motion, are kept fixed
+        Defaults to ``None``, i.e. all coordinates
 
     Returns
     -------
@@ -126,24 +497,12 @@ def _flow_B(g, g_prms, q1, p1, q2, p2, delta=0.5):
         `arXiv:2010.02237 <https://arxiv.org/abs/2010.02237>`__
 
     """
-    dH2 = [
-        0.5
-        * (
-            _PartHamFlow(
-                g,
-                g_prms,
-                q2,
-                p1,
-                i,
-            )
-        )
-        for i in range(4)
-    ]
-    dp2 = np.array(dH2)
+    if cache is None:
+        G, dG = _metric_and_dg_dx(g, g_prms, q2, wrt)
+    else:
+        G, dG = cache.metric_and_dg_dx(q2)
+    dp2, dq1 = _kick_drift(G, dG, p1, wrt)
     p2_next = p2 - delta * dp2
-
-    dH1 = g(q2, *g_prms) @ p1
-    dq1 = np.array(dH1)
     q1_next = q1 + delta * dq1
 
     return q1_next, p2_next
@@ -152,6 +511,8 @@ def _flow_B(g, g_prms, q1, p1, q2, p2, delta=0.5):
 def _flow_mixed(q1, p1, q2, p2, delta=0.5, omega=1.0):
     """
     Mixed flow of Hamiltonian, :math:`\\tilde{H}`
+    Positions and Momenta may be Shape-(4,) arrays, or Shape-(N, 4)
+    arrays, to advance ``N`` geodesics at once
 
     Parameters
     ----------
@@ -198,6 +559,137 @@ def _flow_mixed(q1, p1, q2, p2, delta=0.5, omega=1.0):
     return q1_next, p1_next, q2_next, p2_next
 
 
+# Composition schemes, for orders above 4
+_SCHEMES = ("triple_jump", "yoshida", "kahan_li")
+
+# Step-size fractions of symmetric compositions of Order 2 substeps,
+# keyed by ``(scheme, order)``, up to (and including) the central substep
+# Yoshida (1990), Solutions A and D, and Kahan & Li (1997), s9odr6a and s17odr8a
+_COMPOSITIONS = {
+    # 7 stages
+    ("yoshida", 6): (
+        0.784513610477560,
+        0.235573213359357,
+        -1.17767998417887,
+        1.3151863206839063,
+    ),
+    # 15 stages
+    ("yoshida", 8): (
+        0.914844246229740,
+        0.253693336566229,
+        -1.44485223686048,
+        -0.158240635368243,
+        1.93813913762276,
+        -1.96061023297549,
+        0.102799849391985,
+        1.7084530707869978,
+    ),
+    # 9 stages
+    ("kahan_li", 6): (
+        0.39216144400731413927925056,
+        0.33259913678935943859974864,
+        -0.70624617255763935980996482,
+        0.08221359629355080023149045,
+        0.79854399093482996339895035,
+    ),
+    # 17 stages
+    ("kahan_li", 8): (
+        0.13020248308889008087881763,
+        0.56116298177510838456196441,
+        -0.38947496264484728640807860,
+        0.15884190655515560089621075,
+        -0.39590389413323757733623154,
+        0.18453964097831570709183254,
+        0.25837438768632204729397911,
+        0.29501172360931029887096624,
+        -0.60550853383003451169892108,
+    ),
+}
+
+
+def _constraint_summary(violation, const, rtol, atol, steps):
+    """
+    Summarizes the violation of the Hamiltonian constraint,
+    :math:`g^{\\mu \\nu} p_{\\mu} p_{\\nu} - const`, over many steps
+    ``NaN`` entries (padding, after termination) are ignored.
+
+    Parameters
+    ----------
+    violation : ~numpy.ndarray
+        Shape-(M,) array, or Shape-(M, N) array for ``N`` geodesics,
+        containing the violation after each of ``M`` steps
+    const : float
+        Value of the constraint, ``-1`` or ``0``
+    rtol : float
+        Relative Tolerance
+    atol : float
+        Absolute Tolerance
+    steps : ~numpy.ndarray
+        Shape-(M,) array, containing the (zero-based) index of each step
+
+    Returns
+    -------
+    dict
+        ``"max"``, ``"mean"`` and ``"rms"`` of the absolute violation,
+        the number of steps, at which tolerance was exceeded, ``"n_exceeded"``,
+        and the first of them, ``"first_exceeded"``, counting from ``1``,
+        as in per-step warnings, or ``None``
+
+    """
+    M = violation.shape[0]
+    abs_violation = np.abs(violation).reshape(M, int(np.prod(violation.shape[1:])))
+    exceeded = abs_violation > atol + rtol * abs(const)
+    exceeded = exceeded.any(axis=-1)
+    valid = abs_violation[~np.isnan(abs_violation)]
+
+    return {
+        "max": float(valid.max()) if valid.size else 0.0,
+        "mean": float(valid.mean()) if valid.size else 0.0,
+        "rms": float(np.sqrt(np.mean(valid ** 2))) if valid.size else 0.0,
+        "n_exceeded": int(exceeded.sum()),
+        "first_exceeded": int(steps[exceeded.argmax()]) + 1 if exceeded.any() else None,
+    }
+
+
+def _merge_constraint_summaries(first, second, n_first, n_second):
+    """
+    Merges summaries of the violation of the Hamiltonian constraint,
+    as returned by ``_constraint_summary``, over consecutive runs of steps,
+    with ``n_first`` and ``n_second`` valid (non-``NaN``) entries, so that
+    streamed chunks can be summarized without keeping their violation
+
+    """
+    n = n_first + n_second
+    w = n_second / n if n else 0.0
+    first_exceeded = first["first_exceeded"]
+
+    return {
+        "max": max(first["max"], second["max"]),
+        "mean": (1 - w) * first["mean"] + w * second["mean"],
+        "rms": float(np.sqrt((1 - w) * first["rms"] ** 2 + w * second["rms"] ** 2)),
+        "n_exceeded": first["n_exceeded"] + second["n_exceeded"],
+        "first_exceeded": (
+            second["first_exceeded"] if first_exceeded is None else first_exceeded
+        ),
+    }
+
+
+def _warn_constraint(summary, n_steps):
+    """
+    Issues one warning, for all steps, at which the
+    Hamiltonian constraint exceeded tolerance, in ``summary``
+
+    """
+    if summary["n_exceeded"]:
+        warnings.warn(
+            "Numerical error has exceeded specified tolerance at "
+            f"{summary['n_exceeded']} of {n_steps} steps, "
+            f"first at step = {summary['first_exceeded']}. "
+            f"Maximum violation of the Hamiltonian constraint = {summary['max']:.3e}.",
+            RuntimeWarning,
+        )
+
+
 def _Z(order):
     """
     Returns the constants for Yoshida Triple Jump.
@@ -217,3 +709,53 @@ def _Z(order):
     Z1 = 1 / (2 - x)
 
     return Z0, Z1
+
+
+def _composition_weights(order, scheme="triple_jump"):
+    """
+    Returns the fractions of the step-size, taken by each of the
+    Order 2 substeps, that compose one step of an integrator of
+    the given (even) order. For ``"triple_jump"``, mirrors the composition,
+    used by ``GeodesicIntegrator._ord_4``, ``_ord_6`` and ``_ord_8``.
+
+    Parameters
+    ----------
+    order : int
+        Integration Order
+    scheme : str, optional
+        Composition scheme, one of ``"triple_jump"``,
+        ``"yoshida"`` or ``"kahan_li"``
+        Orders 2 and 4 always use the triple jump
+        Defaults to ``"triple_jump"``
+
+    Returns
+    -------
+    ~numpy.ndarray
+        Step-size fractions, with ``3 ** ((order - 2) / 2)`` elements
+        for ``"triple_jump"``, or as listed in ``_COMPOSITIONS``
+
+    Raises
+    ------
+    NotImplementedError
+        If ``scheme`` is not one of ``_SCHEMES``
+
+    """
+    if scheme not in _SCHEMES:
+        raise NotImplementedError(
+            f"'{scheme}' composition scheme is unsupported. Use one of {_SCHEMES}."
+        )
+
+    if (scheme, order) in _COMPOSITIONS:
+        half = np.array(_COMPOSITIONS[(scheme, order)])
+        return np.concatenate((half, half[-2::-1]))
+
+    weights = np.array([1.0])
+    if order == 2:
+        return weights
+
+    # Each level of the recursion uses the constants of its own order
+    for level in range(4, order + 1, 2):
+        Z0, Z1 = _Z(level)
+        weights = np.concatenate((Z1 * weights, Z0 * weights, Z1 * weights))
+
+    return weights
@@ -1,3 +1,4 @@
+from .binet import BinetSolver
 from .shadow import Shadow
 
-__all__ = ["Shadow"]
+__all__ = ["BinetSolver", "Shadow"]
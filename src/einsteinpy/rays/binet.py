@@ -0,0 +1,331 @@
+"""
+Null geodesics in Schwarzschild spacetime, from the orbit (Binet) equation
+
+Photons move in a plane, where the inverse radius, :math:`u = M / r`, obeys
+
+.. math::
+
+    \\frac{d^2 u}{d\\phi^2} = 3 u^2 - u, \\quad
+    \\left(\\frac{du}{d\\phi}\\right)^2 = 2 u^3 - u^2 + \\frac{1}{b^2}
+
+for impact parameter, ``b``, in M-Units. Rays with :math:`b > 3 \\sqrt{3}`
+are scattered, while all others are captured by the black hole.
+In closed form, :math:`u = 1 / 6 + 2 \\wp(\\phi - \\phi_0; g_2, g_3)`, with
+:math:`g_2 = 1 / 12` and :math:`g_3 = 1 / 216 - 1 / (4 b^2)`, where the
+Weierstrass elliptic function, :math:`\\wp`, is evaluated through
+Jacobi elliptic functions [2]_.
+Unit System: M-Units => :math:`c = G = M = k_e = 1`
+
+References
+----------
+.. [1] Darwin, C.; "The gravity field of a particle";
+    Proceedings of the Royal Society of London A 249, 180-194, 1959
+.. [2] Gibbons, G. W. and Vyska, M.; "The application of Weierstrass elliptic
+    functions to Schwarzschild null geodesics"; Classical and Quantum Gravity
+    29 (6), 065016, 2012; `arXiv:1110.6508 <https://arxiv.org/abs/1110.6508>`__
+
+"""
+import numpy as np
+from scipy.special import ellipj, ellipk, ellipkinc
+
+# Critical impact parameter, of the photon sphere
+_B_CRIT = 3 * np.sqrt(3)
+
+
+def _hermite(phi, phi0, h, u0, u1, du0, du1):
+    """
+    Cubic Hermite interpolation of ``u`` over steps of size ``h``,
+    starting at ``phi0``
+
+    """
+    s = (phi - phi0) / h
+    return (
+        (2 * s ** 3 - 3 * s ** 2 + 1) * u0
+        + (s ** 3 - 2 * s ** 2 + s) * h * du0
+        + (-2 * s ** 3 + 3 * s ** 2) * u1
+        + (s ** 3 - s ** 2) * h * du1
+    )
+
+
+class BinetSolver:
+    """
+    Vectorized solver for null geodesics in Schwarzschild spacetime,
+    parametrized by their impact parameters
+    Orbits are obtained, either by integrating the Binet equation with the
+    classical 4th order Runge-Kutta method, for all rays at once, or in
+    closed form, with Weierstrass elliptic functions.
+    Working in Geometrized Units (M-Units),
+    with :math:`c = G = M = k_e = 1`
+
+    """
+
+    def __init__(self, impact_parameter, closed_form=False, delta=1e-2, phi_max=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        impact_parameter : float or array_like
+            Impact parameters, ``b``, of the rays, in M-Units
+        closed_form : bool, optional
+            Whether to evaluate orbits and deflection angles in closed form,
+            instead of integrating the Binet equation
+            Defaults to ``False``
+        delta : float, optional
+            Step-size in azimuth, for integration
+            Defaults to ``1e-2``
+        phi_max : float, optional
+            Azimuth, at which integration is stopped, if some rays have
+            neither escaped, nor been captured. Rays, that are close to
+            the critical impact parameter, wind around the photon sphere
+            Defaults to ``4 * pi``
+
+        Raises
+        ------
+        ValueError
+            If any impact parameter is not positive, or if ``delta``
+            is not positive
+
+        """
+        b = np.asarray(impact_parameter, dtype=float)
+        if np.any(b <= 0):
+            raise ValueError("Impact parameters must be positive.")
+        if delta <= 0:
+            raise ValueError(f"Step-size must be positive. Supplied: {delta}")
+
+        self.impact_parameter = b
+        self.closed_form = closed_form
+        self.delta = delta
+        self.phi_max = 4 * np.pi if phi_max is None else phi_max
+        self._table = None
+
+    def __repr__(self):
+        return f"""BinetSolver Object:(\n\
+            Impact Parameters : ({self.impact_parameter}),\n\
+            Closed Form : ({self.closed_form})\n\
+        )"""
+
+    def __str__(self):
+        return self.__repr__()
+
+    @property
+    def captured(self):
+        """
+        Returns whether each ray is captured, i.e.
+        :math:`b < 3 \\sqrt{3}`
+
+        """
+        return self.impact_parameter < _B_CRIT
+
+    @property
+    def roots(self):
+        """
+        Returns the roots, :math:`u_1 \\le u_2 \\le u_3`, of
+        :math:`2 u^3 - u^2 + 1 / b^2`, with shape ``b.shape + (3,)``
+        Periapsis of scattered rays is at :math:`u_2`. Captured rays
+        have a single real root, and the others are ``nan``.
+
+        """
+        b = self.impact_parameter
+        c = 1 - 54 / b ** 2
+        with np.errstate(invalid="ignore"):
+            th = np.arccos(np.clip(c, -1.0, 1.0)) / 3
+        k = 2 * np.pi * np.arange(2, -1, -1) / 3
+        roots = 1 / 6 + np.cos(th[..., None] - k) / 3
+        # Single real root, with c < -1
+        cap = self.captured
+        single = -np.cosh(np.arccosh(np.maximum(-c, 1.0)) / 3) / 3 + 1 / 6
+        roots[..., 0] = np.where(cap, single, roots[..., 0])
+        roots[..., 1:] = np.where(cap[..., None], np.nan, roots[..., 1:])
+
+        return roots
+
+    @property
+    def closest_approach(self):
+        """
+        Returns the radius of closest approach, in M-Units,
+        which is ``nan`` for captured rays
+
+        """
+        return 1 / self.roots[..., 1]
+
+    @property
+    def deflection_angle(self):
+        """
+        Returns the angle, by which the rays are deflected,
+        :math:`\\Delta \\phi - \\pi`, which is ``nan`` for captured rays,
+        and for rays, that have not escaped by ``phi_max``, on integration
+
+        """
+        if self.closed_form:
+            return 2 * self._periapsis() - np.pi
+
+        phi_end, escaped = self._integrate()[-2:]
+        phi_end = np.where(escaped, phi_end, np.nan)
+
+        return phi_end.reshape(self.impact_parameter.shape) - np.pi
+
+    def _periapsis(self):
+        """
+        Returns the azimuth of periapsis of scattered rays,
+        from incoming infinity
+
+        """
+        u1, u2, u3 = np.moveaxis(self.roots, -1, 0)
+        w = np.sqrt((u3 - u1) / 2)
+        m = (u2 - u1) / (u3 - u1)
+        # u = 0, where cd^2(w psi | m) = -u1 / (u2 - u1)
+        x = np.sqrt(-u1 / (u2 - u1))
+        return (ellipk(m) - ellipkinc(np.arcsin(x), m)) / w
+
+    def _orbit_closed_form(self, phi):
+        """
+        Evaluates ``u`` in closed form, for Shape-(N, 1) impact parameters
+        and Shape-(S,) azimuths
+
+        """
+        g2 = 1 / 12
+        u = np.full((self.impact_parameter.size, phi.size), np.nan)
+
+        # Scattered rays, u = 1 / 6 + 2 P(phi - phi_p + w'), in real form
+        with np.errstate(invalid="ignore", divide="ignore"):
+            u1, u2, u3 = np.moveaxis(self.roots.reshape(-1, 3), -1, 0)[:, :, None]
+            w = np.sqrt((u3 - u1) / 2)
+            m = (u2 - u1) / (u3 - u1)
+            phi_p = self._periapsis().reshape(-1, 1)
+            _, cn, dn, _ = ellipj(w * (phi - phi_p), m)
+            scattered = u1 + (u2 - u1) * (cn / dn) ** 2
+        mask = ~self.captured.reshape(-1, 1) & (phi <= 2 * phi_p)
+        u = np.where(mask, scattered, u)
+
+        # Captured rays, u = 1 / 6 + 2 P(z_0 - phi), with a single real root, e
+        e = (self.roots.reshape(-1, 3)[:, :1] - 1 / 6) / 2
+        with np.errstate(invalid="ignore", divide="ignore"):
+            H = np.sqrt(3 * e ** 2 - g2 / 4)
+            m = 0.5 - 3 * e / (4 * H)
+
+            def z(p):
+                # Inverse of P, on the real line
+                X = (p - e) / H
+                return ellipkinc(np.arccos((X - 1) / (X + 1)), m) / (2 * np.sqrt(H))
+
+            z0 = z(-1 / 12)
+            cn = ellipj(2 * np.sqrt(H) * (z0 - phi), m)[1]
+            captured = 1 / 6 + 2 * (e + H * (1 + cn) / (1 - cn))
+        # Until the horizon, u = 1 / 2, i.e. P = 1 / 6
+        mask = self.captured.reshape(-1, 1) & (phi <= z0 - z(1 / 6))
+        u = np.where(mask, captured, u)
+
+        return np.where(phi >= 0, u, np.nan)
+
+    def _integrate(self):
+        """
+        Integrates the Binet equation for all rays, from incoming infinity,
+        until they escape, or cross the horizon, or ``phi_max`` is reached
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(S,) array of azimuths
+        ~numpy.ndarray
+            Shape-(S, N) array of ``u``
+        ~numpy.ndarray
+            Shape-(S, N) array of ``du / dphi``
+        ~numpy.ndarray
+            Shape-(N,) array of azimuths, at which the rays terminate
+        ~numpy.ndarray
+            Shape-(N,) boolean array, set for escaping rays
+
+        """
+        if self._table is not None:
+            return self._table
+
+        h = self.delta
+        b = self.impact_parameter.reshape(-1)
+        y = np.stack((np.zeros_like(b), 1 / b))
+        active = np.ones(b.shape, dtype=bool)
+        phi_end = np.full(b.shape, np.nan)
+        escaped = np.zeros(b.shape, dtype=bool)
+
+        def f(y):
+            return np.stack((y[1], 3 * y[0] ** 2 - y[0]))
+
+        n = int(np.ceil(self.phi_max / h))
+        us, dus = [y[0]], [y[1]]
+        for i in range(n):
+            k1 = f(y)
+            k2 = f(y + h / 2 * k1)
+            k3 = f(y + h / 2 * k2)
+            k4 = f(y + h * k3)
+            y_new = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+            # Escape, u = 0, or capture, u = 1 / 2, within this step
+            out = active & (y_new[0] < 0)
+            cap = active & (y_new[0] > 0.5)
+            for hit, level in ((out, 0.0), (cap, 0.5)):
+                if np.any(hit):
+                    args = (
+                        i * h,
+                        h,
+                        y[0, hit],
+                        y_new[0, hit],
+                        y[1, hit],
+                        y_new[1, hit],
+                    )
+                    # Bisection of the Hermite interpolant
+                    lo, hi = np.full(hit.sum(), i * h), np.full(hit.sum(), (i + 1) * h)
+                    for _ in range(50):
+                        mid = (lo + hi) / 2
+                        below = (_hermite(mid, *args) - level) * (y[0, hit] - level) > 0
+                        lo, hi = np.where(below, mid, lo), np.where(below, hi, mid)
+                    phi_end[hit] = (lo + hi) / 2
+            # Terminated rays are kept for this step, for interpolation
+            y_new[:, ~active] = np.nan
+            escaped |= out
+            active &= ~(out | cap)
+            y = y_new
+            us.append(y[0])
+            dus.append(y[1])
+            if not np.any(active):
+                break
+
+        phi = h * np.arange(len(us))
+        self._table = phi, np.array(us), np.array(dus), phi_end, escaped
+        return self._table
+
+    def orbit(self, phi):
+        """
+        Returns the inverse radius, :math:`u = M / r`, of each ray, at
+        azimuths ``phi``, measured from incoming infinity, where ``u = 0``
+        Values after escape, or capture at the horizon, are ``nan``.
+
+        Parameters
+        ----------
+        phi : float or array_like
+            Azimuths
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Inverse radii, with shape ``b.shape + phi.shape``
+
+        """
+        phi = np.asarray(phi, dtype=float)
+        shape = self.impact_parameter.shape + phi.shape
+        phi = phi.reshape(-1)
+
+        if self.closed_form:
+            return self._orbit_closed_form(phi).reshape(shape)
+
+        grid, us, dus, phi_end = self._integrate()[:4]
+        h = self.delta
+        i = np.clip(np.floor(phi / h).astype(int), 0, grid.size - 2)
+        u = _hermite(
+            phi[:, None], grid[i, None], h, us[i], us[i + 1], dus[i], dus[i + 1]
+        ).T
+        # Within the final step, the interpolant reaches beyond the end
+        valid = (phi >= 0) & (phi <= grid[-1])
+        valid = valid & ~(phi > phi_end[:, None])
+        u = np.where(valid & ~np.isnan(u), u, np.nan)
+
+        return u.reshape(shape)
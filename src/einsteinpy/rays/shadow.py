@@ -4,7 +4,8 @@ import numpy as np
 from astropy import units as u
 from scipy.integrate import fixed_quad
 from scipy.interpolate import interp1d
-from scipy.optimize import newton
+
+from .binet import BinetSolver
 
 
 class Shadow:
@@ -22,15 +23,12 @@ class Shadow:
         self.horizon = 2 * self.mass.value  # To be changed after 0.3.0
         self.b_crit = 3 * np.sqrt(3) * self.mass
         self.b = self._compute_B()
-        self.z = list()
-        self.bfin = list()
         warnings.filterwarnings("ignore")
-        for i in self.b:
-            root = newton(self._root_equation, 0.1, args=(i,))
-            if np.isreal(root):
-                self.bfin.append(i)
-                self.z.append([i, np.real(root)])
-        self.z = np.array(self.z)
+        # Turning points of all rays at once, scaled from M-Units
+        r_tp = self.mass.value * self._turning_points(self.b / self.mass.value)
+        real = ~np.isnan(r_tp)
+        self.bfin = list(self.b[real])
+        self.z = np.stack((self.b[real], r_tp[real]), axis=-1)
         self.k0 = self._intensity()
         self.k1 = self._intensity_from_event_horizon()
         self.intensity = self.k1 + self.k0
@@ -44,11 +42,12 @@ class Shadow:
         """
         return np.linspace(self.b_crit.value, self.fov.value, self.n_rays)
 
-    def _root_equation(self, r_tp, i):
+    def _turning_points(self, b):
         """
-        Returns the root of the equation for ``r_tp`` (turning points) for some impact parameter
+        Returns the turning points, ``r_tp``, for an array of impact parameters,
+        in M-Units, which are ``nan`` for captured rays
         """
-        return r_tp / ((1 - (2 * int(self.mass.value) / r_tp))) ** 0.5 - i
+        return BinetSolver(b).closest_approach
 
     def _intensity_blue_sch(self, r, b):
         """
@@ -3,6 +3,7 @@ from .constants import SymbolicConstant, get_constant
 from .einstein import EinsteinTensor
 from .helpers import TransformationMatrix, simplify_sympy_array
 from .metric import MetricTensor
+from .numerical import NumericMetric, compile_metric
 from .predefined.alcubierre_warp import AlcubierreWarp
 from .predefined.barriola_vilenkin import BarriolaVilekin
 from .predefined.bertotti_kasner import BertottiKasner
@@ -37,6 +38,8 @@ __all__ = [
     "TransformationMatrix",
     "simplify_sympy_array",
     "MetricTensor",
+    "NumericMetric",
+    "compile_metric",
     "RicciScalar",
     "RicciTensor",
     "RiemannCurvatureTensor",
@@ -0,0 +1,247 @@
+"""
+Compilation of symbolic Metric Tensors into numerical functions,
+that can be used with the numerical Geodesic integrators
+
+The metric is inverted and differentiated symbolically, once.
+Common subexpressions are then eliminated, and the results are
+emitted as vectorized NumPy functions, which can optionally
+be compiled with ``numba``.
+
+"""
+import numpy as np
+import sympy
+from sympy.printing.lambdarepr import NumPyPrinter
+
+_SIGNATURES = ("-+++", "+---")
+
+
+def _kernel(name, args, exprs, size):
+    """
+    Emits a vectorized function of ``args``, that evaluates
+    ``exprs``, after eliminating common subexpressions,
+    and returns them as a Shape-(size, N) array
+
+    Parameters
+    ----------
+    name : str
+        Name of the function
+    args : list
+        Sympy symbols, that are the arguments of the function
+        Coordinates, the first 4 arguments, are Shape-(N,) arrays
+    exprs : list
+        Sympy expressions, of length ``size``
+    size : int
+        Number of expressions
+
+    Returns
+    -------
+    function
+        Vectorized function
+    str
+        Source code of the function
+
+    """
+    replacements, reduced = sympy.cse(exprs, symbols=sympy.numbered_symbols("_s"))
+    printer = NumPyPrinter()
+
+    lines = [f"def {name}({', '.join(str(a) for a in args)}):"]
+    for sym, expr in replacements:
+        lines.append(f"    {sym} = {printer.doprint(expr)}")
+    lines.append(f"    _out = numpy.zeros(({size}, {args[0]}.shape[0]))")
+    for i, expr in enumerate(reduced):
+        # Outputs are zero-initialized
+        if expr != 0:
+            lines.append(f"    _out[{i}] = {printer.doprint(expr)}")
+    lines.append("    return _out")
+    source = "\n".join(lines) + "\n"
+
+    namespace = dict(vars(np))
+    namespace["numpy"] = np
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+
+    return namespace[name], source
+
+
+class NumericMetric:
+    """
+    Contravariant Metric Function, and its derivatives, compiled from
+    a symbolic ``MetricTensor``, with the call signature
+    ``(x_vec, *params)`` of the numerical Geodesic integrators
+    Instances can be passed as ``metric`` to
+    ``einsteinpy.geodesic.Geodesic``, or
+    ``einsteinpy.integrators.GeodesicIntegrator``, which use ``dg_dx``
+    for the metric derivatives, instead of Automatic Differentiation.
+
+    """
+
+    def __init__(self, metric, variables=None, signature="-+++", jit=False):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        metric : ~einsteinpy.symbolic.metric.MetricTensor
+            Symbolic Metric Tensor, in either configuration
+            Constants, that are not in ``variables``, should be substituted
+        variables : list, optional
+            Sympy symbols for the parameters of the metric, in the order,
+            in which they are passed as ``params``
+            Defaults to ``metric.variables``
+        signature : str, optional
+            Signature of ``metric``, ``"-+++"`` or ``"+---"``
+            Metrics with signature ``"+---"`` are negated, to follow
+            the convention of the numerical integrators
+            Defaults to ``"-+++"``
+        jit : bool, optional
+            Whether to compile the functions with ``numba``
+            Falls back to NumPy execution, if ``numba`` is not installed
+            Defaults to ``False``
+
+        Raises
+        ------
+        ValueError
+            If ``metric`` is not 4-dimensional, or contains undefined functions,
+            or if ``signature`` is not supported
+
+        """
+        if signature not in _SIGNATURES:
+            raise ValueError(
+                f"Signature must be one of {_SIGNATURES}. Supplied: '{signature}'"
+            )
+        if metric.dims != 4:
+            raise ValueError(
+                f"Only 4-dimensional metrics can be compiled. Supplied: {metric.dims}"
+            )
+        if metric.functions:
+            raise ValueError(
+                "Metrics with undefined functions cannot be compiled. "
+                f"Supplied: {metric.functions}"
+            )
+
+        self.name = metric.name
+        self.__name__ = metric.name
+        self.syms = tuple(metric.syms)
+        self.variables = tuple(metric.variables if variables is None else variables)
+        self.signature = signature
+
+        # Inverted (and simplified) symbolically, once
+        g = metric if metric.config == "uu" else metric.inv()
+        g = sympy.Matrix(g.arr.tolist())
+        if signature == "+---":
+            g = -g
+
+        # Replacing symbols with valid, unambiguous identifiers
+        x = sympy.symbols("_x0:4")
+        prms = sympy.symbols(f"_p0:{len(self.variables)}")
+        names = dict(zip(self.syms + self.variables, x + prms))
+        g = g.xreplace(names)
+
+        exprs = [g[i, j] for i in range(4) for j in range(4)]
+        # Differentiated symbolically, once, indexed as [alpha, mu, nu]
+        d_exprs = [sympy.diff(e, x[a]) for a in range(4) for e in exprs]
+
+        args = list(x + prms)
+        self._g, self.metric_source = _kernel("_g", args, exprs, 16)
+        self._dg, self.dg_dx_source = _kernel("_dg", args, d_exprs, 64)
+        if jit:
+            from einsteinpy.ijit import jit as _jit
+
+            self._g, self._dg = _jit(self._g), _jit(self._dg)
+
+    def __repr__(self):
+        return (
+            f"NumericMetric(name={self.name}, syms={self.syms}, "
+            f"variables={self.variables}, signature={self.signature})"
+        )
+
+    def __str__(self):
+        return self.__repr__()
+
+    @staticmethod
+    def _evaluate(kernel, x_vec, params, shape):
+        """
+        Evaluates ``kernel`` at 4-Position(s) ``x_vec``,
+        and reshapes the outputs to ``shape``
+
+        """
+        x = np.broadcast_arrays(*[np.asarray(xi, dtype=float) for xi in x_vec])
+        batch = x[0].shape
+        x = [np.ascontiguousarray(xi).reshape(-1) for xi in x]
+        out = kernel(*x, *[float(p) for p in params])
+
+        return out.reshape(shape + batch)
+
+    def __call__(self, x_vec, *params):
+        """
+        Returns the Contravariant Metric
+
+        Parameters
+        ----------
+        x_vec : array_like
+            4-Position, whose components can be arrays of shape ``(N,)``
+
+        Other Parameters
+        ----------------
+        params : array_like
+            Values of ``variables``
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Shape-(4, 4) array, or Shape-(4, 4, N) array for ``N`` positions
+
+        """
+        return self._evaluate(self._g, x_vec, params, (4, 4))
+
+    def dg_dx(self, x_vec, *params):
+        """
+        Returns the derivatives of the Contravariant Metric
+
+        Parameters
+        ----------
+        x_vec : array_like
+            4-Position, whose components can be arrays of shape ``(N,)``
+
+        Other Parameters
+        ----------------
+        params : array_like
+            Values of ``variables``
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Derivatives, indexed as ``[alpha, mu, nu]``, for
+            :math:`\\partial_{\\alpha} g^{\\mu \\nu}`
+            Shape-(4, 4, 4) array, or Shape-(4, 4, 4, N) array for ``N`` positions
+
+        """
+        return self._evaluate(self._dg, x_vec, params, (4, 4, 4))
+
+
+def compile_metric(metric, variables=None, signature="-+++", jit=False):
+    """
+    Compiles a symbolic Metric Tensor into a numerical Contravariant
+    Metric Function, and its derivatives, for the numerical Geodesic
+    integrators. See ``NumericMetric`` for details.
+
+    Parameters
+    ----------
+    metric : ~einsteinpy.symbolic.metric.MetricTensor
+        Symbolic Metric Tensor
+    variables : list, optional
+        Sympy symbols for the parameters of the metric
+        Defaults to ``metric.variables``
+    signature : str, optional
+        Signature of ``metric``, ``"-+++"`` or ``"+---"``
+        Defaults to ``"-+++"``
+    jit : bool, optional
+        Whether to compile the functions with ``numba``
+        Defaults to ``False``
+
+    Returns
+    -------
+    ~einsteinpy.symbolic.numerical.NumericMetric
+        Compiled Metric
+
+    """
+    return NumericMetric(metric, variables=variables, signature=signature, jit=jit)
@@ -1,5 +1,5 @@
-from .dual import DualNumber, _deriv, _diff_g, _jacobian_g
+from .dual import DualArray, DualNumber, _deriv, _diff_g, _jacobian_g
 from .exceptions import BaseError, CoordinateError
 from .scalar_factor import scalar_factor, scalar_factor_derivative
 
-__all__ = ["BaseError", "CoordinateError", "DualNumber"]
+__all__ = ["BaseError", "CoordinateError", "DualArray", "DualNumber"]
@@ -124,6 +124,203 @@ class DualNumber:
         return DualNumber(np.exp(self.val), self.deriv * np.exp(self.val))
 
 
+class DualArray:
+    """
+    Array-valued Dual Numbers, :math:`a + b\\epsilon`, where both
+    :math:`a` and :math:`b` are ``numpy`` arrays.
+    Unlike ``DualNumber``, operations are carried out on whole arrays,
+    which allows functions (e.g. metrics) to be differentiated
+    at many points, with a single evaluation.
+    ``numpy`` ufuncs, such as ``np.sin`` or ``np.power``, are supported.
+
+    """
+
+    def __init__(self, val, deriv):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        val : array_like
+            Value
+        deriv : array_like
+            Directional Derivative
+            Must be broadcastable to the shape of ``val``
+
+        """
+        self.val = np.asarray(val, dtype=float)
+        self.deriv = np.asarray(deriv, dtype=float)
+
+    def __str__(self):
+        return f"DualArray({self.val}, {self.deriv})"
+
+    def __repr__(self):
+        return self.__str__()
+
+    @property
+    def shape(self):
+        """
+        Returns the shape of ``val``
+
+        """
+        return self.val.shape
+
+    def __add__(self, other):
+        if isinstance(other, DualArray):
+            return DualArray(self.val + other.val, self.deriv + other.deriv)
+
+        return DualArray(self.val + other, self.deriv)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, DualArray):
+            return DualArray(self.val - other.val, self.deriv - other.deriv)
+
+        return DualArray(self.val - other, self.deriv)
+
+    def __rsub__(self, other):
+        return DualArray(other - self.val, -self.deriv)
+
+    def __mul__(self, other):
+        if isinstance(other, DualArray):
+            return DualArray(
+                self.val * other.val, self.deriv * other.val + self.val * other.deriv
+            )
+
+        return DualArray(self.val * other, self.deriv * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, DualArray):
+            return DualArray(
+                self.val / other.val,
+                (self.deriv * other.val - self.val * other.deriv) / (other.val ** 2),
+            )
+
+        return DualArray(self.val / other, self.deriv / other)
+
+    def __rtruediv__(self, other):
+        return DualArray(other / self.val, -other * self.deriv / (self.val ** 2))
+
+    def __neg__(self):
+        return DualArray(-self.val, -self.deriv)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Dispatches ``numpy`` ufuncs, e.g. ``np.sin(x)`` or
+        ``ndarray * x``, to the corresponding methods
+
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        if ufunc in _DUAL_UNARY_UFUNCS:
+            return getattr(inputs[0], _DUAL_UNARY_UFUNCS[ufunc])()
+
+        if ufunc in _DUAL_BINARY_UFUNCS:
+            name, rname = _DUAL_BINARY_UFUNCS[ufunc]
+            x, y = inputs
+            if isinstance(x, DualArray):
+                return getattr(x, name)(y)
+
+            return getattr(y, rname)(x)
+
+        return NotImplemented
+
+    def __pos__(self):
+        return self
+
+    def __pow__(self, power):
+        if isinstance(power, DualArray):
+            val = self.val ** power.val
+            return DualArray(
+                val,
+                val
+                * (power.deriv * np.log(self.val) + power.val * self.deriv / self.val),
+            )
+
+        return DualArray(
+            self.val ** power, self.deriv * power * self.val ** (power - 1)
+        )
+
+    def __rpow__(self, base):
+        val = base ** self.val
+
+        return DualArray(val, val * np.log(base) * self.deriv)
+
+    def sin(self):
+        return DualArray(np.sin(self.val), self.deriv * np.cos(self.val))
+
+    def cos(self):
+        return DualArray(np.cos(self.val), -self.deriv * np.sin(self.val))
+
+    def tan(self):
+        return DualArray(np.tan(self.val), self.deriv / np.cos(self.val) ** 2)
+
+    def log(self):
+        return DualArray(np.log(self.val), self.deriv / self.val)
+
+    def exp(self):
+        val = np.exp(self.val)
+
+        return DualArray(val, self.deriv * val)
+
+    def sqrt(self):
+        val = np.sqrt(self.val)
+
+        return DualArray(val, 0.5 * self.deriv / val)
+
+    def square(self):
+        return self * self
+
+    def arcsin(self):
+        return DualArray(np.arcsin(self.val), self.deriv / np.sqrt(1 - self.val ** 2))
+
+    def arccos(self):
+        return DualArray(np.arccos(self.val), -self.deriv / np.sqrt(1 - self.val ** 2))
+
+    def arctan(self):
+        return DualArray(np.arctan(self.val), self.deriv / (1 + self.val ** 2))
+
+    def sinh(self):
+        return DualArray(np.sinh(self.val), self.deriv * np.cosh(self.val))
+
+    def cosh(self):
+        return DualArray(np.cosh(self.val), self.deriv * np.sinh(self.val))
+
+    def tanh(self):
+        return DualArray(np.tanh(self.val), self.deriv / np.cosh(self.val) ** 2)
+
+
+_DUAL_UNARY_UFUNCS = {
+    np.negative: "__neg__",
+    np.positive: "__pos__",
+    np.sin: "sin",
+    np.cos: "cos",
+    np.tan: "tan",
+    np.log: "log",
+    np.exp: "exp",
+    np.sqrt: "sqrt",
+    np.square: "square",
+    np.arcsin: "arcsin",
+    np.arccos: "arccos",
+    np.arctan: "arctan",
+    np.sinh: "sinh",
+    np.cosh: "cosh",
+    np.tanh: "tanh",
+}
+
+_DUAL_BINARY_UFUNCS = {
+    np.add: ("__add__", "__radd__"),
+    np.subtract: ("__sub__", "__rsub__"),
+    np.multiply: ("__mul__", "__rmul__"),
+    np.true_divide: ("__truediv__", "__rtruediv__"),
+    np.power: ("__pow__", "__rpow__"),
+}
+
+
 def _deriv(func, x):
     """
     Calculates first (partial) derivative of ``func`` at ``x``
@@ -201,7 +398,7 @@ def _diff_g(g, g_prms, coords, indices, wrt):
     return _deriv(lambda q: g(dual_coords, *g_prms)[indices], coords[wrt])
 
 
-def _jacobian_g(g, g_prms, coords, wrt):
+def _jacobian_g(g, g_prms, coords, wrt, return_metric=False):
     """
     Part of Jacobian of Metric
 
@@ -214,25 +411,53 @@ def _jacobian_g(g, g_prms, coords, wrt):
         E.g., ``(a,)`` for Kerr
     coords : array_like
         4-Position
+        Each component may also be an array of shape ``(N,)``,
+        to evaluate the Jacobian at ``N`` positions at once
     wrt : int
         Coordinate, with respect to which, the derivative
         will be calculated
         Takes values from ``[0, 1, 2, 3]``
+    return_metric : bool, optional
+        Whether to also return the metric elements at ``coords``,
+        i.e. the real part of the dual evaluation
+        Defaults to ``False``
 
     Returns
     -------
     numpy.ndarray
         Value of derivative of metric elements,
         w.r.t a particular coordinate, at ``coords``
+        Shape-(4, 4) array, or Shape-(4, 4, N) array,
+        if components of ``coords`` are arrays
+    numpy.ndarray
+        Metric elements at ``coords``, with the same shape
+        Only returned, if ``return_metric`` is set
+
+    Notes
+    -----
+    The metric is evaluated only once, on ``DualArray`` coordinates,
+    which yields the derivative of all metric elements simultaneously,
+    along with their values.
 
     """
-    J = np.zeros((4, 4))
+    coords = [np.asarray(coords[i], dtype=float) for i in range(4)]
+    shape = np.broadcast(*coords).shape
+
+    dual_coords = [DualArray(coords[i], float(i == wrt)) for i in range(4)]
+    g_dual = g(dual_coords, *g_prms)
+
+    J = np.zeros((4, 4) + shape)
+    G = np.zeros((4, 4) + shape)
 
     for i in range(4):
         for j in range(4):
-            if i <= j:
-                J[i, j] = _diff_g(g, g_prms, coords, (i, j), wrt)
-
-    J = J + J.T - np.diag(np.diag(J))
+            if isinstance(g_dual[i, j], DualArray):
+                J[i, j] = g_dual[i, j].deriv
+                G[i, j] = g_dual[i, j].val
+            else:
+                G[i, j] = g_dual[i, j]
+
+    if return_metric:
+        return J, G
 
     return J
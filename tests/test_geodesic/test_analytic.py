@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy.integrate import quad
+
+from einsteinpy.geodesic import AnalyticGeodesic, BatchGeodesic, Timelike
+from einsteinpy.geodesic.analytic import _carlson_rf, _carlson_rj, _ellippi
+
+
+@pytest.fixture()
+def orbits():
+    # Inclined and equatorial, eccentric Kerr orbits
+    positions = [[8., np.pi / 3, 0.], [10., np.pi / 2, 0.]]
+    momenta = [[0.3, 1.2, 3.1], [-0.2, 0., 3.7]]
+
+    return positions, momenta
+
+
+def test_carlson_integrals():
+    special = pytest.importorskip("scipy.special")
+    if not hasattr(special, "elliprj"):
+        pytest.skip("scipy.special.elliprj is not available")
+
+    x, y, z, p = 0.3, 0.7, 1.0, 0.4
+    assert_allclose(_carlson_rf(x, y, z), special.elliprf(x, y, z), rtol=1e-13)
+    assert_allclose(_carlson_rj(x, y, z, p), special.elliprj(x, y, z, p), rtol=1e-13)
+
+
+def test_ellippi_quadrature():
+    n, m = 0.4, 0.6
+    phi = np.array([0.3, 2.5, -4.0])
+
+    def f(th):
+        s2 = np.sin(th) ** 2
+        return 1 / ((1 - n * s2) * np.sqrt(1 - m * s2))
+
+    expected = [quad(f, 0., x)[0] for x in phi]
+
+    assert_allclose(_ellippi(n, phi, m), expected, rtol=1e-12)
+
+
+def test_conserved_quantities():
+    geod = AnalyticGeodesic("Kerr", (0.9,), [8., np.pi / 3, 0.], [0.3, 1.2, 3.1])
+    states = geod(np.linspace(0., 500., 11))
+
+    assert_allclose(states[:, 4], -geod.energy, rtol=1e-12)
+    assert_allclose(states[:, 7], geod.angular_momentum, rtol=1e-12)
+    r1, r2 = geod.radial_roots[:2]
+    assert np.all((states[:, 1] >= r2 - 1e-9) & (states[:, 1] <= r1 + 1e-9))
+
+
+@pytest.mark.parametrize(
+    "metric, metric_params, position, momentum",
+    [
+        ("Kerr", (0.9,), [8., np.pi / 3, 0.], [0.3, 1.2, 3.1]),
+        ("KerrNewman", (0.5, 0.3), [9., 2., 1.], [-0.1, -0.8, 3.2]),
+        ("Schwarzschild", (), [10., np.pi / 2, 0.], [0.1, -0.5, 3.7]),
+    ],
+)
+def test_analytic_backend_matches_integration(metric, metric_params, position, momentum):
+    kwargs = dict(
+        metric=metric,
+        metric_params=metric_params,
+        position=position,
+        momentum=momentum,
+        steps=4000,
+        return_cartesian=False,
+        suppress_warnings=True,
+    )
+    ref = Timelike(delta=0.05, order=8, backend="numba", **kwargs)
+    geod = Timelike(delta=0.05, backend="analytic", record_every=100, **kwargs)
+
+    steps, traj = geod.trajectory
+    assert_allclose(steps, ref.trajectory[0][99::100])
+    assert_allclose(traj, ref.trajectory[1][99::100], rtol=1e-5, atol=1e-5)
+
+
+def test_analytic_batch(orbits):
+    positions, momenta = orbits
+    geod = AnalyticGeodesic("Kerr", (0.9,), positions, momenta)
+    tau = np.array([[1., 20.], [300., 4000.]])
+
+    assert geod(tau).shape == (2, 2, 2, 8)
+    assert geod.mino(tau).shape == (2, 2, 2, 8)
+    assert geod.radial_roots.shape == (2, 4)
+
+    single = AnalyticGeodesic("Kerr", (0.9,), positions[1], momenta[1])
+    assert_allclose(geod(tau)[1], single(tau), rtol=1e-12)
+    assert_allclose(single.mino(single.mino_time(tau))[..., :4], single(tau)[..., :4])
+
+    batch = BatchGeodesic(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=positions,
+        momentum=momenta,
+        steps=20,
+        delta=1.,
+        backend="analytic",
+        return_cartesian=False,
+    )
+    assert batch.trajectory[1].shape == (2, 20, 8)
+    assert_allclose(batch.trajectory[1][1], single(np.arange(1., 21.)), rtol=1e-12)
+
+
+def test_analytic_backend_events():
+    geod = Timelike(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[8., np.pi / 3, 0.],
+        momentum=[0.3, 1.2, 3.1],
+        steps=1000,
+        delta=1.,
+        backend="analytic",
+        max_affine=100.,
+        constraint_check="deferred",
+        return_cartesian=False,
+    )
+
+    assert geod.termination_reason == "affine"
+    assert geod.trajectory[0][-1] == 99
+    assert geod.constraint_summary["max"] < 1e-9
+
+
+def test_analytic_ValueError():
+    with pytest.raises(ValueError):
+        # Escaping geodesic
+        AnalyticGeodesic("Schwarzschild", (), [10., np.pi / 2, 0.], [2., 0., 3.])
+    with pytest.raises(ValueError):
+        AnalyticGeodesic("Kerr", (1.2,), [10., np.pi / 2, 0.], [0., 0., 3.7])
+
+
+def test_analytic_NotImplementedError():
+    with pytest.raises(NotImplementedError):
+        AnalyticGeodesic(
+            "Schwarzschild", (), [10., np.pi / 2, 0.], [0., 0., 3.7], time_like=False
+        )
+    with pytest.raises(NotImplementedError):
+        AnalyticGeodesic(
+            lambda x_vec, *params: np.diag([-1., 1., 1., 1.]),
+            (),
+            [10., np.pi / 2, 0.],
+            [0., 0., 3.7],
+        )
+    with pytest.raises(NotImplementedError):
+        Timelike(
+            metric="Kerr",
+            metric_params=(0.5,),
+            position=[10., np.pi / 2, 0.],
+            momentum=[-0.2, 0., 3.7],
+            backend="analytic",
+            adaptive=True,
+        )
@@ -1,10 +1,17 @@
+import json
 import warnings
 
 import numpy as np
 import pytest
+from astropy import units as u
 from numpy.testing import assert_allclose
 
-from einsteinpy.geodesic import Geodesic, Nulllike, Timelike
+from einsteinpy import constant
+from einsteinpy.coordinates import BoyerLindquistDifferential
+from einsteinpy.geodesic import BatchGeodesic, Geodesic, Nulllike, Timelike
+from einsteinpy.geodesic.utils import _BaseMetricFunction, _kerr
+from einsteinpy.integrators.autotune import _AUTOTUNE_CACHE
+from einsteinpy.metric import Kerr
 
 
 @pytest.fixture()
@@ -169,3 +176,645 @@ def test_kerr0_eq_kn00():
 
     assert_allclose(k.trajectory[0], kn.trajectory[0], atol=1e-6, rtol=1e-6)
     assert_allclose(k.trajectory[1], kn.trajectory[1], atol=1e-6, rtol=1e-6)
+
+
+def test_batch_geodesic():
+    position = [[4., np.pi / 3, 0.], [2.5, np.pi / 2, 0.]]
+    momentum = [[0., 0.767851, 2.], [0., 0., -8.5]]
+
+    batch = BatchGeodesic(
+        metric="Kerr",
+        metric_params=(0.5,),
+        position=position,
+        momentum=momentum,
+        steps=20,
+        delta=0.5,
+        return_cartesian=True,
+        suppress_warnings=True,
+    )
+    steps, traj = batch.trajectory
+
+    assert steps.shape == (20,)
+    assert traj.shape == (2, 20, 8)
+
+    for i in range(2):
+        geod = Timelike(
+            metric="Kerr",
+            metric_params=(0.5,),
+            position=position[i],
+            momentum=momentum[i],
+            steps=20,
+            delta=0.5,
+            return_cartesian=True,
+            suppress_warnings=True,
+        )
+
+        assert_allclose(traj[i], geod.trajectory[1], atol=1e-10, rtol=1e-10)
+
+
+def test_batch_geodesic_ValueError():
+    with pytest.raises(ValueError):
+        BatchGeodesic(
+            metric="Kerr",
+            metric_params=(0.5,),
+            position=[[4., np.pi / 3, 0.]],
+            momentum=[[0., 0.767851, 2.], [0., 0., -8.5]],
+        )
+
+
+@pytest.mark.parametrize(
+    "metric, metric_params, position, momentum",
+    [
+        ("Schwarzschild", (), [40., np.pi / 2, 0.], [0., 0., 3.83405]),
+        ("Kerr", (0.9,), [4., np.pi / 3, 0.], [0., 0.767851, 2.]),
+        ("KerrNewman", (0.5, 0.3), [6., np.pi / 3, 0.], [0., 0.5, 3.]),
+    ],
+)
+@pytest.mark.parametrize("order", [2, 4, 8])
+def test_numba_backend_matches_python(metric, metric_params, position, momentum, order):
+    kwargs = dict(
+        metric=metric,
+        metric_params=metric_params,
+        position=position,
+        momentum=momentum,
+        steps=20,
+        delta=0.5,
+        order=order,
+        suppress_warnings=True,
+    )
+    py = Timelike(**kwargs)
+    nb = Timelike(backend="numba", **kwargs)
+
+    assert_allclose(nb.trajectory[0], py.trajectory[0])
+    assert_allclose(nb.trajectory[1], py.trajectory[1], atol=1e-10, rtol=1e-10)
+
+
+def test_numba_backend_batch():
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[[4., np.pi / 3, 0.], [6., np.pi / 2, 0.]],
+        momentum=[[0., 0.767851, 2.], [0., 0., 3.]],
+        steps=10,
+        suppress_warnings=True,
+    )
+    py = BatchGeodesic(**kwargs)
+    nb = BatchGeodesic(backend="numba", **kwargs)
+
+    assert_allclose(nb.trajectory[1], py.trajectory[1], atol=1e-10, rtol=1e-10)
+
+
+def test_numba_backend_runtime_warning():
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        Timelike(
+            metric="Kerr",
+            metric_params=(0.9,),
+            position=[2.15, np.pi / 2, 0.],
+            momentum=[0., 0., 1.5],
+            steps=4,
+            delta=0.5,
+            omega=1.,  # Unstable integration
+            backend="numba",
+        )
+
+        assert len(w) == 2
+        assert issubclass(w[-1].category, RuntimeWarning)
+
+
+def test_backend_NotImplementedError():
+    with pytest.raises(NotImplementedError):
+        Timelike(
+            metric="Kerr",
+            metric_params=(0.9,),
+            position=[2.15, np.pi / 2, 0.],
+            momentum=[0., 0., 1.5],
+            backend="fortran",
+        )
+
+
+def test_mino_backend():
+    kwargs = dict(
+        metric="KerrNewman",
+        metric_params=(0.9, 0.2),
+        position=[8., np.pi / 3, 0.],
+        momentum=[0.3, 1.2, 3.1],
+        delta=0.5,
+        return_cartesian=False,
+        constraint_check="deferred",
+        suppress_warnings=True,
+    )
+    nb = Timelike(backend="numba", steps=400, order=8, **kwargs)
+    geod = Timelike(backend="mino", steps=400, **kwargs)
+    traj = geod.trajectory[1]
+
+    # Conserved exactly
+    assert_allclose(traj[:, 4], nb.momentum[0], rtol=1e-14)
+    assert_allclose(traj[:, 7], nb.momentum[3], rtol=1e-14)
+    assert geod.constraint_summary["max"] < 1e-2 * nb.constraint_summary["max"]
+    # Affine step-sizes are only approximately ``delta``
+    assert_allclose(traj[:, 1], nb.trajectory[1][:, 1], rtol=0.05)
+
+    batch = BatchGeodesic(
+        backend="mino",
+        steps=400,
+        **dict(kwargs, position=[[8., np.pi / 3, 0.]] * 2, momentum=[[0.3, 1.2, 3.1]] * 2),
+    )
+    assert batch.trajectory[1].shape == (2, 400, 8)
+    assert_allclose(batch.trajectory[1][1], traj, rtol=1e-14)
+
+    # Affine step-sizes vary in Mino time, and are averaged
+    # over the steps between stored steps
+    assert geod.step_sizes.shape == (400,)
+    assert np.ptp(geod.step_sizes) > 0
+    sparse = Timelike(backend="mino", steps=400, record_every=4, **kwargs)
+    assert_allclose(sparse.step_sizes, geod.step_sizes.reshape(-1, 4).mean(axis=1))
+    assert_allclose(nb.step_sizes, 0.5)
+
+
+def test_mino_backend_events():
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[6., np.pi / 2, 0.],
+        momentum=[-1., 0., 0.],
+        steps=500,
+        delta=0.05,
+        return_cartesian=False,
+        suppress_warnings=True,
+        backend="mino",
+    )
+
+    geod = Nulllike(horizon=True, **kwargs)
+    traj = geod.trajectory[1]
+    assert geod.termination_reason == "horizon"
+    assert traj[-1, 1] <= 1 + np.sqrt(1 - 0.9 ** 2) < traj[-2, 1]
+
+    geod = Nulllike(max_affine=1., dense_output=True, **kwargs)
+    assert geod.termination_reason == "affine"
+    assert geod.dense_output is not None
+
+    with pytest.raises(NotImplementedError):
+        BatchGeodesic(
+            **dict(kwargs, position=[[6., np.pi / 2, 0.]] * 2, momentum=[[-1., 0., 0.]] * 2),
+            time_like=False,
+            dense_output=True,
+        )
+
+
+def test_equatorial():
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[8., np.pi / 2, 0.],
+        momentum=[0., 0., 3.],
+        steps=50,
+        delta=0.5,
+        return_cartesian=False,
+        suppress_warnings=True,
+    )
+    full = Timelike(**kwargs)
+    geod = Timelike(equatorial=True, **kwargs)
+    assert_allclose(geod.trajectory[1], full.trajectory[1], rtol=1e-10, atol=1e-12)
+
+    with pytest.raises(NotImplementedError):
+        Timelike(equatorial=True, backend="numba", **kwargs)
+
+
+def test_autotune():
+    _AUTOTUNE_CACHE.clear()
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[8., np.pi / 2, 0.],
+        momentum=[0., 0., 3.],
+        steps=20,
+        return_cartesian=False,
+        suppress_warnings=True,
+    )
+    geod = Timelike(autotune=1e-4, constraint_check="deferred", **kwargs)
+    tuned = geod.tuned_settings
+    assert len(_AUTOTUNE_CACHE) == 1
+    assert tuned["drift"] <= 1e-4
+    assert geod.step_sizes[0] == tuned["delta"]
+    assert np.abs(geod.constraint_violation).max() <= 1e-4
+    assert Timelike(**kwargs).tuned_settings is None
+
+    # Tuned on the compiled backend, with the requested scheme
+    geod = Timelike(autotune=1e-4, backend="numba", scheme="kahan_li", **kwargs)
+    assert len(_AUTOTUNE_CACHE) == 2
+    key = list(_AUTOTUNE_CACHE)[-1]
+    assert key[-2:] == ("numba", (("scheme", "kahan_li"),))
+    assert geod.tuned_settings["drift"] <= 1e-4
+
+    with pytest.raises(NotImplementedError):
+        Timelike(autotune=1e-4, backend="mino", **kwargs)
+
+
+def test_step_sizes():
+    kwargs = dict(
+        metric="Schwarzschild",
+        metric_params=(),
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 4.2],
+        steps=20,
+        delta=2.,
+        suppress_warnings=True,
+    )
+
+    fixed = Timelike(**kwargs)
+    adaptive = Timelike(adaptive=True, adaptive_tol=1e-6, **kwargs)
+
+    assert_allclose(fixed.step_sizes, 2.)
+    assert adaptive.step_sizes.shape == (20,)
+    assert adaptive.trajectory[1].shape == (20, 8)
+    assert np.ptp(adaptive.step_sizes) > 0
+
+
+def test_adaptive_numba_NotImplementedError():
+    with pytest.raises(NotImplementedError):
+        Timelike(
+            metric="Kerr",
+            metric_params=(0.9,),
+            position=[2.15, np.pi / 2, 0.],
+            momentum=[0., 0., 1.5],
+            backend="numba",
+            adaptive=True,
+        )
+
+
+@pytest.mark.parametrize("backend", ["python", "numba"])
+def test_termination_events(backend):
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[6., np.pi / 2, 0.],
+        momentum=[-1., 0., 0.],
+        steps=500,
+        delta=0.05,
+        omega=0.01,
+        return_cartesian=False,
+        suppress_warnings=True,
+        backend=backend,
+    )
+
+    geod = Nulllike(horizon=True, **kwargs)
+    traj = geod.trajectory[1]
+    assert geod.termination_reason == "horizon"
+    assert traj.shape[0] < 500
+    assert traj[-1, 1] <= 1 + np.sqrt(1 - 0.9 ** 2) < traj[-2, 1]
+
+    geod = Nulllike(max_affine=1., **kwargs)
+    assert geod.termination_reason == "affine"
+    assert geod.trajectory[1].shape == (20, 8)
+
+    geod = Nulllike(stop_condition=lambda q, p: q[..., 1] < 4., **kwargs)
+    assert geod.termination_reason == "condition"
+    assert geod.trajectory[1][-1, 1] < 4. <= geod.trajectory[1][-2, 1]
+
+    geod = Nulllike(r_escape=100., **kwargs)
+    assert geod.termination_reason == "steps"
+    assert geod.trajectory[1].shape == (500, 8)
+
+
+@pytest.mark.parametrize("backend", ["python", "numba"])
+def test_batch_termination_events(backend):
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[[6., np.pi / 2, 0.], [6., np.pi / 2, 0.]],
+        momentum=[[-1., 0., 0.], [1., 0., 0.]],  # Captured & Escaping
+        steps=500,
+        delta=0.05,
+        omega=0.01,
+        time_like=False,
+        return_cartesian=False,
+        suppress_warnings=True,
+        backend=backend,
+    )
+
+    batch = BatchGeodesic(horizon=True, r_escape=15., **kwargs)
+    traj = batch.trajectory[1]
+    captured = Nulllike(horizon=True, **{
+        k: v[0] if k in ("position", "momentum") else v
+        for k, v in kwargs.items() if k != "time_like"
+    })
+    n = captured.trajectory[1].shape[0]
+
+    assert batch.termination_reason.tolist() == ["horizon", "escape"]
+    assert traj.shape[1] > n
+    assert_allclose(traj[0, :n], captured.trajectory[1], atol=1e-10, rtol=1e-10)
+    # Padding, after termination
+    assert np.isnan(traj[0, n:]).all()
+    assert traj[1, -1, 1] >= 15.
+
+
+def test_calculate_trajectory_iter():
+    kwargs = dict(
+        metric="Schwarzschild",
+        metric_params=(),
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 4.2],
+        suppress_warnings=True,
+    )
+    full = Timelike(steps=250, **kwargs)
+
+    geod = Timelike(steps=0, **kwargs)
+    assert geod.trajectory[1].shape == (0, 8)
+
+    chunks = list(geod.calculate_trajectory_iter(
+        chunk_size=100, steps=250, suppress_warnings=True
+    ))
+    steps = np.concatenate([c[0] for c in chunks])
+    traj = np.concatenate([c[1] for c in chunks])
+
+    assert [c[1].shape[0] for c in chunks] == [100, 100, 50]
+    assert_allclose(steps, full.trajectory[0])
+    assert_allclose(traj, full.trajectory[1], atol=1e-12, rtol=1e-12)
+
+
+def test_calculate_trajectory_iter_events():
+    geod = BatchGeodesic(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[[6., np.pi / 2, 0.], [6., np.pi / 2, 0.]],
+        momentum=[[-1., 0., 0.], [1., 0., 0.]],
+        time_like=False,
+        steps=0,
+    )
+    chunks = list(geod.calculate_trajectory_iter(
+        chunk_size=50, steps=500, delta=0.05, omega=0.01,
+        horizon=True, r_escape=15., suppress_warnings=True
+    ))
+
+    assert all(c[1].shape[:1] == (2,) for c in chunks)
+    assert sum(c[0].size for c in chunks) < 500
+    assert geod.termination_reason.tolist() == ["horizon", "escape"]
+
+
+def test_calculate_trajectory_iter_NotImplementedError(dummy_timegeod):
+    with pytest.raises(NotImplementedError):
+        next(dummy_timegeod.calculate_trajectory_iter(backend="numba"))
+
+
+def test_extend():
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.5,),
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 4.2],
+        suppress_warnings=True,
+    )
+    full = Timelike(steps=200, **kwargs)
+
+    geod = Timelike(steps=50, **kwargs)
+    steps, traj = geod.extend(150)
+
+    assert_allclose(steps, full.trajectory[0])
+    assert_allclose(traj, full.trajectory[1], atol=1e-12, rtol=1e-12)
+    assert geod.trajectory[1] is traj
+
+
+def test_checkpoint_from_checkpoint():
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[[6., np.pi / 2, 0.], [6., np.pi / 2, 0.]],
+        momentum=[[-1., 0., 0.], [1., 0., 0.]],
+        time_like=False,
+        delta=0.05,
+        omega=0.01,
+        horizon=True,
+        r_escape=15.,
+        suppress_warnings=True,
+    )
+    full = BatchGeodesic(steps=500, **kwargs)
+
+    batch = BatchGeodesic(steps=100, **kwargs)
+    checkpoint = json.loads(json.dumps(batch.checkpoint()))
+    resumed = BatchGeodesic.from_checkpoint(checkpoint)
+    assert resumed.trajectory[1].shape == (2, 0, 8)
+
+    steps, traj = resumed.extend(400)
+    n = traj.shape[1]
+
+    assert steps[0] == 100
+    assert resumed.termination_reason.tolist() == ["horizon", "escape"]
+    assert_allclose(
+        traj, full.trajectory[1][:, 100:100 + n], atol=1e-12, rtol=1e-12
+    )
+
+
+def test_extend_NotImplementedError():
+    geod = Timelike(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[2.15, np.pi / 2, 0.],
+        momentum=[0., 0., 1.5],
+        steps=4,
+        backend="numba",
+        suppress_warnings=True,
+    )
+
+    with pytest.raises(NotImplementedError):
+        geod.extend(4)
+    with pytest.raises(NotImplementedError):
+        geod.checkpoint()
+
+
+@pytest.mark.parametrize("backend", ["python", "numba", "mino"])
+def test_record_every(backend):
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.5,),
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 4.2],
+        steps=100,
+        backend=backend,
+        suppress_warnings=True,
+    )
+    full = Timelike(**kwargs)
+    geod = Timelike(record_every=10, **kwargs)
+    steps, traj = geod.trajectory
+
+    assert_allclose(steps, np.arange(9, 100, 10))
+    assert_allclose(traj, full.trajectory[1][9::10], atol=1e-12, rtol=1e-12)
+
+
+@pytest.mark.parametrize("backend", ["python", "numba", "mino"])
+def test_record_dt(backend):
+    geod = Timelike(
+        metric="Schwarzschild",
+        metric_params=(),
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 4.2],
+        steps=200,
+        record_dt=5.,
+        backend=backend,
+        suppress_warnings=True,
+    )
+    steps, traj = geod.trajectory
+
+    assert 0 < steps.size < 200
+    assert np.all(np.diff(traj[:, 0]) >= 5.)
+
+
+@pytest.mark.parametrize("backend", ["python", "numba"])
+def test_deferred_constraint_check(backend):
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[2.15, np.pi / 2, 0.],
+        momentum=[0., 0., 1.5],
+        steps=4,
+        delta=0.5,
+        omega=1.,  # Unstable integration
+        backend=backend,
+    )
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        step = Timelike(**kwargs)
+        n_step = len(w)
+        geod = Timelike(constraint_check="deferred", **kwargs)
+
+        # One aggregated warning, instead of one per step
+        assert n_step == 2
+        assert len(w) == n_step + 1
+
+    assert step.constraint_violation is None
+    assert geod.constraint_violation.shape == (4,)
+    assert geod.constraint_summary["n_exceeded"] == n_step
+
+
+def test_deferred_constraint_check_extend():
+    kwargs = dict(
+        metric="Schwarzschild",
+        metric_params=(),
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 3.83405],
+        delta=0.5,
+        constraint_check="deferred",
+    )
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        geod = Timelike(steps=100, **kwargs)
+        # Earlier steps are already in Cartesian Coordinates
+        geod.extend(100)
+        ref = Timelike(steps=200, **kwargs)
+
+        assert len(w) == 0
+
+    assert geod.constraint_violation.shape == (200,)
+    assert_allclose(geod.constraint_violation, ref.constraint_violation)
+    assert geod.constraint_summary == ref.constraint_summary
+
+
+def test_deferred_constraint_check_iter():
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[2.15, np.pi / 2, 0.],
+        momentum=[0., 0., 1.5],
+        delta=0.5,
+        omega=1.,  # Unstable integration
+        constraint_check="deferred",
+    )
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        ref = Timelike(steps=4, **kwargs)
+        n_ref = len(w)
+        geod = Timelike(steps=0, **kwargs)
+        chunks = geod.calculate_trajectory_iter(chunk_size=3, steps=4, **kwargs)
+        for _ in chunks:
+            # Warned once, after the last chunk
+            assert len(w) == n_ref
+
+        assert len(w) == n_ref + 1
+        assert str(w[-1].message) == str(w[n_ref - 1].message)
+
+    assert geod.constraint_violation is None
+    summary = geod.constraint_summary
+    for key in ("max", "mean", "rms"):
+        assert_allclose(summary[key], ref.constraint_summary[key], rtol=1e-12)
+    assert summary["n_exceeded"] == ref.constraint_summary["n_exceeded"]
+    assert summary["first_exceeded"] == ref.constraint_summary["first_exceeded"]
+
+
+def test_check_every():
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        Timelike(
+            metric="Kerr",
+            metric_params=(0.9,),
+            position=[2.15, np.pi / 2, 0.],
+            momentum=[0., 0., 1.5],
+            steps=4,
+            delta=0.5,
+            omega=1.,  # Unstable integration
+            check_every=4,
+        )
+
+        assert len(w) <= 1
+
+
+def _kerr_object(a):
+    M = (constant.c ** 2 / constant.G).value * u.kg  # G M / c^2 = 1 m
+    bl = BoyerLindquistDifferential(
+        t=0. * u.s,
+        r=10. * u.m,
+        theta=np.pi / 2 * u.rad,
+        phi=0. * u.rad,
+        v_r=0. * u.m / u.s,
+        v_th=0. * u.rad / u.s,
+        v_p=0. * u.rad / u.s
+    )
+
+    return Kerr(coords=bl, M=M, a=a * u.one)
+
+
+@pytest.mark.parametrize(
+    "metric",
+    [
+        _kerr_object(0.5),
+        # Inverted & differentiated numerically
+        _BaseMetricFunction(_kerr_object(0.5)),
+        # Differentiated with Automatic Differentiation
+        lambda x_vec, a: _kerr(x_vec, a),
+    ],
+)
+def test_custom_metric_matches_builtin(metric):
+    kwargs = dict(
+        position=[4., np.pi / 3, 0.],
+        momentum=[0., 0., 2.],
+        steps=20,
+        delta=0.5,
+        return_cartesian=False,
+        suppress_warnings=True,
+    )
+    ref = Nulllike(metric="Kerr", metric_params=(0.5,), **kwargs)
+    geod = Nulllike(metric=metric, metric_params=(0.5,), **kwargs)
+
+    assert_allclose(geod.momentum, ref.momentum, rtol=1e-8)
+    assert_allclose(geod.trajectory[1], ref.trajectory[1], rtol=1e-5, atol=1e-8)
+
+
+def test_custom_metric_NotImplementedError():
+    kwargs = dict(
+        metric=lambda x_vec, a: _kerr(x_vec, a),
+        metric_params=(0.5,),
+        position=[4., np.pi / 3, 0.],
+        momentum=[0., 0., 2.],
+        steps=2,
+    )
+    for backend in ("numba", "analytic", "mino"):
+        with pytest.raises(NotImplementedError):
+            Nulllike(backend=backend, **kwargs)
+    with pytest.raises(NotImplementedError):
+        Nulllike(horizon=True, **kwargs)
+    with pytest.raises(NotImplementedError):
+        Nulllike(**kwargs).checkpoint()
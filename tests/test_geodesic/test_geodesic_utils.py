@@ -1,8 +1,29 @@
 import numpy as np
 import pytest
+from astropy import units as u
 from numpy.testing import assert_allclose
 
-from einsteinpy.geodesic.utils import _P, _sch, _kerr, _kerrnewman
+from einsteinpy import constant
+from einsteinpy.coordinates import BoyerLindquistDifferential
+from einsteinpy.geodesic.utils import (
+    _TERMINATION_REASONS,
+    _P,
+    _BaseMetricFunction,
+    _kerr,
+    _kerr_dg_dr,
+    _kerr_dg_dx,
+    _kerrnewman,
+    _kerrnewman_dg_dr,
+    _kerrnewman_dg_dx,
+    _metric_function,
+    _outer_horizon,
+    _sch,
+    _sch_dg_dr,
+    _sch_dg_dx,
+    _termination,
+)
+from einsteinpy.metric import BaseMetric, Kerr
+from einsteinpy.utils.dual import _jacobian_g
 
 
 @pytest.mark.parametrize(
@@ -69,3 +90,181 @@ def test_metrics(x):
     k = _kerr(x, 0.4).astype(float)
     kn = _kerrnewman(x, 0.4, 0.).astype(float)
     assert_allclose(k, kn, atol=1e-8, rtol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "g, dg_dx, g_prms",
+    [
+        (_sch, _sch_dg_dx, ()),
+        (_kerr, _kerr_dg_dx, (0.9,)),
+        (_kerrnewman, _kerrnewman_dg_dx, (0.5, 0.3)),
+    ],
+)
+@pytest.mark.parametrize(
+    "x",
+    [
+        [0., 2.5, np.pi / 6, np.pi / 2],
+        [0., 25, np.pi / 2, 0.],
+        [0., 5.5, np.pi / 4, 0.],
+    ],
+)
+def test_closed_form_derivatives_match_AD(g, dg_dx, g_prms, x):
+    ad = np.array([_jacobian_g(g, g_prms, x, wrt) for wrt in range(4)])
+
+    assert_allclose(dg_dx(x, *g_prms), ad, atol=1e-12, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "g, dg_dr, g_prms",
+    [
+        (_sch, _sch_dg_dr, ()),
+        (_kerr, _kerr_dg_dr, (0.9,)),
+        (_kerrnewman, _kerrnewman_dg_dr, (0.5, 0.3)),
+    ],
+)
+def test_equatorial_derivatives_match_AD(g, dg_dr, g_prms):
+    x = [
+        np.zeros(2),
+        np.array([2.5, 25.]),
+        np.full(2, np.pi / 2),
+        np.array([0., 1.]),
+    ]
+    ad = np.array([_jacobian_g(g, g_prms, x, wrt) for wrt in range(4)])
+
+    assert_allclose(dg_dr(x, *g_prms), ad[1], atol=1e-12, rtol=1e-12)
+    # Other derivatives vanish in the equatorial plane
+    assert_allclose(ad[[0, 2, 3]], 0., atol=1e-12)
+
+
+def test_closed_form_derivatives_array_coords():
+    x = [
+        np.zeros(2),
+        np.array([2.5, 25.]),
+        np.array([np.pi / 6, np.pi / 2]),
+        np.zeros(2),
+    ]
+    dg = _kerr_dg_dx(x, 0.9)
+
+    assert dg.shape == (4, 4, 4, 2)
+    assert_allclose(
+        dg[..., 1], _kerr_dg_dx([0., 25., np.pi / 2, 0.], 0.9), atol=1e-12, rtol=1e-12
+    )
+
+
+def test_outer_horizon_from_metric_object():
+    a = 0.9
+    M = (constant.c ** 2 / constant.G).value * u.kg  # G M / c^2 = 1 m
+    bl = BoyerLindquistDifferential(
+        t=0. * u.s,
+        r=10. * u.m,
+        theta=np.pi / 2 * u.rad,
+        phi=0. * u.rad,
+        v_r=0. * u.m / u.s,
+        v_th=0. * u.rad / u.s,
+        v_p=0. * u.rad / u.s
+    )
+    metric = Kerr(coords=bl, M=M, a=a * u.one)
+
+    assert_allclose(_outer_horizon(metric), 1 + np.sqrt(1 - a ** 2), rtol=1e-10)
+
+
+def _kerr_object(a):
+    M = (constant.c ** 2 / constant.G).value * u.kg  # G M / c^2 = 1 m
+    bl = BoyerLindquistDifferential(
+        t=0. * u.s,
+        r=10. * u.m,
+        theta=np.pi / 2 * u.rad,
+        phi=0. * u.rad,
+        v_r=0. * u.m / u.s,
+        v_th=0. * u.rad / u.s,
+        v_p=0. * u.rad / u.s
+    )
+
+    return Kerr(coords=bl, M=M, a=a * u.one)
+
+
+def test_metric_function():
+    name, g, g_prms = _metric_function(_kerr_object(0.9), None)
+
+    assert (name, g) == ("Kerr", _kerr)
+    assert_allclose(g_prms, (0.9,))
+
+    name, g, g_prms = _metric_function(_sch, (1., 2.))
+
+    assert (name, g, g_prms) == ("_sch", _sch, (1., 2.))
+
+    with pytest.raises(NotImplementedError):
+        _metric_function("Ker", (0.9,))
+
+
+def test_BaseMetricFunction_matches_closed_form():
+    a = 0.9
+    g = _BaseMetricFunction(_kerr_object(a))
+    q = np.array([
+        [0., 4., np.pi / 3, 0.],
+        [1., 7., np.pi / 5, 1.],
+    ])
+
+    assert_allclose(g(q[0]), _kerr(q[0], a).astype(float), rtol=1e-10)
+    assert_allclose(
+        np.moveaxis(g(q.T), -1, 0),
+        [_kerr(x, a).astype(float) for x in q],
+        rtol=1e-10,
+    )
+    # From Christoffel Symbols
+    assert_allclose(g.dg_dx(q.T), _kerr_dg_dx(q.T, a), rtol=1e-10, atol=1e-14)
+
+
+def test_BaseMetricFunction_vectorized():
+    calls = list()
+
+    def sch_cov(x_vec):
+        # Covariant Schwarzschild Metric, in SI Units, with G M / c^2 = 1 m
+        calls.append(np.shape(x_vec))
+        r, th = x_vec[1], x_vec[2]
+        g = np.zeros(shape=(4, 4) + np.shape(r), dtype=float)
+        g[0, 0] = (1 - 2 / r) * constant.c.value ** 2
+        g[1, 1] = -1 / (1 - 2 / r)
+        g[2, 2] = -(r ** 2)
+        g[3, 3] = -((r * np.sin(th)) ** 2)
+        return g
+
+    M = (constant.c ** 2 / constant.G).value * u.kg
+    metric = BaseMetric(coords=_kerr_object(0.).coords, M=M, metric_cov=sch_cov)
+    g = _BaseMetricFunction(metric)
+    q = np.array([
+        [0., 4., np.pi / 3, 0.],
+        [1., 7., np.pi / 5, 1.],
+        [2., 9., np.pi / 2, 2.],
+    ])
+
+    assert_allclose(
+        np.moveaxis(g(q.T), -1, 0),
+        [_sch(x).astype(float) for x in q],
+        rtol=1e-10,
+    )
+    # From central differences
+    assert_allclose(g.dg_dx(q.T), _sch_dg_dx(q.T), rtol=1e-6, atol=1e-8)
+    # Once at all positions, and once at all displaced positions
+    assert calls == [(4, 3), (4, 24)]
+
+
+def test_termination():
+    q = np.array([
+        [0., 1.5, np.pi / 2, 0.],
+        [0., 60., np.pi / 2, 0.],
+        [0., 10., np.pi / 2, 0.],
+        [0., 10., np.pi / 2, 0.],
+        [0., np.nan, np.pi / 2, 0.],
+    ])
+    p = np.zeros_like(q)
+    lam = np.array([1., 1., 1., 5., 1.])
+
+    codes = _termination(
+        q, p, lam, r_horizon=2., r_escape=50., max_affine=5.,
+        stop_condition=lambda q, p: np.abs(q[..., 1] - 1.5) < 1e-8
+    )
+    reasons = np.asarray(_TERMINATION_REASONS)[codes]
+
+    assert reasons.tolist() == ["horizon", "escape", "steps", "affine", "horizon"]
+    assert _termination(q[2], p[2], 1.) == 0
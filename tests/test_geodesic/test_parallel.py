@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from einsteinpy.geodesic import Timelike, run_batch
+
+
+@pytest.fixture()
+def scan():
+    positions = [[40., np.pi / 2, 0.], [30., np.pi / 2, 0.], [20., np.pi / 2, 0.]]
+    momenta = [[0., 0., 4.2], [0., 0., 4.], [0., 0., 3.8]]
+    kwargs = dict(steps=50, delta=0.5, suppress_warnings=True, return_cartesian=False)
+
+    return positions, momenta, kwargs
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_run_batch(scan, n_workers):
+    positions, momenta, kwargs = scan
+    calls = list()
+
+    results, errors = run_batch(
+        "Kerr", (0.5,), positions, momenta, n_workers=n_workers, chunk_size=2,
+        progress=lambda n, N: calls.append((n, N)), **kwargs
+    )
+
+    assert not errors
+    assert sorted(calls) == [(1, 3), (3, 3)] or sorted(calls) == [(2, 3), (3, 3)]
+    for position, momentum, (steps, trajectory, reason) in zip(positions, momenta, results):
+        geod = Timelike(
+            metric="Kerr", metric_params=(0.5,), position=position, momentum=momentum, **kwargs
+        )
+        assert reason == "steps"
+        assert_allclose(steps, geod.trajectory[0])
+        assert_allclose(trajectory, geod.trajectory[1], atol=1e-12, rtol=1e-12)
+
+
+def test_run_batch_per_geodesic_params_and_failures(scan):
+    positions, momenta, kwargs = scan
+
+    results, errors = run_batch(
+        "Kerr", [(0.5,), (0.9,), ()], positions, momenta, n_workers=2, **kwargs
+    )
+
+    # Kerr metric, without a spin parameter
+    assert list(errors) == [2]
+    assert results[2] is None
+    assert results[0] is not None and results[1] is not None
+    geod = Timelike(
+        metric="Kerr", metric_params=(0.9,), position=positions[1], momentum=momenta[1], **kwargs
+    )
+    assert_allclose(results[1][1], geod.trajectory[1], atol=1e-12, rtol=1e-12)
+
+
+def test_run_batch_ValueError(scan):
+    positions, momenta, kwargs = scan
+
+    with pytest.raises(ValueError):
+        run_batch("Kerr", (0.5,), positions, momenta[:2], **kwargs)
+    with pytest.raises(ValueError):
+        run_batch("Kerr", [(0.5,), (0.9,)], positions, momenta, **kwargs)
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_run_batch_shared(scan, n_workers):
+    positions, momenta, kwargs = scan
+
+    expected, _ = run_batch("Kerr", (0.5,), positions, momenta, n_workers=1, **kwargs)
+    results, errors = run_batch(
+        "Kerr", [(0.5,), (0.5,), ()], positions, momenta,
+        n_workers=n_workers, shared=True, **kwargs
+    )
+
+    with results:
+        assert isinstance(results.array, np.ndarray)
+        assert results.array.shape == (3, 50, 8)
+        assert results.n_steps.tolist() == [50, 50, 0]
+        assert results.termination_reason[:2].tolist() == ["steps", "steps"]
+        assert list(errors) == [2]
+        for i in range(2):
+            assert_allclose(results.array[i], expected[i][1], atol=1e-12, rtol=1e-12)
+        assert np.isnan(results.array[2]).all()
+
+    assert results.array is None
+    # Closing again is harmless
+    results.close()
@@ -0,0 +1,174 @@
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from einsteinpy.geodesic import Timelike
+from einsteinpy.geodesic.utils import _kerr
+from einsteinpy.integrators import GeodesicIntegrator, autotune
+from einsteinpy.integrators.autotune import _AUTOTUNE_CACHE, orbit_class
+
+
+@pytest.fixture()
+def orbit():
+    # Bound orbit in Kerr spacetime, at r = 8
+    geod = Timelike(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[8., np.pi / 2, 0.],
+        momentum=[0., 0., 3.],
+        steps=0,
+    )
+    return geod.position, geod.momentum
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _AUTOTUNE_CACHE.clear()
+    yield
+    _AUTOTUNE_CACHE.clear()
+
+
+def test_orbit_class(orbit):
+    q0, p0 = orbit
+    assert orbit_class(q0, p0) == (("bound", 3),)
+    assert orbit_class(q0, p0 * [1.1, 1., 1., 1.]) == (("unbound", 3),)
+    assert orbit_class(q0, p0, time_like=False) == (("null", 3),)
+    # Batches, with distinct classes
+    q = np.array([q0, q0 * [1., 2., 1., 1.], q0])
+    assert orbit_class(q, np.array([p0] * 3)) == (("bound", 3), ("bound", 4))
+
+
+def test_autotune_meets_tolerance(orbit):
+    q0, p0 = orbit
+    tol = 1e-5
+    tuned = autotune(_kerr, (0.9,), q0, p0, tol, deltas=(1.0, 0.5, 0.25))
+
+    assert tuned["drift"] <= tol
+    assert tuned["order"] in (2, 4, 6, 8)
+    assert tuned["omega"] in (1.0, 0.1, 0.01)
+
+    # Chosen settings hold over the pilot span
+    geodint = GeodesicIntegrator(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=q0,
+        p0=p0,
+        steps=int(20 / tuned["delta"]),
+        delta=tuned["delta"],
+        order=tuned["order"],
+        omega=tuned["omega"],
+        suppress_warnings=True,
+    )
+    for _ in range(geodint.steps):
+        geodint.step()
+    violation = geodint.check_constraint(warn=False)[0]
+    assert_allclose(np.abs(violation).max(), tuned["drift"], rtol=1e-10)
+
+
+def test_autotune_cache(orbit):
+    q0, p0 = orbit
+    calls = list()
+
+    def counted_kerr(x_vec, *params):
+        calls.append(x_vec)
+        return _kerr(x_vec, *params)
+
+    kwargs = dict(orders=(2, 4), deltas=(1.0, 0.5), omegas=(1.0,), pilot_steps=5)
+    tuned = autotune(counted_kerr, (0.9,), q0, p0, 1e-2, **kwargs)
+    n_calls = len(calls)
+    assert n_calls > 0
+
+    # Same orbit class, at a different radius within the octave
+    q1 = q0 * [1., 1.1, 1., 1.]
+    assert autotune(counted_kerr, (0.9,), q1, p0, 1e-2, **kwargs) == tuned
+    assert len(calls) == n_calls
+
+    autotune(counted_kerr, (0.9,), q1, p0, 1e-2, cache=False, **kwargs)
+    assert len(calls) > n_calls
+
+
+def test_autotune_unreachable_tolerance(orbit):
+    q0, p0 = orbit
+    kwargs = dict(orders=(2,), deltas=(2.0,), omegas=(1.0,), pilot_steps=5)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        tuned = autotune(_kerr, (0.9,), q0, p0, 1e-14, **kwargs)
+
+        assert len(w) == 1
+        assert issubclass(w[-1].category, RuntimeWarning)
+    assert tuned["drift"] > 1e-14
+    assert not _AUTOTUNE_CACHE
+
+
+def test_autotune_ValueError(orbit):
+    q0, p0 = orbit
+    with pytest.raises(ValueError):
+        autotune(_kerr, (0.9,), q0, p0, 0.)
+    with pytest.raises(ValueError):
+        autotune(_kerr, (0.9,), q0, p0, 1e-3, pilot_steps=0)
+
+
+def test_autotune_settings_in_cache_key(orbit):
+    q0, p0 = orbit
+    calls = list()
+
+    def counted_kerr(x_vec, *params):
+        calls.append(x_vec)
+        return _kerr(x_vec, *params)
+
+    kwargs = dict(orders=(4,), deltas=(1.0, 0.5), omegas=(1.0,), pilot_steps=5)
+    autotune(counted_kerr, (0.9,), q0, p0, 1e-2, **kwargs)
+    n_calls = len(calls)
+    # Default scheme is the triple jump
+    autotune(counted_kerr, (0.9,), q0, p0, 1e-2, scheme="triple_jump", **kwargs)
+    assert len(calls) == n_calls
+
+    # Pilots are rerun, with the requested scheme
+    autotune(counted_kerr, (0.9,), q0, p0, 1e-2, scheme="kahan_li", **kwargs)
+    assert len(calls) > n_calls
+    assert len(_AUTOTUNE_CACHE) == 2
+
+
+def test_autotune_numba_backend(orbit):
+    q0, p0 = orbit
+    tol = 1e-5
+    kwargs = dict(deltas=(1.0, 0.5, 0.25), scheme="kahan_li")
+    tuned = autotune(_kerr, (0.9,), q0, p0, tol, backend="numba", **kwargs)
+    assert tuned["drift"] <= tol
+
+    # Drift of the compiled pilot matches that of the Python Integrator
+    geodint = GeodesicIntegrator(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=q0,
+        p0=p0,
+        steps=int(20 / tuned["delta"]),
+        delta=tuned["delta"],
+        order=tuned["order"],
+        omega=tuned["omega"],
+        scheme="kahan_li",
+        suppress_warnings=True,
+    )
+    for _ in range(geodint.steps):
+        geodint.step()
+    violation = geodint.check_constraint(warn=False)[0]
+    assert_allclose(np.abs(violation).max(), tuned["drift"], rtol=1e-6)
+    # Cached separately from the Python backend
+    autotune(_kerr, (0.9,), q0, p0, tol, **kwargs)
+    assert len(_AUTOTUNE_CACHE) == 2
+
+
+def test_autotune_NotImplementedError(orbit):
+    q0, p0 = orbit
+
+    def custom(x_vec, *params):
+        return _kerr(x_vec, *params)
+
+    with pytest.raises(NotImplementedError):
+        autotune(_kerr, (0.9,), q0, p0, 1e-3, backend="mino")
+    with pytest.raises(NotImplementedError):
+        autotune(_kerr, (0.9,), q0, p0, 1e-3, backend="numba", equatorial=True)
+    with pytest.raises(NotImplementedError):
+        autotune(custom, (0.9,), q0, p0, 1e-3, backend="numba")
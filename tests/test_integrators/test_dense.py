@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from einsteinpy.geodesic import BatchGeodesic, Timelike
+from einsteinpy.geodesic.utils import _sch
+from einsteinpy.integrators import DenseOutput
+
+
+@pytest.fixture()
+def kwargs():
+    return dict(
+        metric="Schwarzschild",
+        metric_params=(),
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 4.2],
+        steps=200,
+        delta=0.5,
+        return_cartesian=False,
+        suppress_warnings=True,
+    )
+
+
+@pytest.mark.parametrize("backend", ["python", "numba"])
+def test_dense_output_matches_trajectory(kwargs, backend):
+    full = Timelike(backend=backend, **kwargs)
+    geod = Timelike(record_every=10, dense_output=True, backend=backend, **kwargs)
+    dense = geod.dense_output
+
+    assert full.dense_output is None
+    assert geod.trajectory[1].shape == (20, 8)
+    assert_allclose(dense.affine[[0, -1]], [0., 100.])
+
+    lam = 0.5 * (full.trajectory[0] + 1)
+    assert_allclose(dense(lam), full.trajectory[1], rtol=1e-6, atol=1e-4)
+    assert dense(50.).shape == (8,)
+    assert np.isnan(dense([-1., 101.])).all()
+
+
+def test_dense_output_at_time(kwargs):
+    geod = Timelike(record_every=10, dense_output=True, **kwargs)
+    dense = geod.dense_output
+
+    t = np.linspace(0., geod.trajectory[1][-1, 0], 7)
+    states = dense.at_time(t)
+
+    assert states.shape == (7, 8)
+    assert_allclose(states[:, 0], t, atol=1e-10)
+
+    lam = np.linspace(0., 100., 2001)
+    assert_allclose(states, dense(np.interp(t, dense(lam)[:, 0], lam)), rtol=1e-4)
+    assert np.isnan(dense.at_time(-1.)).all()
+
+
+def test_dense_output_batch_extend():
+    geod = BatchGeodesic(
+        metric="Kerr",
+        metric_params=(0.9,),
+        position=[[6., np.pi / 2, 0.], [6., np.pi / 2, 0.]],
+        momentum=[[-1., 0., 0.], [1., 0., 0.]],
+        time_like=False,
+        steps=100,
+        delta=0.05,
+        omega=0.01,
+        horizon=True,
+        dense_output=True,
+        return_cartesian=False,
+        suppress_warnings=True,
+    )
+    geod.extend(400)
+    dense = geod.dense_output
+    steps, traj = geod.trajectory
+
+    assert dense(np.linspace(0., 5., 11)).shape == (2, 11, 8)
+    assert_allclose(dense(0.05 * (steps[:3] + 1)), traj[:, :3], rtol=1e-10)
+    # Captured geodesic has no states, beyond the horizon
+    assert np.isnan(dense(0.05 * (steps[-1] + 1))[0]).all()
+
+
+def test_dense_output_ValueError():
+    with pytest.raises(ValueError):
+        DenseOutput(_sch, (0.,), [0.], np.zeros((1, 8)))
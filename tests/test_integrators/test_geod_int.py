@@ -1,12 +1,23 @@
+import json
 import numpy as np
 import warnings
 import pytest
 from numpy.testing import assert_allclose
 
 from einsteinpy.geodesic import Geodesic
-from einsteinpy.geodesic.utils import _kerr
-from einsteinpy.integrators import GeodesicIntegrator
-from einsteinpy.integrators.utils import _Z
+from einsteinpy.geodesic.utils import _kerr, _sch, _sch_dg_dr, _sch_dg_dx
+from einsteinpy.integrators import BatchGeodesicIntegrator, GeodesicIntegrator
+from einsteinpy.integrators import register_metric_derivative
+from einsteinpy.integrators.utils import (
+    _EQUATORIAL_DERIVATIVES,
+    _METRIC_DERIVATIVES,
+    _Z,
+    _composition_weights,
+    _dg_dx,
+    _flow_mixed,
+    _metric,
+)
+from einsteinpy.utils.dual import _jacobian_g
 
 
 @pytest.mark.parametrize(
@@ -143,3 +154,572 @@ def test_higher_order_traits(order):
 
     assert_allclose(geod.trajectory[1][:, -1], L, atol=1e-4, rtol=1e-4)
     assert_allclose(geod.trajectory[1][:, 2], theta, atol=1e-6, rtol=1e-6)
+
+
+def test_batch_integrator_matches_single():
+    q0 = np.array([[0., 4., np.pi / 3, 0.], [0., 6., np.pi / 2, 0.1]])
+    p0 = np.array([[-1.2, 0., 0.767851, 2.], [-1.1, 0., 0., 3.]])
+
+    batch = BatchGeodesicIntegrator(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=q0,
+        p0=p0,
+        steps=5,
+        suppress_warnings=True,
+    )
+    for _ in range(5):
+        batch.step()
+
+    assert batch.n_geodesics == 2
+
+    for i in range(2):
+        single = GeodesicIntegrator(
+            metric=_kerr,
+            metric_params=(0.9,),
+            q0=q0[i],
+            p0=p0[i],
+            steps=5,
+            suppress_warnings=True,
+        )
+        for _ in range(5):
+            single.step()
+
+        assert_allclose(batch.results[:, i], single.results, rtol=1e-12)
+
+
+def test_batch_integrator_ValueError():
+    with pytest.raises(ValueError):
+        BatchGeodesicIntegrator(
+            metric=_kerr,
+            metric_params=(0.9,),
+            q0=[0., 4., np.pi / 3, 0.],
+            p0=[-1.2, 0., 0.767851, 2.],
+        )
+
+
+def test_register_metric_derivative():
+    calls = list()
+
+    def _custom(x_vec, *params):
+        return _kerr(x_vec, *params)
+
+    def _custom_dg_dx(x_vec, *params):
+        calls.append(x_vec)
+        return np.array([_dg_dx(_kerr, params, x_vec)[i] for i in range(4)])
+
+    q = [0., 4., np.pi / 3, 0.]
+    ad = _dg_dx(_custom, (0.9,), q)
+    assert not calls
+
+    register_metric_derivative(_custom, _custom_dg_dx)
+    try:
+        assert_allclose(_dg_dx(_custom, (0.9,), q), ad, atol=1e-12, rtol=1e-12)
+        assert len(calls) == 1
+    finally:
+        del _METRIC_DERIVATIVES[_custom]
+
+
+def test_results_storage():
+    geodint = GeodesicIntegrator(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=[0., 4., np.pi / 3, 0.],
+        p0=[-1.2, 0., 0.767851, 2.],
+        steps=3,
+        suppress_warnings=True,
+        store_shadow=True,
+    )
+
+    assert geodint.results.shape == (0, 8)
+
+    # Storage grows beyond `steps`
+    for _ in range(5):
+        geodint.step()
+
+    assert geodint.results.shape == (5, 8)
+    assert geodint.results.dtype == np.float64
+    assert geodint.results.flags["C_CONTIGUOUS"]
+    assert geodint.shadow_results.shape == (5, 8)
+    assert_allclose(geodint.results[-1, :4], geodint.res_list[0])
+    assert_allclose(geodint.results[-1, 4:], geodint.res_list[1])
+    assert_allclose(geodint.shadow_results[-1, :4], geodint.res_list[2])
+    assert_allclose(geodint.shadow_results[-1, 4:], geodint.res_list[3])
+
+
+def test_shadow_results_not_stored_by_default():
+    geodint = GeodesicIntegrator(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=[0., 4., np.pi / 3, 0.],
+        p0=[-1.2, 0., 0.767851, 2.],
+        steps=2,
+        suppress_warnings=True,
+    )
+    geodint.step()
+
+    assert geodint.shadow_results is None
+
+
+def test_adaptive_step_size_control():
+    q0 = np.array([0., 40., np.pi / 2, 0.])
+    p0 = np.array([-0.98003763, 0., 0., 4.2])
+    kwargs = dict(
+        metric=_sch, metric_params=(0.,), q0=q0, p0=p0, delta=2., suppress_warnings=True
+    )
+
+    fixed = GeodesicIntegrator(**kwargs)
+    adaptive = GeodesicIntegrator(**kwargs, adaptive=True, adaptive_tol=1e-5)
+    for _ in range(200):
+        fixed.step()
+        adaptive.step()
+
+    def max_drift(geodint):
+        q, p = geodint.results[:, :4], geodint.results[:, 4:]
+        return np.max(np.abs(geodint._hamiltonian_constraint(q, p) + 1))
+
+    assert_allclose(fixed.step_sizes, 2.)
+    assert adaptive.step_sizes.shape == (200,)
+    assert np.all(adaptive.step_sizes >= adaptive.delta_min)
+    assert np.all(adaptive.step_sizes <= adaptive.delta_max)
+    assert np.ptp(adaptive.step_sizes) > 0
+    assert max_drift(adaptive) < 1e-4
+    assert not max_drift(fixed) < 1e-4
+
+
+def test_batch_deactivate():
+    q0 = np.array([[0., 4., np.pi / 3, 0.], [0., 6., np.pi / 2, 0.]])
+    p0 = np.array([[-1.2, 0., 0.767851, 2.], [-1.1, 0., 0., 3.]])
+
+    batch = BatchGeodesicIntegrator(
+        metric=_kerr, metric_params=(0.9,), q0=q0, p0=p0, steps=4, suppress_warnings=True
+    )
+    single = GeodesicIntegrator(
+        metric=_kerr, metric_params=(0.9,), q0=q0[1], p0=p0[1], steps=4, suppress_warnings=True
+    )
+
+    batch.step()
+    batch.deactivate([True, False])
+    assert batch.active.tolist() == [1]
+    assert np.shape(batch.res_list[0]) == (1, 4)
+
+    for _ in range(3):
+        batch.step()
+    for _ in range(4):
+        single.step()
+
+    assert np.isnan(batch.results[1:, 0]).all()
+    assert np.isfinite(batch.results[0]).all()
+    assert_allclose(batch.results[:, 1], single.results, atol=1e-12, rtol=1e-12)
+
+
+def test_iter_chunks():
+    kwargs = dict(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=[0., 4., np.pi / 3, 0.],
+        p0=[-1.2, 0., 0.767851, 2.],
+        steps=10,
+        suppress_warnings=True,
+    )
+    full = GeodesicIntegrator(**kwargs)
+    for _ in range(10):
+        full.step()
+
+    streamed = GeodesicIntegrator(**dict(kwargs, steps=4))
+    chunks = list(streamed.iter_chunks(10, chunk_size=4))
+
+    assert [c.shape for c in chunks] == [(4, 8), (4, 8), (2, 8)]
+    assert_allclose(np.concatenate(chunks), full.results, atol=1e-12, rtol=1e-12)
+    # Storage does not grow beyond one chunk
+    assert streamed._results.shape[0] == 4
+    assert streamed.results.shape == (0, 8)
+    assert streamed.step_num == 10
+
+
+def test_checkpoint_resume():
+    kwargs = dict(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=[0., 4., np.pi / 3, 0.],
+        p0=[-1.2, 0., 0.767851, 2.],
+        steps=10,
+        order=4,
+        suppress_warnings=True,
+    )
+    full = GeodesicIntegrator(**kwargs)
+    for _ in range(10):
+        full.step()
+
+    first = GeodesicIntegrator(**kwargs)
+    for _ in range(4):
+        first.step()
+    checkpoint = json.loads(json.dumps(first.checkpoint()))
+
+    resumed = GeodesicIntegrator(**dict(kwargs, order=2))
+    resumed.resume(checkpoint)
+    for _ in range(6):
+        resumed.step()
+
+    assert resumed.order == 4
+    assert resumed.step_num == 10
+    assert resumed.results.shape == (6, 8)
+    assert_allclose(resumed.results, full.results[4:], atol=1e-12, rtol=1e-12)
+
+
+def test_record_every_record_dt():
+    kwargs = dict(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=[0., 4., np.pi / 3, 0.],
+        p0=[-1.2, 0., 0.767851, 2.],
+        steps=10,
+        suppress_warnings=True,
+    )
+    full = GeodesicIntegrator(**kwargs)
+    strided = GeodesicIntegrator(record_every=3, **kwargs)
+    spaced = GeodesicIntegrator(record_dt=1., **kwargs)
+    for _ in range(10):
+        full.step()
+        strided.step()
+        spaced.step()
+
+    assert_allclose(strided.step_indices, [2, 5, 8])
+    assert_allclose(strided.results, full.results[2::3], atol=1e-12, rtol=1e-12)
+    assert_allclose(strided.affine_parameters, full.affine_parameters[2::3])
+
+    t = spaced.results[:, 0]
+    assert np.all(np.diff(np.concatenate([[0.], t])) >= 1.)
+    assert_allclose(spaced.results, full.results[spaced.step_indices])
+
+
+def test_record_every_ValueError():
+    with pytest.raises(ValueError):
+        GeodesicIntegrator(
+            metric=_kerr,
+            metric_params=(0.9,),
+            q0=[0., 4., np.pi / 3, 0.],
+            p0=[-1.2, 0., 0.767851, 2.],
+            record_every=0,
+        )
+
+
+@pytest.mark.parametrize(
+    "scheme, order, stages",
+    [
+        ("triple_jump", 6, 9),
+        ("triple_jump", 8, 27),
+        ("yoshida", 6, 7),
+        ("yoshida", 8, 15),
+        ("kahan_li", 6, 9),
+        ("kahan_li", 8, 17),
+    ]
+)
+def test_composition_weights(scheme, order, stages):
+    weights = _composition_weights(order, scheme)
+
+    assert weights.size == stages
+    assert_allclose(weights.sum(), 1., atol=1e-14)
+    assert_allclose(weights, weights[::-1])
+
+
+def test_composition_scheme_NotImplementedError():
+    with pytest.raises(NotImplementedError):
+        GeodesicIntegrator(
+            metric=_kerr,
+            metric_params=(0.9,),
+            q0=[0., 4., np.pi / 3, 0.],
+            p0=[-1.2, 0., 0.767851, 2.],
+            order=6,
+            scheme="suzuki",
+        )
+
+
+def test_composition_weights_order_conditions():
+    # Odd moments of the weights vanish, up to the order of the scheme,
+    # with each level of the triple jump using its own constants
+    for scheme in ("triple_jump", "yoshida", "kahan_li"):
+        for order in (4, 6, 8):
+            weights = _composition_weights(order, scheme)
+            for k in range(3, order, 2):
+                assert_allclose((weights ** k).sum(), 0., atol=1e-10)
+
+
+@pytest.mark.parametrize("order", [6, 8])
+def test_composition_schemes_error_cost(order):
+    # Error against cost, in Order 2 substeps per step, of each scheme
+    span = 20.
+    kwargs = dict(
+        metric="Schwarzschild",
+        metric_params=(),
+        position=[10., np.pi / 2, 0.],
+        momentum=[0., 0., 3.8],
+        order=order,
+        return_cartesian=False,
+        suppress_warnings=True,
+        backend="numba",
+    )
+
+    def endpoint(scheme, delta):
+        steps = int(round(span / delta))
+        geod = Geodesic(steps=steps, delta=delta, scheme=scheme, **kwargs)
+        return geod.trajectory[1][-1]
+
+    ref = Geodesic(
+        steps=400, delta=span / 400, **dict(kwargs, order=8, scheme="kahan_li")
+    ).trajectory[1][-1]
+
+    errors = dict()
+    for scheme in ("triple_jump", "yoshida", "kahan_li"):
+        errors[scheme] = [
+            np.abs(endpoint(scheme, delta) - ref).max() for delta in (0.5, 0.25)
+        ]
+        # Observed convergence order, from halving the step-size
+        assert np.log2(errors[scheme][0] / errors[scheme][1]) > order - 1.5
+
+    cost = {s: _composition_weights(order, s).size for s in errors}
+    # Kahan & Li compositions are more accurate, at no more cost
+    assert cost["kahan_li"] <= cost["triple_jump"]
+    assert errors["kahan_li"][0] < errors["triple_jump"][0]
+    assert cost["yoshida"] < cost["triple_jump"]
+
+
+def test_composition_scheme_python_matches_numba():
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.5,),
+        position=[10., np.pi / 2, 0.],
+        momentum=[0., 0., 3.8],
+        steps=5,
+        delta=2.,
+        order=8,
+        scheme="kahan_li",
+        suppress_warnings=True,
+    )
+    python = Geodesic(backend="python", **kwargs)
+    numba = Geodesic(backend="numba", **kwargs)
+
+    assert_allclose(python.trajectory[1], numba.trajectory[1], rtol=1e-10)
+
+
+def test_ord_2_metric_calls():
+    # Unregistered metric, differentiated with Automatic Differentiation
+    calls = list()
+
+    def counted_sch(x_vec, *params):
+        calls.append(x_vec)
+        return _sch(x_vec, *params)
+
+    geodint = GeodesicIntegrator(
+        metric=counted_sch,
+        metric_params=(0.,),
+        q0=[0., 40., np.pi / 2, 0.],
+        p0=[-0.98003763, 0., 0., 4.2],
+        suppress_warnings=True,
+    )
+    geodint.step()
+
+    # 4 partial flows, each evaluating the metric on dual coordinates
+    # once per direction, which also yields the metric itself
+    assert len(calls) == 16
+
+
+def test_ord_2_matches_unfused_flows():
+    geodint = GeodesicIntegrator(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=[0., 4., np.pi / 3, 0.],
+        p0=[-1.2, 0., 0.767851, 2.],
+        omega=0.5,
+    )
+    q1 = q2 = np.array([0., 4., np.pi / 3, 0.])
+    p1 = p2 = np.array([-1.2, 0., 0.767851, 2.])
+    dl = 0.25
+
+    def flow(q, p):
+        dg = np.array([_jacobian_g(_kerr, (0.9,), q, wrt) for wrt in range(4)])
+        g = _metric(_kerr, (0.9,), q)
+        return g @ p, 0.5 * np.einsum("aij,i,j->a", dg, p, p)
+
+    # H_A, H_B, mixed, H_B, H_A, with separate metric evaluations
+    dq, dp = flow(q1, p2)
+    q2, p1 = q2 + 0.5 * dl * dq, p1 - 0.5 * dl * dp
+    dq, dp = flow(q2, p1)
+    q1, p2 = q1 + 0.5 * dl * dq, p2 - 0.5 * dl * dp
+    q1, p1, q2, p2 = _flow_mixed(q1, p1, q2, p2, dl, 0.5)
+    dq, dp = flow(q2, p1)
+    q1, p2 = q1 + 0.5 * dl * dq, p2 - 0.5 * dl * dp
+    dq, dp = flow(q1, p2)
+    q2, p1 = q2 + 0.5 * dl * dq, p1 - 0.5 * dl * dp
+
+    rl = geodint.res_list
+    fused = geodint._ord_2(rl[0], rl[1], rl[2], rl[3], dl)
+    assert_allclose(fused, [q1, p1, q2, p2], rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("cache_metric, n_calls", [(True, 40), (False, 49)])
+def test_metric_cache(cache_metric, n_calls):
+    calls = list()
+
+    def counted_sch(x_vec, *params):
+        calls.append(x_vec)
+        return _sch(x_vec, *params)
+
+    geodint = GeodesicIntegrator(
+        metric=counted_sch,
+        metric_params=(0.,),
+        q0=[0., 40., np.pi / 2, 0.],
+        p0=[-0.98003763, 0., 0., 4.2],
+        order=4,
+        rtol=1.,
+        atol=1.,
+        cache_metric=cache_metric,
+    )
+    geodint.step()
+
+    # 3 Order 2 substeps, with 4 partial flows each, and the stability check
+    # Consecutive substeps, and the check, share the position of H_A
+    assert len(calls) == n_calls
+    if cache_metric:
+        cache = geodint.metric_cache
+        assert (cache.hits, cache.misses) == (3, 10)
+        assert_allclose(cache.hit_rate, 3 / 13)
+    else:
+        assert geodint.metric_cache is None
+
+
+def test_deferred_constraint_check():
+    kwargs = dict(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=[0., 2.15, np.pi / 2, 0.],
+        p0=[-1.6, 0., 0., 1.5],
+        steps=4,
+        delta=0.5,
+        omega=1.,  # Unstable integration
+    )
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        geodint = GeodesicIntegrator(constraint_check="deferred", **kwargs)
+        for _ in range(4):
+            geodint.step()
+        assert len(w) == 0
+
+        violation, summary = geodint.check_constraint()
+        assert len(w) == 1
+        assert issubclass(w[-1].category, RuntimeWarning)
+
+    gpp = np.array([
+        geodint._hamiltonian_constraint(v[:4], v[4:]) for v in geodint.results
+    ])
+    assert violation.shape == (4,)
+    assert_allclose(violation, gpp + 1.)
+    assert_allclose(summary["max"], np.abs(violation).max())
+    assert summary["n_exceeded"] == np.sum(np.abs(violation) > 2e-2)
+    assert summary["first_exceeded"] == np.argmax(np.abs(violation) > 2e-2) + 1
+
+
+def test_check_every_ValueError():
+    with pytest.raises(ValueError):
+        GeodesicIntegrator(
+            metric=_kerr,
+            metric_params=(0.9,),
+            q0=[0., 4., np.pi / 3, 0.],
+            p0=[-1.2, 0., 0.767851, 2.],
+            check_every=0,
+        )
+    with pytest.raises(NotImplementedError):
+        GeodesicIntegrator(
+            metric=_kerr,
+            metric_params=(0.9,),
+            q0=[0., 4., np.pi / 3, 0.],
+            p0=[-1.2, 0., 0.767851, 2.],
+            constraint_check="never",
+        )
+
+
+@pytest.mark.parametrize("metric", [_kerr, lambda x, a: _kerr(x, a)])
+def test_equatorial_matches_full(metric):
+    # Closed-form derivative, and Automatic Differentiation
+    kwargs = dict(
+        metric=metric,
+        metric_params=(0.9,),
+        q0=[0., 8., np.pi / 2, 0.],
+        p0=[-0.95, 0., 0., 3.],
+        steps=20,
+        delta=0.5,
+        order=4,
+        suppress_warnings=True,
+    )
+    full = GeodesicIntegrator(**kwargs)
+    equatorial = GeodesicIntegrator(equatorial=True, **kwargs)
+    for _ in range(20):
+        full.step()
+        equatorial.step()
+
+    assert_allclose(equatorial.results, full.results, rtol=1e-10, atol=1e-12)
+    # theta and p_theta are held fixed exactly
+    assert np.all(equatorial.results[:, 2] == np.pi / 2)
+    assert np.all(equatorial.results[:, 6] == 0.)
+
+
+@pytest.mark.parametrize("registered", [False, True])
+def test_equatorial_metric_calls(registered):
+    calls, dg_calls, dr_calls = list(), list(), list()
+
+    def counted_sch(x_vec, *params):
+        calls.append(x_vec)
+        return _sch(x_vec, *params)
+
+    def counted_sch_dg_dx(x_vec, *params):
+        dg_calls.append(x_vec)
+        return _sch_dg_dx(x_vec, *params)
+
+    def counted_sch_dg_dr(x_vec, *params):
+        dr_calls.append(x_vec)
+        return _sch_dg_dr(x_vec, *params)
+
+    if registered:
+        register_metric_derivative(
+            counted_sch, counted_sch_dg_dx, equatorial=counted_sch_dg_dr
+        )
+    n_calls = dict()
+    try:
+        for equatorial in (False, True):
+            geodint = GeodesicIntegrator(
+                metric=counted_sch,
+                metric_params=(0.,),
+                q0=[0., 40., np.pi / 2, 0.],
+                p0=[-0.98003763, 0., 0., 4.2],
+                suppress_warnings=True,
+                equatorial=equatorial,
+            )
+            del calls[:], dg_calls[:], dr_calls[:]
+            geodint.step()
+            n_calls[equatorial] = (len(calls), len(dg_calls), len(dr_calls))
+    finally:
+        _METRIC_DERIVATIVES.pop(counted_sch, None)
+        _EQUATORIAL_DERIVATIVES.pop(counted_sch, None)
+
+    if registered:
+        # 4 partial flows, each evaluating the metric and its closed-form
+        # derivative once, only w.r.t. r for equatorial motion
+        assert n_calls[False] == (4, 4, 0)
+        assert n_calls[True] == (4, 0, 4)
+    else:
+        # 4 partial flows, with one dual evaluation per direction,
+        # skipping theta for equatorial motion
+        assert n_calls[False] == (16, 0, 0)
+        assert n_calls[True] == (12, 0, 0)
+
+
+def test_equatorial_ValueError():
+    with pytest.raises(ValueError):
+        GeodesicIntegrator(
+            metric=_kerr,
+            metric_params=(0.9,),
+            q0=[0., 4., np.pi / 3, 0.],
+            p0=[-1.2, 0., 0.767851, 2.],
+            equatorial=True,
+        )
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from einsteinpy.geodesic import AnalyticGeodesic
+from einsteinpy.integrators.mino import (
+    _mino_constants,
+    _mino_integrate,
+    _mino_integrate_batch,
+)
+
+
+@pytest.fixture()
+def kerr_orbit():
+    geod = AnalyticGeodesic("Kerr", (0.9,), [8., np.pi / 3, 0.], [0.3, 1.2, 3.1])
+
+    return geod, geod.position, geod.momentum
+
+
+def test_mino_constants(kerr_orbit):
+    geod, q0, p0 = kerr_orbit
+    E, L, C = _mino_constants(q0, p0, 0.9, 1.)
+
+    assert_allclose((E, L, C), (geod.energy, geod.angular_momentum, geod.carter_constant))
+
+
+def test_mino_integrate_matches_analytic(kerr_orbit):
+    geod, q0, p0 = kerr_orbit
+    results, affine = _mino_integrate(q0, p0, 0.9, 0., 1., 2000, 0.2, 10)
+
+    assert results.shape == (200, 8)
+    assert np.all(np.diff(affine) > 0)
+    # Over several radial periods
+    assert_allclose(results, geod(affine), rtol=1e-6, atol=1e-6)
+
+
+def test_mino_integrate_batch(kerr_orbit):
+    _, q0, p0 = kerr_orbit
+    q = np.array([q0, [0., 10., 1.2, 0.]])
+    p = np.array([p0, [-0.97, -0.3, 0.4, 3.4]])
+    results, affine = _mino_integrate_batch(q, p, 0.9, 0., 1., 100, 0.5, 1)
+    single, aff = _mino_integrate(q[0], p[0], 0.9, 0., 1., 100, 0.5, 1)
+
+    assert results.shape == (100, 2, 8)
+    assert affine.shape == (100, 2)
+    assert_allclose(results[:, 0], single, rtol=1e-14)
+    assert_allclose(affine[:, 0], aff, rtol=1e-14)
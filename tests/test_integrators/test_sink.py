@@ -0,0 +1,87 @@
+import json
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from einsteinpy.geodesic import Timelike
+from einsteinpy.geodesic.utils import _kerr
+from einsteinpy.integrators import GeodesicIntegrator, MemmapSink, load_trajectory
+
+
+def test_memmap_sink_grow_close(tmp_path):
+    path = tmp_path / "results.npy"
+    sink = MemmapSink(path, (2, 3, 8), metadata={"a": 1})
+
+    sink.array[:] = 1.
+    sink.grow()
+    assert sink.array.shape == (4, 3, 8)
+    sink.array[2:] = 2.
+    sink.close(3)
+
+    arr, metadata = load_trajectory(path)
+    assert arr.shape == (3, 3, 8)
+    assert arr.dtype == np.float64
+    assert not arr.flags.writeable
+    assert_allclose(arr[:2], 1.)
+    assert_allclose(arr[2], 2.)
+    assert metadata == {"a": 1, "steps": 3}
+    assert json.loads((tmp_path / "results.json").read_text()) == metadata
+    # Regular `.npy` file
+    assert_allclose(np.load(path), arr)
+
+
+def test_integrator_out(tmp_path):
+    path = tmp_path / "geod.npy"
+    kwargs = dict(
+        metric=_kerr,
+        metric_params=(0.9,),
+        q0=[0., 4., np.pi / 3, 0.],
+        p0=[-1.2, 0., 0.767851, 2.],
+        steps=2,
+        suppress_warnings=True,
+    )
+    mem = GeodesicIntegrator(**kwargs)
+    disk = GeodesicIntegrator(out=path, metadata={"note": "test"}, **kwargs)
+    # Storage grows beyond `steps`
+    for _ in range(7):
+        mem.step()
+        disk.step()
+    disk.close()
+
+    arr, metadata = load_trajectory(path)
+    assert isinstance(disk.results, np.memmap)
+    assert_allclose(disk.results, mem.results, atol=1e-12, rtol=1e-12)
+    assert_allclose(arr, mem.results, atol=1e-12, rtol=1e-12)
+    assert metadata["metric"] == "_kerr"
+    assert metadata["note"] == "test"
+    assert metadata["steps"] == 7
+    assert_allclose(metadata["q0"], kwargs["q0"])
+
+    with pytest.raises(ValueError):
+        next(GeodesicIntegrator(out=tmp_path / "x.npy", **kwargs).iter_chunks(4))
+
+
+@pytest.mark.parametrize("backend", ["python", "numba"])
+def test_geodesic_out(tmp_path, backend):
+    path = tmp_path / "geod.npy"
+    kwargs = dict(
+        metric="Kerr",
+        metric_params=(0.5,),
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 4.2],
+        steps=100,
+        return_cartesian=False,
+        suppress_warnings=True,
+        backend=backend,
+    )
+    mem = Timelike(**kwargs)
+    disk = Timelike(out=path, **kwargs)
+
+    arr, metadata = load_trajectory(path)
+    assert isinstance(disk.trajectory[1], np.memmap)
+    assert_allclose(disk.trajectory[1], mem.trajectory[1], atol=1e-12, rtol=1e-12)
+    assert_allclose(arr, mem.trajectory[1], atol=1e-12, rtol=1e-12)
+    assert metadata["metric"] == "Kerr"
+    assert metadata["metric_params"] == [0.5]
+    assert metadata["steps"] == 100
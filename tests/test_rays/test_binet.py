@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy.integrate import solve_ivp
+
+from einsteinpy.rays import BinetSolver
+
+
+@pytest.fixture()
+def impact_parameters():
+    # Captured, near-critical & weakly deflected rays
+    return np.array([1., 3., 5., 5.3, 6., 10., 50.])
+
+
+def _escape_angle(b):
+    def escape(phi, y):
+        return y[0]
+
+    escape.terminal = True
+    escape.direction = -1
+    sol = solve_ivp(
+        lambda phi, y: [y[1], 3 * y[0] ** 2 - y[0]],
+        (0., 20.),
+        [0., 1 / b],
+        events=escape,
+        rtol=1e-12,
+        atol=1e-14,
+    )
+
+    return sol.t_events[0][0]
+
+
+def test_roots_and_closest_approach(impact_parameters):
+    solver = BinetSolver(impact_parameters)
+    b = impact_parameters
+
+    assert solver.captured.tolist() == [True] * 3 + [False] * 4
+    u = solver.roots
+    scattered = ~solver.captured
+    residual = 2 * u ** 3 - u ** 2 + 1 / b[:, None] ** 2
+    assert_allclose(residual[scattered], 0., atol=1e-14)
+    r0 = solver.closest_approach[scattered]
+    assert_allclose(r0 / np.sqrt(1 - 2 / r0), b[scattered], rtol=1e-12)
+    assert np.isnan(solver.closest_approach[~scattered]).all()
+
+
+@pytest.mark.parametrize("closed_form", [False, True])
+def test_deflection_angle(impact_parameters, closed_form):
+    solver = BinetSolver(impact_parameters, closed_form=closed_form)
+    alpha = solver.deflection_angle
+    expected = [_escape_angle(b) - np.pi for b in impact_parameters[3:]]
+
+    assert np.isnan(alpha[:3]).all()
+    assert_allclose(alpha[3:], expected, rtol=1e-8)
+    # Weak deflection limit, 4 M / b
+    assert_allclose(alpha[-1], 4 / 50, rtol=0.1)
+
+
+def test_orbit_closed_form_matches_integration(impact_parameters):
+    phi = np.linspace(0., 7., 29)
+    u = BinetSolver(impact_parameters, closed_form=True).orbit(phi)
+    u_num = BinetSolver(impact_parameters).orbit(phi)
+
+    assert u.shape == (7, 29)
+    assert_allclose(u, u_num, atol=1e-8)
+    # Rays end at the horizon, or at infinity
+    assert np.all(np.isnan(u) == np.isnan(u_num))
+    assert np.nanmax(u[:3]) <= 0.5
+    assert np.nanmin(u) >= -1e-12
+
+
+def test_binet_ValueError():
+    with pytest.raises(ValueError):
+        BinetSolver([1., -2.])
+    with pytest.raises(ValueError):
+        BinetSolver(6., delta=0.)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+import sympy
+from numpy.testing import assert_allclose
+
+from einsteinpy.geodesic import Timelike
+from einsteinpy.geodesic.utils import _sch, _sch_dg_dx
+from einsteinpy.symbolic import (
+    Godel,
+    MetricTensor,
+    NumericMetric,
+    Schwarzschild,
+    compile_metric,
+)
+
+
+@pytest.fixture(params=[False, True], ids=["python", "jit"])
+def sch_numeric(request):
+    # Parameters are (c, r_s)
+    return compile_metric(Schwarzschild(), signature="+---", jit=request.param)
+
+
+def test_compile_metric(sch_numeric):
+    assert isinstance(sch_numeric, NumericMetric)
+    assert [str(v) for v in sch_numeric.variables] == ["c", "r_s"]
+
+
+def test_numeric_metric_matches_closed_form(sch_numeric):
+    q = np.array([
+        [0., 4., np.pi / 3, 0.],
+        [1., 7., np.pi / 5, 1.],
+    ])
+
+    assert_allclose(sch_numeric(q[0], 1., 2.), _sch(q[0]).astype(float), rtol=1e-12)
+    assert_allclose(
+        np.moveaxis(sch_numeric(q.T, 1., 2.), -1, 0),
+        [_sch(x).astype(float) for x in q],
+        rtol=1e-12,
+    )
+    assert_allclose(sch_numeric.dg_dx(q.T, 1., 2.), _sch_dg_dx(q.T), rtol=1e-12)
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_numeric_metric_off_diagonal(jit):
+    metric = Godel()
+    g = compile_metric(metric, jit=jit)
+    q = np.array([0.1, 0.3, -0.2, 0.5])
+    omega = 0.7
+
+    _, g_cov = metric.tensor_lambdify()
+    g_cov = np.array(g_cov(*q, omega), dtype=float)
+    assert_allclose(g(q, omega), np.linalg.inv(g_cov), rtol=1e-12)
+
+    # Central differences, w.r.t. x
+    h = 1e-6
+    dq = np.array([0., h, 0., 0.])
+    dg = (g(q + dq, omega) - g(q - dq, omega)) / (2 * h)
+    assert_allclose(g.dg_dx(q, omega)[1], dg, rtol=1e-6, atol=1e-9)
+
+
+def test_numeric_metric_geodesic(sch_numeric):
+    kwargs = dict(
+        position=[40., np.pi / 2, 0.],
+        momentum=[0., 0., 3.83405],
+        steps=50,
+        delta=0.5,
+        return_cartesian=False,
+        suppress_warnings=True,
+    )
+    ref = Timelike(metric="Schwarzschild", metric_params=(), **kwargs)
+    geod = Timelike(metric=sch_numeric, metric_params=(1., 2.), **kwargs)
+
+    assert_allclose(geod.trajectory[1], ref.trajectory[1], rtol=1e-8)
+
+
+def test_numeric_metric_ValueError():
+    syms = sympy.symbols("t x")
+    metric = MetricTensor([[-1, 0], [0, 1]], syms)
+
+    with pytest.raises(ValueError):
+        compile_metric(metric)
+    with pytest.raises(ValueError):
+        compile_metric(Godel(), signature="++++")
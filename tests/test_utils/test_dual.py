@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from einsteinpy.utils.dual import DualNumber, _deriv, _diff_g, _jacobian_g
+from einsteinpy.utils.dual import DualArray, DualNumber, _deriv, _diff_g, _jacobian_g
 from einsteinpy.geodesic.utils import _sch, _kerr, _kerrnewman
 
 
@@ -249,3 +249,84 @@ def test_ValueError2():
             indices=(2, 2),
             wrt=10,
         )
+
+
+def test_str_repr_DualArray():
+    x = DualArray(1.0, 2.0)
+
+    assert str(x) == repr(x) == "DualArray(1.0, 2.0)"
+
+
+def test_DualArray_arithmetic():
+    x = DualArray([1.0, 2.0], [2.0, 1.0])
+    y = DualArray([2.0, 3.0], [3.0, 0.0])
+    c = np.array([2.0, 4.0])
+
+    for res, expected in [
+        (x + y, ([3.0, 5.0], [5.0, 1.0])),
+        (c + x, ([3.0, 6.0], [2.0, 1.0])),
+        (x - y, ([-1.0, -1.0], [-1.0, 1.0])),
+        (c - x, ([1.0, 2.0], [-2.0, -1.0])),
+        (x * y, ([2.0, 6.0], [7.0, 3.0])),
+        (c * x, ([2.0, 8.0], [4.0, 4.0])),
+        (x / y, ([0.5, 2 / 3], [0.25, 1 / 3])),
+        (c / x, ([2.0, 2.0], [-4.0, -1.0])),
+        (x ** 2, ([1.0, 4.0], [4.0, 4.0])),
+        (-x, ([-1.0, -2.0], [-2.0, -1.0])),
+    ]:
+        assert isinstance(res, DualArray)
+        assert_allclose([res.val, res.deriv], expected, atol=1e-8, rtol=1e-8)
+
+
+def test_DualArray_ufuncs():
+    x = DualArray([1.0, 0.5], [2.0, 1.0])
+
+    for func, deriv in [
+        (np.sin, np.cos),
+        (np.cos, lambda v: -np.sin(v)),
+        (np.tan, lambda v: 1 / np.cos(v) ** 2),
+        (np.exp, np.exp),
+        (np.log, lambda v: 1 / v),
+        (np.sqrt, lambda v: 0.5 / np.sqrt(v)),
+    ]:
+        res = func(x)
+        assert isinstance(res, DualArray)
+        assert_allclose(res.val, func(x.val), atol=1e-8, rtol=1e-8)
+        assert_allclose(res.deriv, x.deriv * deriv(x.val), atol=1e-8, rtol=1e-8)
+
+    pow_ = np.power(x, 3)
+    assert_allclose(pow_.deriv, 3 * x.val ** 2 * x.deriv, atol=1e-8, rtol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "g, g_prms",
+    [(_sch, ()), (_kerr, (0.9,)), (_kerrnewman, (0.5, 0.1))],
+)
+def test_jacobian_g_matches_diff_g(g, g_prms):
+    coords = [0.0, 5.5, np.pi / 4, 0.0]
+
+    for wrt in range(4):
+        J = _jacobian_g(g, g_prms, coords, wrt)
+        expected = [
+            [_diff_g(g, g_prms, coords, (i, j), wrt) for j in range(4)]
+            for i in range(4)
+        ]
+        assert_allclose(J, expected, atol=1e-12, rtol=1e-12)
+
+
+def test_jacobian_g_array_coords():
+    coords = [
+        np.zeros(3),
+        np.array([3.0, 5.5, 9.0]),
+        np.array([1.0, np.pi / 4, 2.0]),
+        np.zeros(3),
+    ]
+    J = _jacobian_g(_kerr, (0.9,), coords, 1)
+
+    assert J.shape == (4, 4, 3)
+    assert_allclose(
+        J[..., 1],
+        _jacobian_g(_kerr, (0.9,), [0.0, 5.5, np.pi / 4, 0.0], 1),
+        atol=1e-12,
+        rtol=1e-12,
+    )